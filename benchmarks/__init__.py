@@ -0,0 +1,4 @@
+"""
+Benchmarks de rendimiento del árbol AVL y del ciclo del juego.
+Ejecutar cada módulo con: uv run python -m benchmarks.<modulo>
+"""
@@ -0,0 +1,62 @@
+"""
+Benchmark de carga masiva del árbol AVL.
+Responsabilidad: Comparar ArbolAVL.desde_lista contra inserciones repetidas con insertar.
+
+Ejecutar con: uv run python -m benchmarks.bench_carga_masiva [--tamanos 10000 100000 1000000]
+"""
+
+import argparse
+import time
+from typing import List
+
+from logic.arbol_avl import ArbolAVL
+from benchmarks.bench_mutaciones import generar_obstaculos
+
+
+def ejecutar(tamanos: List[int], semilla: int) -> None:
+    """
+    Construye árboles de cada tamaño con ambos métodos e imprime los tiempos.
+
+    Args:
+        tamanos (List[int]): Cantidades de obstáculos a cargar
+        semilla (int): Semilla para la generación de obstáculos
+    """
+    print(f"{'n':>9} | {'insertar (s)':>12} | {'desde_lista (s)':>15} | {'ordenada (s)':>12} | {'mejora':>7}")
+    print("-" * 68)
+    for n in tamanos:
+        obstaculos = generar_obstaculos(n, semilla)
+
+        inicio = time.perf_counter()
+        arbol = ArbolAVL()
+        for obstaculo in obstaculos:
+            arbol.insertar(obstaculo)
+        t_insertar = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        arbol_bloque = ArbolAVL.desde_lista(obstaculos)
+        t_bloque = time.perf_counter() - inicio
+
+        # Los circuitos generados suelen venir ya ordenados por distancia
+        ordenados = arbol_bloque.recorrido_en_profundidad()
+        inicio = time.perf_counter()
+        ArbolAVL.desde_lista(ordenados)
+        t_ordenada = time.perf_counter() - inicio
+
+        assert arbol_bloque.obtener_total_obstaculos() == arbol.obtener_total_obstaculos() == n
+        print(
+            f"{n:>9} | {t_insertar:>12.3f} | {t_bloque:>15.3f} | {t_ordenada:>12.3f} | "
+            f"{t_insertar / t_bloque:>6.1f}x"
+        )
+
+
+def main() -> None:
+    """Punto de entrada por línea de comandos."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--semilla", type=int, default=42)
+    args = parser.parse_args()
+    ejecutar(args.tamanos, args.semilla)
+
+
+if __name__ == "__main__":
+    main()
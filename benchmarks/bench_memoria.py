@@ -0,0 +1,132 @@
+"""
+Benchmark de memoria del árbol AVL.
+Responsabilidad: Medir con tracemalloc los bytes por obstáculo (obstáculo + nodo) con
+instancias basadas en __dict__ (antes), con __slots__, con ObstaculoCompacto y con
+el backend de arreglos ArbolAVLArreglos.
+
+Ejecutar con: uv run python -m benchmarks.bench_memoria [--tamanos 10000 100000 1000000]
+"""
+
+import argparse
+import gc
+import random
+import tracemalloc
+from typing import Callable, List, Optional
+
+from logic.arbol_avl import ArbolAVL
+from logic.arbol_avl_arreglos import ArbolAVLArreglos
+from logic.obstaculo import Obstaculo, ObstaculoCompacto, TipoObstaculo
+
+
+class _ObstaculoConDict:
+    """Obstáculo con los mismos atributos que Obstaculo, pero sin __slots__."""
+
+    def __init__(self, x: int, y: int, tipo: TipoObstaculo) -> None:
+        self.x = x
+        self.y = y
+        self.tipo = tipo
+        self.ancho = 30
+        self.alto = 100 if tipo == TipoObstaculo.BARRERA else 30
+
+
+class _NodoConDict:
+    """Nodo con los mismos atributos que NodoAVL, pero sin __slots__."""
+
+    def __init__(self, obstaculo: _ObstaculoConDict) -> None:
+        self.obstaculo = obstaculo
+        self.izquierdo: Optional["_NodoConDict"] = None
+        self.derecho: Optional["_NodoConDict"] = None
+        self.altura = 1
+        self.tamaño = 1
+        self.fin_maximo = obstaculo.x + obstaculo.ancho
+
+
+def _construir_con_dict(obstaculos: List[_ObstaculoConDict], inicio: int, fin: int) -> Optional[_NodoConDict]:
+    if inicio >= fin:
+        return None
+    medio = (inicio + fin) // 2
+    nodo = _NodoConDict(obstaculos[medio])
+    nodo.izquierdo = _construir_con_dict(obstaculos, inicio, medio)
+    nodo.derecho = _construir_con_dict(obstaculos, medio + 1, fin)
+    nodo.altura = (fin - inicio).bit_length()
+    nodo.tamaño = fin - inicio
+    return nodo
+
+
+def _coordenadas(cantidad: int, semilla: int) -> List[tuple]:
+    generador = random.Random(semilla)
+    tipos = list(TipoObstaculo)
+    claves = sorted(generador.sample(range(cantidad * 60), cantidad))
+    return [(clave // 6, clave % 6, generador.choice(tipos)) for clave in claves]
+
+
+def medir_bytes(construir: Callable[[], object], cantidad: int) -> float:
+    """
+    Mide la memoria retenida por la estructura construida, en bytes por obstáculo.
+
+    Args:
+        construir: Función que construye y devuelve la estructura
+        cantidad (int): Cantidad de obstáculos de la estructura
+
+    Returns:
+        float: Bytes por obstáculo
+    """
+    gc.collect()
+    tracemalloc.start()
+    inicio, _ = tracemalloc.get_traced_memory()
+    estructura = construir()
+    gc.collect()
+    actual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del estructura
+    return (actual - inicio) / cantidad
+
+
+def ejecutar(tamanos: List[int], semilla: int) -> None:
+    """
+    Imprime los bytes por obstáculo de cada representación para cada tamaño.
+
+    Args:
+        tamanos (List[int]): Cantidades de obstáculos a medir
+        semilla (int): Semilla para la generación de coordenadas
+    """
+    print(f"{'n':>9} | {'__dict__':>9} | {'__slots__':>9} | {'compacto':>9} | {'arreglos':>9} | {'ahorro':>7}")
+    print("-" * 67)
+    for n in tamanos:
+        datos = _coordenadas(n, semilla)
+
+        def con_dict():
+            obstaculos = [_ObstaculoConDict(x, y, tipo) for x, y, tipo in datos]
+            return _construir_con_dict(obstaculos, 0, len(obstaculos))
+
+        def con_slots():
+            return ArbolAVL.desde_lista(Obstaculo(x, y, tipo) for x, y, tipo in datos)
+
+        def compacto():
+            return ArbolAVL.desde_lista(ObstaculoCompacto(x, y, tipo) for x, y, tipo in datos)
+
+        def arreglos():
+            # Los obstáculos de entrada se descartan: el árbol solo guarda sus columnas
+            return ArbolAVLArreglos.desde_lista(Obstaculo(x, y, tipo) for x, y, tipo in datos)
+
+        antes = medir_bytes(con_dict, n)
+        slots = medir_bytes(con_slots, n)
+        compactos = medir_bytes(compacto, n)
+        columnas = medir_bytes(arreglos, n)
+        print(
+            f"{n:>9} | {antes:>9.1f} | {slots:>9.1f} | {compactos:>9.1f} | {columnas:>9.1f} | "
+            f"{antes / columnas:>6.2f}x"
+        )
+
+
+def main() -> None:
+    """Punto de entrada por línea de comandos."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--semilla", type=int, default=42)
+    args = parser.parse_args()
+    ejecutar(args.tamanos, args.semilla)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark de motores de índice de obstáculos.
+Responsabilidad: Comparar los motores registrados en logic.motores_indice con la mezcla
+de operaciones del juego: carga, avance de la ventana visible, colisiones, borrado de lo
+ya pasado y altas/bajas sueltas.
+
+Ejecutar con: uv run python -m benchmarks.bench_motores [--tamanos 10000 100000] [--motores avl treap]
+"""
+
+import argparse
+import math
+import random
+import time
+from typing import Dict, List
+
+from logic.motores_indice import MOTORES, obtener_motor
+from logic.obstaculo import Obstaculo, TipoObstaculo
+from benchmarks.bench_mutaciones import generar_obstaculos
+
+
+def simular_partida(nombre: str, obstaculos: List[Obstaculo], semilla: int) -> Dict[str, float]:
+    """
+    Carga los obstáculos en un motor y recorre la pista como lo hace GestorJuego.
+
+    Args:
+        nombre (str): Nombre del motor en MOTORES
+        obstaculos (List[Obstaculo]): Obstáculos de la pista
+        semilla (int): Semilla de las altas y bajas sueltas
+
+    Returns:
+        Dict[str, float]: Segundos de carga y de recorrido
+    """
+    generador = random.Random(semilla)
+    motor = obtener_motor(nombre)
+
+    inicio = time.perf_counter()
+    indice = motor.desde_lista(obstaculos)
+    t_carga = time.perf_counter() - inicio
+
+    x_final = max(o.x for o in obstaculos)
+    paso = max(1, x_final // 5000)  # ~5000 frames por pista
+    cursor = (-math.inf, -math.inf)
+    inicio = time.perf_counter()
+    for x in range(0, x_final, paso):
+        nuevos = list(indice.iterar_desde(cursor, x + 1000))
+        if nuevos:
+            cursor = (nuevos[-1].x, nuevos[-1].y)
+        indice.buscar_solapados(x, x + 30, generador.randint(0, 5))
+        indice.eliminar_hasta(x - 200)
+        if generador.random() < 0.1:
+            # Obstáculos agregados o quitados desde la pantalla de configuración
+            extra = Obstaculo(x + generador.randint(300, 3000), generador.randint(0, 5), TipoObstaculo.CONO)
+            indice.insertar(extra)
+            indice.eliminar(extra)
+    t_recorrido = time.perf_counter() - inicio
+    return {"carga": t_carga, "recorrido": t_recorrido}
+
+
+def ejecutar(tamanos: List[int], motores: List[str], semilla: int) -> None:
+    """
+    Imprime los tiempos de cada motor para cada tamaño de pista.
+
+    Args:
+        tamanos (List[int]): Cantidades de obstáculos
+        motores (List[str]): Nombres de los motores a comparar
+        semilla (int): Semilla para la generación de obstáculos
+    """
+    print(f"{'n':>9} | {'motor':>16} | {'carga (s)':>9} | {'recorrido (s)':>13}")
+    print("-" * 56)
+    for n in tamanos:
+        obstaculos = generar_obstaculos(n, semilla)
+        for nombre in motores:
+            tiempos = simular_partida(nombre, obstaculos, semilla)
+            print(f"{n:>9} | {nombre:>16} | {tiempos['carga']:>9.3f} | {tiempos['recorrido']:>13.3f}")
+
+
+def main() -> None:
+    """Punto de entrada por línea de comandos."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--motores", nargs="+", default=list(MOTORES), choices=list(MOTORES))
+    parser.add_argument("--semilla", type=int, default=42)
+    args = parser.parse_args()
+    ejecutar(args.tamanos, args.motores, args.semilla)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Benchmark de inserción y eliminación en el árbol AVL.
+Responsabilidad: Comparar el costo por operación del motor de un solo descenso
+contra el esquema anterior de búsqueda previa + descenso recursivo.
+
+Ejecutar con: uv run python -m benchmarks.bench_mutaciones [--tamanos 10000 100000 1000000]
+"""
+
+import argparse
+import random
+import time
+from typing import Callable, List, Optional
+
+from logic.arbol_avl import ArbolAVL
+from logic.nodo_avl import NodoAVL
+from logic.obstaculo import Obstaculo, TipoObstaculo
+
+
+# --- Esquema anterior (dos recorridos por mutación), reproducido como referencia ---
+
+def _insertar_recursivo(arbol: ArbolAVL, nodo: Optional[NodoAVL], obstaculo: Obstaculo) -> NodoAVL:
+    if nodo is None:
+        return NodoAVL(obstaculo)
+    if nodo.es_mayor_que(obstaculo):
+        nodo.izquierdo = _insertar_recursivo(arbol, nodo.izquierdo, obstaculo)
+    else:
+        nodo.derecho = _insertar_recursivo(arbol, nodo.derecho, obstaculo)
+    nodo.actualizar_altura()
+    return arbol.balancear(nodo)
+
+
+def _eliminar_recursivo(arbol: ArbolAVL, nodo: Optional[NodoAVL], obstaculo: Obstaculo) -> Optional[NodoAVL]:
+    if nodo is None:
+        return None
+    if nodo.es_igual_a(obstaculo):
+        if nodo.izquierdo is None:
+            return nodo.derecho
+        if nodo.derecho is None:
+            return nodo.izquierdo
+        sucesor = arbol._encontrar_minimo(nodo.derecho)
+        nodo.obstaculo = sucesor.obstaculo
+        nodo.derecho = _eliminar_recursivo(arbol, nodo.derecho, sucesor.obstaculo)
+    elif nodo.es_mayor_que(obstaculo):
+        nodo.izquierdo = _eliminar_recursivo(arbol, nodo.izquierdo, obstaculo)
+    else:
+        nodo.derecho = _eliminar_recursivo(arbol, nodo.derecho, obstaculo)
+    nodo.actualizar_altura()
+    return arbol.balancear(nodo)
+
+
+def insertar_dos_pasadas(arbol: ArbolAVL, obstaculo: Obstaculo) -> bool:
+    """Inserción previa: búsqueda de duplicado y luego descenso recursivo."""
+    if arbol._buscar_obstaculo(arbol.raiz, obstaculo) is not None:
+        return False
+    arbol.raiz = _insertar_recursivo(arbol, arbol.raiz, obstaculo)
+    arbol.total_obstaculos += 1
+    return True
+
+
+def eliminar_dos_pasadas(arbol: ArbolAVL, obstaculo: Obstaculo) -> bool:
+    """Eliminación previa: búsqueda de existencia y luego descenso recursivo."""
+    if arbol._buscar_obstaculo(arbol.raiz, obstaculo) is None:
+        return False
+    arbol.raiz = _eliminar_recursivo(arbol, arbol.raiz, obstaculo)
+    arbol.total_obstaculos -= 1
+    return True
+
+
+# --- Utilidades del benchmark ---
+
+def generar_obstaculos(cantidad: int, semilla: int) -> List[Obstaculo]:
+    """
+    Genera obstáculos con coordenadas (x, y) únicas en orden aleatorio.
+
+    Args:
+        cantidad (int): Número de obstáculos
+        semilla (int): Semilla del generador aleatorio
+
+    Returns:
+        List[Obstaculo]: Obstáculos generados
+    """
+    generador = random.Random(semilla)
+    tipos = list(TipoObstaculo)
+    claves = generador.sample(range(cantidad * 60), cantidad)
+    return [Obstaculo(clave // 6, clave % 6, generador.choice(tipos)) for clave in claves]
+
+
+def medir(operacion: Callable[[ArbolAVL, Obstaculo], bool], arbol: ArbolAVL, obstaculos: List[Obstaculo]) -> float:
+    """
+    Mide el tiempo medio por operación en microsegundos.
+
+    Args:
+        operacion: Función (arbol, obstaculo) a medir
+        arbol (ArbolAVL): Árbol sobre el que operar
+        obstaculos (List[Obstaculo]): Obstáculos a procesar
+
+    Returns:
+        float: Microsegundos por operación
+    """
+    inicio = time.perf_counter()
+    for obstaculo in obstaculos:
+        operacion(arbol, obstaculo)
+    return (time.perf_counter() - inicio) / len(obstaculos) * 1e6
+
+
+def ejecutar(tamanos: List[int], operaciones: int, semilla: int) -> None:
+    """
+    Ejecuta el benchmark para cada tamaño de árbol e imprime una tabla de resultados.
+
+    Args:
+        tamanos (List[int]): Tamaños de árbol a evaluar
+        operaciones (int): Operaciones medidas por variante y tamaño
+        semilla (int): Semilla para la generación de obstáculos
+    """
+    print(f"{'n':>9} | {'operación':<10} | {'antes (µs)':>10} | {'ahora (µs)':>10} | {'mejora':>7}")
+    print("-" * 59)
+    for n in tamanos:
+        todos = generar_obstaculos(n + operaciones, semilla)
+        base, extra = todos[:n], todos[n:]
+        duplicados = base[:operaciones]
+
+        arbol = ArbolAVL()
+        for obstaculo in base:
+            arbol.insertar(obstaculo)
+
+        casos = [
+            ("insertar", insertar_dos_pasadas, ArbolAVL.insertar, extra),
+            ("eliminar", eliminar_dos_pasadas, ArbolAVL.eliminar, extra),
+            ("duplicado", insertar_dos_pasadas, ArbolAVL.insertar, duplicados),
+            ("ausente", eliminar_dos_pasadas, ArbolAVL.eliminar, extra),
+        ]
+        for nombre, antes, ahora, lote in casos:
+            # Ambas variantes parten del mismo árbol: "insertar" deja los extra dentro
+            # y "eliminar" los vuelve a sacar, en ese orden, para cada variante.
+            if nombre == "insertar":
+                t_antes = medir(antes, arbol, lote)
+                medir(eliminar_dos_pasadas, arbol, lote)
+                t_ahora = medir(ahora, arbol, lote)
+                medir(ArbolAVL.eliminar, arbol, lote)
+            elif nombre == "eliminar":
+                medir(ArbolAVL.insertar, arbol, lote)
+                t_antes = medir(antes, arbol, lote)
+                medir(ArbolAVL.insertar, arbol, lote)
+                t_ahora = medir(ahora, arbol, lote)
+            else:
+                t_antes = medir(antes, arbol, lote)
+                t_ahora = medir(ahora, arbol, lote)
+            print(f"{n:>9} | {nombre:<10} | {t_antes:>10.2f} | {t_ahora:>10.2f} | {t_antes / t_ahora:>6.2f}x")
+
+        assert arbol.obtener_total_obstaculos() == n
+
+
+def main() -> None:
+    """Punto de entrada por línea de comandos."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--operaciones", type=int, default=10_000)
+    parser.add_argument("--semilla", type=int, default=42)
+    args = parser.parse_args()
+    ejecutar(args.tamanos, args.operaciones, args.semilla)
+
+
+if __name__ == "__main__":
+    main()
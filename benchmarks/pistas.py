@@ -0,0 +1,73 @@
+"""
+Generador de pistas sintéticas para los benchmarks.
+Responsabilidad: Crear circuitos reproducibles de cualquier tamaño con distintas
+distribuciones de obstáculos (uniforme, agrupada y con un carril cargado).
+"""
+
+import random
+from typing import Callable, Dict, List, Set, Tuple
+
+from logic.obstaculo import Obstaculo, TipoObstaculo
+
+# Píxeles de pista por obstáculo: fija la longitud del circuito según su tamaño
+ESPACIADO = 20
+CARRILES = Obstaculo.CARRIL_MAXIMO - Obstaculo.CARRIL_MINIMO + 1
+
+
+def _claves_uniformes(cantidad: int, generador: random.Random) -> Set[Tuple[int, int]]:
+    """Claves repartidas uniformemente en X y en los 6 carriles."""
+    celdas = generador.sample(range(cantidad * ESPACIADO * CARRILES), cantidad)
+    return {(celda // CARRILES, celda % CARRILES) for celda in celdas}
+
+
+def _claves_agrupadas(cantidad: int, generador: random.Random) -> Set[Tuple[int, int]]:
+    """Claves en grupos de ~50 obstáculos alrededor de centros al azar (zonas difíciles)."""
+    longitud = cantidad * ESPACIADO
+    centros = [generador.randrange(longitud) for _ in range(max(1, cantidad // 50))]
+    claves: Set[Tuple[int, int]] = set()
+    while len(claves) < cantidad:
+        x = int(generador.gauss(generador.choice(centros), 60))
+        claves.add((min(max(x, 0), longitud), generador.randrange(CARRILES)))
+    return claves
+
+
+def _claves_carril_cargado(cantidad: int, generador: random.Random) -> Set[Tuple[int, int]]:
+    """Claves uniformes en X, con el 70% de los obstáculos en el carril del carrito."""
+    longitud = cantidad * ESPACIADO
+    claves: Set[Tuple[int, int]] = set()
+    while len(claves) < cantidad:
+        carril = 2 if generador.random() < 0.7 else generador.randrange(CARRILES)
+        claves.add((generador.randrange(longitud), carril))
+    return claves
+
+
+DISTRIBUCIONES: Dict[str, Callable[[int, random.Random], Set[Tuple[int, int]]]] = {
+    "uniforme": _claves_uniformes,
+    "agrupada": _claves_agrupadas,
+    "carril_cargado": _claves_carril_cargado,
+}
+
+
+def generar_pista(cantidad: int, distribucion: str = "uniforme", semilla: int = 42) -> List[Obstaculo]:
+    """
+    Genera una pista con `cantidad` obstáculos de coordenadas únicas, en orden aleatorio.
+
+    Args:
+        cantidad (int): Número de obstáculos
+        distribucion (str): Una de las claves de DISTRIBUCIONES
+        semilla (int): Semilla del generador aleatorio
+
+    Returns:
+        List[Obstaculo]: Obstáculos de la pista
+
+    Raises:
+        ValueError: Si la distribución no existe
+    """
+    if distribucion not in DISTRIBUCIONES:
+        raise ValueError(f"Distribución desconocida: {distribucion!r} (opciones: {', '.join(DISTRIBUCIONES)})")
+
+    generador = random.Random(semilla)
+    claves = sorted(DISTRIBUCIONES[distribucion](cantidad, generador))
+    generador.shuffle(claves)
+    tipos = list(TipoObstaculo)
+    return [Obstaculo(x, y, generador.choice(tipos)) for x, y in claves]
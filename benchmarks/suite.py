@@ -0,0 +1,215 @@
+"""
+Suite de benchmarks del índice de obstáculos y del ciclo de juego.
+Responsabilidad: Medir insertar, eliminar, buscar_en_rango, los dos recorridos y una
+partida completa sin ventana (GestorJuego.actualizar hasta la meta) sobre pistas
+sintéticas, guardar los resultados en JSON y marcar regresiones contra una base.
+
+Ejecutar con: uv run python -m benchmarks.suite [--tamanos 1000 10000] [--base benchmarks/base.json]
+Para fijar una base nueva: uv run python -m benchmarks.suite --salida benchmarks/base.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List
+
+from benchmarks.pistas import DISTRIBUCIONES, ESPACIADO, generar_pista
+from logic.gestor_juego import EstadoJuego, GestorJuego
+from logic.motores_indice import MOTOR_POR_DEFECTO, MOTORES, obtener_motor
+from logic.obstaculo import Obstaculo, TipoObstaculo
+from logic.registro import silenciado
+
+
+def medir_operaciones(
+    motor: str, pista: List[Obstaculo], operaciones: int, semilla: int
+) -> Dict[str, float]:
+    """
+    Mide las operaciones del índice sobre una pista ya generada.
+
+    Args:
+        motor (str): Nombre del motor de índice
+        pista (List[Obstaculo]): Obstáculos de la pista
+        operaciones (int): Operaciones medidas por tipo
+        semilla (int): Semilla de las consultas
+
+    Returns:
+        Dict[str, float]: Tiempo por operación (µs) o por pasada completa (ms)
+    """
+    generador = random.Random(semilla)
+    clase = obtener_motor(motor)
+    resultados: Dict[str, float] = {}
+
+    inicio = time.perf_counter()
+    indice = clase.desde_lista(pista)
+    resultados["construir_ms"] = (time.perf_counter() - inicio) * 1e3
+
+    # Claves nuevas entre las existentes: carril 6 no lo usa ninguna pista
+    longitud = len(pista) * ESPACIADO
+    extra = [Obstaculo(generador.randrange(longitud), 6, TipoObstaculo.ROCA) for _ in range(operaciones)]
+    extra = list({(o.x, o.y): o for o in extra}.values())
+
+    inicio = time.perf_counter()
+    for obstaculo in extra:
+        indice.insertar(obstaculo)
+    resultados["insertar_us"] = (time.perf_counter() - inicio) / len(extra) * 1e6
+
+    inicio = time.perf_counter()
+    for obstaculo in extra:
+        indice.eliminar(obstaculo)
+    resultados["eliminar_us"] = (time.perf_counter() - inicio) / len(extra) * 1e6
+
+    consultas = [generador.randrange(longitud) for _ in range(operaciones)]
+    inicio = time.perf_counter()
+    for x in consultas:
+        indice.buscar_en_rango(x, x + 1000, 0, 5)
+    resultados["buscar_en_rango_us"] = (time.perf_counter() - inicio) / len(consultas) * 1e6
+
+    for recorrido in ("recorrido_en_anchura", "recorrido_en_profundidad"):
+        inicio = time.perf_counter()
+        getattr(indice, recorrido)()
+        resultados[f"{recorrido}_ms"] = (time.perf_counter() - inicio) * 1e3
+    return resultados
+
+
+def medir_partida(motor: str, pista: List[Obstaculo], frames: int) -> Dict[str, float]:
+    """
+    Juega una partida sin ventana hasta la meta con GestorJuego.actualizar.
+    La velocidad del carrito se ajusta para cruzar la pista en unos `frames` frames y la
+    energía es prácticamente infinita, así el carrito siempre llega a la meta. Los
+    mensajes del juego se desactivan durante la medición.
+
+    Args:
+        motor (str): Nombre del motor de índice
+        pista (List[Obstaculo]): Obstáculos de la pista
+        frames (int): Cantidad aproximada de frames de la partida
+
+    Returns:
+        Dict[str, float]: Frames jugados, duración total (s) y costo por frame (µs)
+    """
+    gestor = GestorJuego()
+    gestor.motor_arbol = motor
+    gestor.distancia_total = len(pista) * ESPACIADO
+    gestor.velocidad_carrito = max(1, gestor.distancia_total // frames)
+    gestor.energia_inicial = 10**12
+    gestor.arbol_obstaculos = obtener_motor(motor).desde_lista(pista, gestor.indice_por_carril)
+    gestor.inicializar_juego()
+
+    jugados = 0
+    with silenciado():
+        inicio = time.perf_counter()
+        while gestor.estado_actual == EstadoJuego.JUGANDO:
+            gestor.actualizar(1 / 60)
+            jugados += 1
+        duracion = time.perf_counter() - inicio
+
+    return {
+        "partida_frames": jugados,
+        "partida_s": duracion,
+        "partida_us_por_frame": duracion / jugados * 1e6,
+    }
+
+
+def ejecutar(
+    tamanos: List[int], distribuciones: List[str], motor: str, operaciones: int, frames: int, semilla: int
+) -> Dict[str, float]:
+    """
+    Ejecuta la suite completa e imprime cada medición a medida que termina.
+
+    Args:
+        tamanos (List[int]): Cantidades de obstáculos por pista
+        distribuciones (List[str]): Distribuciones de pista a medir
+        motor (str): Nombre del motor de índice
+        operaciones (int): Operaciones medidas por tipo
+        frames (int): Frames aproximados de cada partida
+        semilla (int): Semilla de pistas y consultas
+
+    Returns:
+        Dict[str, float]: Mediciones con claves "distribucion/n/medida"
+    """
+    resultados: Dict[str, float] = {}
+    for distribucion in distribuciones:
+        for n in tamanos:
+            pista = generar_pista(n, distribucion, semilla)
+            mediciones = medir_operaciones(motor, pista, operaciones, semilla)
+            mediciones.update(medir_partida(motor, pista, frames))
+            for medida, valor in mediciones.items():
+                clave = f"{distribucion}/{n}/{medida}"
+                resultados[clave] = valor
+                print(f"{clave:<52} {valor:>12.3f}")
+    return resultados
+
+
+def comparar(resultados: Dict[str, float], base: Dict[str, float], tolerancia: float) -> List[str]:
+    """
+    Busca mediciones de tiempo que empeoraron respecto a la base más allá de la tolerancia.
+
+    Args:
+        resultados (Dict[str, float]): Mediciones actuales
+        base (Dict[str, float]): Mediciones de referencia
+        tolerancia (float): Empeoramiento relativo admitido (0.25 = 25%)
+
+    Returns:
+        List[str]: Descripción de cada regresión encontrada
+    """
+    regresiones = []
+    for clave, valor in resultados.items():
+        referencia = base.get(clave)
+        # La cantidad de frames no es un tiempo: solo cambia si cambia la partida
+        if referencia is None or referencia <= 0 or clave.endswith("_frames"):
+            continue
+        if valor > referencia * (1 + tolerancia):
+            regresiones.append(f"{clave}: {referencia:.3f} -> {valor:.3f} ({valor / referencia:.2f}x)")
+    return regresiones
+
+
+def main() -> None:
+    """Punto de entrada por línea de comandos."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--distribuciones", nargs="+", default=list(DISTRIBUCIONES), choices=list(DISTRIBUCIONES))
+    parser.add_argument("--motor", default=MOTOR_POR_DEFECTO, choices=list(MOTORES))
+    parser.add_argument("--operaciones", type=int, default=2_000)
+    parser.add_argument("--frames", type=int, default=5_000)
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--salida", default="benchmarks/resultados.json")
+    parser.add_argument("--base", help="JSON de una corrida anterior contra el cual comparar")
+    parser.add_argument("--tolerancia", type=float, default=0.25)
+    args = parser.parse_args()
+
+    resultados = ejecutar(
+        args.tamanos, args.distribuciones, args.motor, args.operaciones, args.frames, args.semilla
+    )
+    documento = {
+        "metadatos": {
+            "fecha": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "motor": args.motor,
+            "semilla": args.semilla,
+            "operaciones": args.operaciones,
+            "frames": args.frames,
+        },
+        "resultados": resultados,
+    }
+    with open(args.salida, "w", encoding="utf-8") as archivo:
+        json.dump(documento, archivo, indent=2, ensure_ascii=False)
+    print(f"\nResultados guardados en {args.salida}")
+
+    if args.base:
+        with open(args.base, "r", encoding="utf-8") as archivo:
+            base = json.load(archivo)["resultados"]
+        regresiones = comparar(resultados, base, args.tolerancia)
+        if regresiones:
+            print(f"\n⚠️ {len(regresiones)} regresiones (tolerancia {args.tolerancia:.0%}):")
+            for regresion in regresiones:
+                print(f"  {regresion}")
+            sys.exit(1)
+        print(f"\n✅ Sin regresiones respecto a {args.base}")
+
+
+if __name__ == "__main__":
+    main()
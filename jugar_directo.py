@@ -7,6 +7,8 @@ import pygame
 import pgzero
 from pgzero.constants import keys
 from logic.gestor_juego import GestorJuego, EstadoJuego
+from logic.registro import obtener_registro
+from view.overlays import GestorOverlays
 from view.pantalla_juego import PantallaJuego
 
 # Configuración de pygame-zero
@@ -18,16 +20,19 @@ TITLE = "Carrito con Obstaculos Dinamicos - Modo Directo"
 import os
 os.environ['SDL_VIDEO_CENTERED'] = '1'
 
+_registro = obtener_registro("juego")
+
 # Instancias globales para pygame-zero
 gestor_juego = None
 pantalla_juego = None
+gestor_overlays = None
 
 
 def inicializar_juego():
     """
     Inicializa todos los componentes del juego y comienza directamente.
     """
-    global gestor_juego, pantalla_juego
+    global gestor_juego, pantalla_juego, gestor_overlays
 
     # Crear el gestor principal
     gestor_juego = GestorJuego()
@@ -36,13 +41,14 @@ def inicializar_juego():
     # Crear la pantalla de juego
     pantalla_juego = PantallaJuego(WIDTH, HEIGHT)
     pantalla_juego.gestor_juego = gestor_juego
+    gestor_overlays = GestorOverlays(WIDTH, HEIGHT)
 
     # Inicializar juego directamente
     gestor_juego.inicializar_juego()
     gestor_juego.cambiar_estado(EstadoJuego.JUGANDO)
 
-    print("Juego inicializado en modo directo")
-    print("¡Comienza a jugar!")
+    _registro.informar("Juego inicializado en modo directo")
+    _registro.informar("¡Comienza a jugar!")
 
 
 def draw():
@@ -53,65 +59,102 @@ def draw():
         inicializar_juego()
         return
 
-    # Limpiar pantalla
-    screen.fill((50, 50, 100))  # Azul oscuro
-
-    # Dibujar pantalla de juego
-    if gestor_juego.estado_actual in [EstadoJuego.JUGANDO, EstadoJuego.PAUSADO, EstadoJuego.JUEGO_TERMINADO]:
-        pantalla_juego.dibujar(screen)
-        
-        # Dibujar overlay de pausa si está pausado
-        if gestor_juego.estado_actual == EstadoJuego.PAUSADO:
-            s = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            s.fill((0, 0, 0, 128))  # Negro semitransparente
-            screen.blit(s, (0, 0))
-            screen.draw.text(
-                "PAUSA",
-                (WIDTH // 2 - 50, HEIGHT // 2 - 30),
-                fontsize=40,
-                color="white"
-            )
-            
-        # Dibujar overlay de fin de juego
-        if gestor_juego.estado_actual == EstadoJuego.JUEGO_TERMINADO:
-            s = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            s.fill((0, 0, 0, 180))  # Negro más oscuro semitransparente
-            screen.blit(s, (0, 0))
-            screen.draw.text(
-                "FIN DEL JUEGO",
-                (WIDTH // 2 - 100, HEIGHT // 2 - 50),
-                fontsize=40,
-                color="white"
-            )
-            
-            # Mostrar puntuación final
-            stats = gestor_juego.obtener_estadisticas()
-            screen.draw.text(
-                f"Puntuación final: {stats['puntuacion']}",
-                (WIDTH // 2 - 90, HEIGHT // 2),
-                fontsize=24,
-                color="white"
-            )
-            screen.draw.text(
-                f"Distancia recorrida: {stats['distancia_recorrida']} / {stats['distancia_total']}",
-                (WIDTH // 2 - 150, HEIGHT // 2 + 40),
-                fontsize=24,
-                color="white"
-            )
-            screen.draw.text(
-                "Presiona ESC para volver",
-                (WIDTH // 2 - 120, HEIGHT // 2 + 100),
-                fontsize=20,
-                color="yellow"
-            )
-
-    # Dibujar información de debug
+    estado = gestor_juego.estado_actual
+    if estado == EstadoJuego.JUGANDO:
+        # La pantalla de juego repinta solo lo que cambió desde el frame anterior
+        gestor_overlays.invalidar()
+        pantalla_juego.dibujar(screen, [_texto_estado()])
+        return
+
+    # Los overlays se componen una vez y se copian mientras no cambie lo que muestran:
+    # estado, textos y la vista del juego de fondo (árbol, hitboxes, perfil)
+    if estado == EstadoJuego.PAUSADO:
+        clave = (estado, pantalla_juego.firma_vista(), _texto_estado())
+        gestor_overlays.dibujar(screen, clave, _dibujar_pausa)
+    elif estado == EstadoJuego.JUEGO_TERMINADO:
+        stats = gestor_juego.obtener_estadisticas()
+        textos = (
+            f"Puntuación final: {stats['puntuacion']}",
+            f"Distancia recorrida: {stats['distancia_recorrida']} / {stats['distancia_total']}",
+        )
+        clave = (estado, pantalla_juego.firma_vista(), textos, _texto_estado())
+        gestor_overlays.dibujar(screen, clave, _dibujar_fin_juego, textos)
+    else:
+        gestor_overlays.invalidar()
+        screen.fill((50, 50, 100))  # Azul oscuro
+        _dibujar_texto_estado(screen)
+
+    # Los overlays tapan la pantalla de juego: al volver se dibuja entera
+    pantalla_juego.compositor.invalidar()
+
+
+def _dibujar_pausa(screen):
+    """
+    Compone la pantalla de pausa: el juego detenido bajo un velo.
+
+    Args:
+        screen: Pantalla de pygame-zero
+    """
+    pantalla_juego.dibujar(screen)
+    screen.blit(gestor_overlays.velo(128), (0, 0))  # Negro semitransparente
+    screen.draw.text(
+        "PAUSA",
+        (WIDTH // 2 - 50, HEIGHT // 2 - 30),
+        fontsize=40,
+        color="white"
+    )
+    _dibujar_texto_estado(screen)
+
+
+def _dibujar_fin_juego(screen, textos):
+    """
+    Compone la pantalla de fin de juego con la puntuación y la distancia finales.
+
+    Args:
+        screen: Pantalla de pygame-zero
+        textos (Tuple[str, str]): Puntuación y distancia ya formateadas
+    """
+    puntuacion, distancia = textos
+    pantalla_juego.dibujar(screen)
+    screen.blit(gestor_overlays.velo(180), (0, 0))  # Negro más oscuro semitransparente
+    screen.draw.text(
+        "FIN DEL JUEGO",
+        (WIDTH // 2 - 100, HEIGHT // 2 - 50),
+        fontsize=40,
+        color="white"
+    )
+
+    # Mostrar puntuación final
+    screen.draw.text(puntuacion, (WIDTH // 2 - 90, HEIGHT // 2), fontsize=24, color="white")
+    screen.draw.text(distancia, (WIDTH // 2 - 150, HEIGHT // 2 + 40), fontsize=24, color="white")
     screen.draw.text(
-        f"Estado: {gestor_juego.estado_actual.value}",
-        (10, 10),
+        "Presiona ESC para volver",
+        (WIDTH // 2 - 120, HEIGHT // 2 + 100),
         fontsize=20,
-        color="white",
+        color="yellow"
     )
+    _dibujar_texto_estado(screen)
+
+
+def _dibujar_texto_estado(screen):
+    """
+    Dibuja la información de debug con el estado del juego.
+
+    Args:
+        screen: Pantalla de pygame-zero
+    """
+    texto, posicion, tamaño, color = _texto_estado()
+    screen.draw.text(texto, posicion, fontsize=tamaño, color=color)
+
+
+def _texto_estado():
+    """
+    Arma el texto de depuración con el estado del juego.
+
+    Returns:
+        Tuple: (texto, posición, tamaño, color)
+    """
+    return (f"Estado: {gestor_juego.estado_actual.value}", (10, 10), 20, "white")
 
 
 def update(dt):
@@ -127,6 +170,12 @@ def update(dt):
     # Actualizar el gestor principal
     gestor_juego.actualizar(dt)
 
+    # Avanzar la animación de recorrido del árbol, si hay una en curso; en pausa
+    # queda detenida junto con el juego (y el overlay compuesto sigue valiendo)
+    jugando = gestor_juego.estado_actual == EstadoJuego.JUGANDO
+    if jugando and pantalla_juego and pantalla_juego.visualizador_arbol:
+        pantalla_juego.visualizador_arbol.avanzar_animacion(dt)
+
 
 def on_key_down(key):
     """
@@ -162,17 +211,21 @@ def on_key_down(key):
             pantalla_juego.mostrar_arbol = not pantalla_juego.mostrar_arbol
         elif key == keys.H:  # Mostrar/ocultar hitboxes
             pantalla_juego.mostrar_hitbox = not pantalla_juego.mostrar_hitbox
+        elif key == keys.F:  # Mostrar/ocultar tiempos por fase del frame
+            pantalla_juego.alternar_perfil()
         elif key == keys.B:  # Mostrar recorrido en anchura
             if pantalla_juego.visualizador_arbol and pantalla_juego.mostrar_arbol:
                 pantalla_juego.visualizador_arbol.iniciar_recorrido_anchura(gestor_juego.arbol_obstaculos)
         elif key == keys.D:  # Mostrar recorrido en profundidad
             if pantalla_juego.visualizador_arbol and pantalla_juego.mostrar_arbol:
                 pantalla_juego.visualizador_arbol.iniciar_recorrido_profundidad(gestor_juego.arbol_obstaculos)
+        else:
+            pantalla_juego.manejar_tecla_vista_arbol(key)
 
 
 if __name__ == "__main__":
     # Si se ejecuta directamente este archivo sin pgzrun
-    print("Iniciando Juego de Carrito en modo directo")
-    print("Estructura de datos: Arbol AVL")
-    print("Para ejecutar correctamente: uv run pgzrun jugar_directo.py")
+    _registro.informar("Iniciando Juego de Carrito en modo directo")
+    _registro.informar("Estructura de datos: Arbol AVL")
+    _registro.informar("Para ejecutar correctamente: uv run pgzrun jugar_directo.py")
     # Pygame Zero ejecutará las funciones draw(), update(), etc.
\ No newline at end of file
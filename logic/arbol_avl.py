@@ -3,21 +3,131 @@ Implementación del árbol AVL para gestionar obstáculos de forma eficiente.
 Responsabilidad: Mantener obstáculos ordenados y balanceados para consultas rápidas.
 """
 
+import math
+from collections import deque
+from operator import attrgetter
+from .indice_obstaculos import IndiceObstaculos, ResultadoOperacion
 from .nodo_avl import NodoAVL
 from .obstaculo import Obstaculo
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 
-class ArbolAVL:
+class ArbolAVL(IndiceObstaculos):
     """
     Árbol AVL que almacena obstáculos ordenados por coordenadas (x, y).
     Permite inserción, eliminación y búsquedas por rango eficientes.
+    Opcionalmente mantiene un índice secundario con un árbol por carril.
     """
 
-    def __init__(self) -> None:
-        """Inicializa un árbol AVL vacío."""
+    def __init__(self, indice_por_carril: bool = False) -> None:
+        """
+        Inicializa un árbol AVL vacío.
+
+        Args:
+            indice_por_carril (bool): Si True, mantiene además un ArbolAVL por carril
+                sincronizado en cada inserción y eliminación
+        """
         self.raiz: Optional[NodoAVL] = None
         self.total_obstaculos: int = 0
+        self.carriles: Optional[Dict[int, "ArbolAVL"]] = {} if indice_por_carril else None
+
+    @classmethod
+    def desde_lista(
+        cls, obstaculos: Iterable[Obstaculo], indice_por_carril: bool = False
+    ) -> "ArbolAVL":
+        """
+        Construye un árbol perfectamente balanceado a partir de una lista de obstáculos.
+        Ordena por (x, y), descarta duplicados conservando la primera aparición y arma
+        el árbol en O(n) sin rotaciones (el ordenamiento es O(n) si la lista ya viene ordenada).
+
+        Args:
+            obstaculos (Iterable[Obstaculo]): Obstáculos a cargar, en cualquier orden
+            indice_por_carril (bool): Si True, construye también el índice por carril
+
+        Returns:
+            ArbolAVL: Nuevo árbol con los obstáculos únicos
+        """
+        ordenados = sorted(obstaculos, key=attrgetter("x", "y"))
+
+        unicos: List[Obstaculo] = []
+        anterior = None
+        for obstaculo in ordenados:
+            clave = (obstaculo.x, obstaculo.y)
+            if clave != anterior:
+                unicos.append(obstaculo)
+                anterior = clave
+
+        arbol = cls(indice_por_carril)
+        arbol.raiz = arbol._construir_balanceado(unicos, 0, len(unicos))
+        arbol.total_obstaculos = len(unicos)
+        if indice_por_carril:
+            arbol.carriles = cls._construir_carriles(unicos)
+        return arbol
+
+    @classmethod
+    def _construir_carriles(cls, ordenados: List[Obstaculo]) -> Dict[int, "ArbolAVL"]:
+        """
+        Construye el índice por carril a partir de obstáculos ya ordenados y sin duplicados.
+
+        Args:
+            ordenados (List[Obstaculo]): Obstáculos en orden (x, y)
+
+        Returns:
+            Dict[int, ArbolAVL]: Un árbol balanceado por carril
+        """
+        por_carril: Dict[int, List[Obstaculo]] = {}
+        for obstaculo in ordenados:
+            por_carril.setdefault(obstaculo.y, []).append(obstaculo)
+
+        carriles = {}
+        for carril, lista in por_carril.items():
+            arbol_carril = cls()
+            arbol_carril.raiz = arbol_carril._construir_balanceado(lista, 0, len(lista))
+            arbol_carril.total_obstaculos = len(lista)
+            carriles[carril] = arbol_carril
+        return carriles
+
+    def _arbol_carril(self, carril: int) -> "ArbolAVL":
+        """
+        Obtiene (creándolo si hace falta) el árbol del índice para un carril.
+
+        Args:
+            carril (int): Carril buscado
+
+        Returns:
+            ArbolAVL: Árbol con los obstáculos de ese carril
+        """
+        arbol_carril = self.carriles.get(carril)
+        if arbol_carril is None:
+            arbol_carril = self.carriles[carril] = ArbolAVL()
+        return arbol_carril
+
+    def _construir_balanceado(
+        self, obstaculos: List[Obstaculo], inicio: int, fin: int
+    ) -> Optional[NodoAVL]:
+        """
+        Construye recursivamente un subárbol balanceado con obstaculos[inicio:fin].
+
+        Args:
+            obstaculos (List[Obstaculo]): Obstáculos ordenados y sin duplicados
+            inicio (int): Índice inicial (inclusivo)
+            fin (int): Índice final (exclusivo)
+
+        Returns:
+            Optional[NodoAVL]: Raíz del subárbol construido
+        """
+        if inicio >= fin:
+            return None
+
+        medio = (inicio + fin) // 2
+        nodo = NodoAVL(obstaculos[medio])
+        nodo.izquierdo = self._construir_balanceado(obstaculos, inicio, medio)
+        nodo.derecho = self._construir_balanceado(obstaculos, medio + 1, fin)
+        # Un subárbol perfectamente balanceado de m nodos tiene altura bit_length(m)
+        nodo.altura = (fin - inicio).bit_length()
+        nodo.tamaño = fin - inicio
+        nodo.actualizar_fin_maximo()
+        return nodo
 
     def insertar(self, obstaculo: Obstaculo) -> bool:
         """
@@ -29,43 +139,78 @@ class ArbolAVL:
         Returns:
             bool: True si se insertó correctamente, False si ya existía
         """
-        if self.raiz is None:
-            self.raiz = NodoAVL(obstaculo)
-            self.total_obstaculos += 1
-            return True
+        return self.insertar_con_resultado(obstaculo) is ResultadoOperacion.INSERTADO
 
-        # Verificar si ya existe
-        if self._buscar_obstaculo(self.raiz, obstaculo) is not None:
-            return False
+    def insertar_con_resultado(self, obstaculo: Obstaculo) -> "ResultadoOperacion":
+        """
+        Inserta un obstáculo con un único descenso desde la raíz.
+        Los duplicados se detectan durante el mismo descenso, sin búsqueda previa,
+        y el rebalanceo se hace subiendo por el camino recorrido.
 
-        self.raiz = self._insertar_recursivo(self.raiz, obstaculo)
+        Args:
+            obstaculo (Obstaculo): Obstáculo a insertar
+
+        Returns:
+            ResultadoOperacion: INSERTADO o DUPLICADO
+        """
+        x = obstaculo.x
+        y = obstaculo.y
+        camino: List[NodoAVL] = []
+        direcciones: List[bool] = []  # True = se bajó por la izquierda
+
+        nodo = self.raiz
+        while nodo is not None:
+            actual = nodo.obstaculo
+            if x == actual.x and y == actual.y:
+                return ResultadoOperacion.DUPLICADO
+            ir_izquierda = x < actual.x or (x == actual.x and y < actual.y)
+            camino.append(nodo)
+            direcciones.append(ir_izquierda)
+            nodo = nodo.izquierdo if ir_izquierda else nodo.derecho
+
+        self.raiz = self._rebalancear_camino(camino, direcciones, NodoAVL(obstaculo), 1)
         self.total_obstaculos += 1
-        return True
+        self.version += 1
+        if self.carriles is not None:
+            self._arbol_carril(y).insertar(obstaculo)
+        return ResultadoOperacion.INSERTADO
 
-    def _insertar_recursivo(
-        self, nodo: Optional[NodoAVL], obstaculo: Obstaculo
+    def _rebalancear_camino(
+        self,
+        camino: List[NodoAVL],
+        direcciones: List[bool],
+        subarbol: Optional[NodoAVL],
+        cambio_tamaño: int,
     ) -> Optional[NodoAVL]:
         """
-        Función recursiva para insertar un obstáculo.
+        Reengancha un subárbol modificado y rebalancea sus ancestros de abajo hacia arriba.
 
         Args:
-            nodo (NodoAVL): Nodo actual
-            obstaculo (Obstaculo): Obstáculo a insertar
+            camino (List[NodoAVL]): Ancestros desde la raíz hasta el padre del subárbol
+            direcciones (List[bool]): Por cada ancestro, True si el subárbol cuelga a su izquierda
+            subarbol (Optional[NodoAVL]): Nueva raíz del subárbol modificado
+            cambio_tamaño (int): Nodos agregados (+1) o quitados (-1) en el subárbol
 
         Returns:
-            NodoAVL: Nuevo nodo raíz del subárbol
+            Optional[NodoAVL]: Nueva raíz del árbol
         """
-        if nodo is None:
-            return NodoAVL(obstaculo)
-
-        if nodo.es_mayor_que(obstaculo):
-            nodo.izquierdo = self._insertar_recursivo(nodo.izquierdo, obstaculo)
-        else:
-            nodo.derecho = self._insertar_recursivo(nodo.derecho, obstaculo)
-
-        # Actualizar altura y balancear
-        nodo.actualizar_altura()
-        return self.balancear(nodo)
+        for indice in range(len(camino) - 1, -1, -1):
+            nodo = camino[indice]
+            if direcciones[indice]:
+                nodo.izquierdo = subarbol
+            else:
+                nodo.derecho = subarbol
+            altura_previa = nodo.altura
+            nodo.actualizar_altura()
+            subarbol = self.balancear(nodo)
+            # Si el subárbol no cambió de raíz ni de altura, a los ancestros
+            # solo les falta ajustar el tamaño y el fin máximo
+            if subarbol is nodo and nodo.altura == altura_previa:
+                for ancestro in range(indice - 1, -1, -1):
+                    camino[ancestro].tamaño += cambio_tamaño
+                    camino[ancestro].actualizar_fin_maximo()
+                return camino[0]
+        return subarbol
 
     def _buscar_obstaculo(
         self, nodo: Optional[NodoAVL], obstaculo: Obstaculo
@@ -114,55 +259,278 @@ class ArbolAVL:
         Returns:
             bool: True si se eliminó, False si no existía
         """
-        if self.raiz is None:
-            return False
+        return self.eliminar_con_resultado(obstaculo) is ResultadoOperacion.ELIMINADO
+
+    def eliminar_con_resultado(self, obstaculo: Obstaculo) -> "ResultadoOperacion":
+        """
+        Elimina un obstáculo con un único descenso desde la raíz.
+        Si el obstáculo no existe se detecta al llegar a una hoja, sin búsqueda previa.
 
-        # Verificar si existe
-        if self._buscar_obstaculo(self.raiz, obstaculo) is None:
-            return False
+        Args:
+            obstaculo (Obstaculo): Obstáculo a eliminar
 
-        self.raiz = self._eliminar_recursivo(self.raiz, obstaculo)
+        Returns:
+            ResultadoOperacion: ELIMINADO o AUSENTE
+        """
+        x = obstaculo.x
+        y = obstaculo.y
+        camino: List[NodoAVL] = []
+        direcciones: List[bool] = []
+
+        nodo = self.raiz
+        while nodo is not None:
+            actual = nodo.obstaculo
+            if x == actual.x and y == actual.y:
+                break
+            ir_izquierda = x < actual.x or (x == actual.x and y < actual.y)
+            camino.append(nodo)
+            direcciones.append(ir_izquierda)
+            nodo = nodo.izquierdo if ir_izquierda else nodo.derecho
+
+        if nodo is None:
+            return ResultadoOperacion.AUSENTE
+
+        if self.carriles is not None:
+            self._arbol_carril(y).eliminar(nodo.obstaculo)
+
+        if nodo.izquierdo is None:
+            reemplazo = nodo.derecho
+        elif nodo.derecho is None:
+            reemplazo = nodo.izquierdo
+        else:
+            # Dos hijos: continuar el mismo descenso hasta el sucesor in-order
+            camino.append(nodo)
+            direcciones.append(False)
+            sucesor = nodo.derecho
+            while sucesor.izquierdo is not None:
+                camino.append(sucesor)
+                direcciones.append(True)
+                sucesor = sucesor.izquierdo
+            nodo.obstaculo = sucesor.obstaculo
+            reemplazo = sucesor.derecho
+
+        self.raiz = self._rebalancear_camino(camino, direcciones, reemplazo, -1)
         self.total_obstaculos -= 1
-        return True
+        self.version += 1
+        return ResultadoOperacion.ELIMINADO
 
-    def _eliminar_recursivo(
-        self, nodo: Optional[NodoAVL], obstaculo: Obstaculo
-    ) -> Optional[NodoAVL]:
+    def dividir(self, clave: Tuple[float, float]) -> "ArbolAVL":
         """
-        Función recursiva para eliminar un obstáculo.
+        Separa del árbol todos los obstáculos con clave (x, y) menor que `clave`
+        (operación split). Trabaja en O(log n) uniendo subárboles por altura.
 
         Args:
-            nodo (NodoAVL): Nodo actual
-            obstaculo (Obstaculo): Obstáculo a eliminar
+            clave (Tuple[float, float]): Clave de corte (x, y)
+
+        Returns:
+            ArbolAVL: Nuevo árbol con los obstáculos menores; este conserva el resto
+        """
+        separado = ArbolAVL()
+        separado.raiz, self.raiz = self._dividir_recursivo(self.raiz, clave)
+        separado.total_obstaculos = self.obtener_tamaño(separado.raiz)
+        self.total_obstaculos = self.obtener_tamaño(self.raiz)
+        if separado.raiz is not None:
+            self.version += 1
+
+        if self.carriles is not None:
+            # Las claves de cada carril se ordenan igual, así que se cortan por la misma clave
+            separado.carriles = {
+                carril: arbol_carril.dividir(clave)
+                for carril, arbol_carril in self.carriles.items()
+            }
+        return separado
+
+    def _dividir_recursivo(
+        self, nodo: Optional[NodoAVL], clave: Tuple[float, float]
+    ) -> Tuple[Optional[NodoAVL], Optional[NodoAVL]]:
+        """
+        Función recursiva para dividir un subárbol por clave.
+
+        Args:
+            nodo (Optional[NodoAVL]): Raíz del subárbol a dividir
+            clave (Tuple[float, float]): Clave de corte (x, y)
 
         Returns:
-            NodoAVL: Nuevo nodo raíz del subárbol
+            Tuple: Raíces de los subárboles (claves < clave, claves >= clave)
         """
         if nodo is None:
-            return None
+            return None, None
 
-        if nodo.es_igual_a(obstaculo):
-            # Caso 1: Nodo hoja
-            if nodo.izquierdo is None and nodo.derecho is None:
-                return None
-            # Caso 2: Un solo hijo
-            elif nodo.izquierdo is None:
-                return nodo.derecho
-            elif nodo.derecho is None:
-                return nodo.izquierdo
-            # Caso 3: Dos hijos - encontrar sucesor in-order
-            else:
-                sucesor = self._encontrar_minimo(nodo.derecho)
-                nodo.obstaculo = sucesor.obstaculo
-                nodo.derecho = self._eliminar_recursivo(nodo.derecho, sucesor.obstaculo)
-        elif nodo.es_mayor_que(obstaculo):
-            nodo.izquierdo = self._eliminar_recursivo(nodo.izquierdo, obstaculo)
+        if (nodo.obstaculo.x, nodo.obstaculo.y) < clave:
+            menores, mayores = self._dividir_recursivo(nodo.derecho, clave)
+            return self._unir_con_pivote(nodo.izquierdo, nodo, menores), mayores
+
+        menores, mayores = self._dividir_recursivo(nodo.izquierdo, clave)
+        return menores, self._unir_con_pivote(mayores, nodo, nodo.derecho)
+
+    def unir(self, otro: "ArbolAVL") -> None:
+        """
+        Une otro árbol a este en O(log n) (operación join). Todas las claves de `otro`
+        deben ser mayores, o todas menores, que las de este árbol. `otro` queda vacío.
+
+        Args:
+            otro (ArbolAVL): Árbol a absorber
+
+        Raises:
+            ValueError: Si los rangos de claves de ambos árboles se solapan
+        """
+        if otro.raiz is None:
+            return
+
+        otro_va_despues = True
+        if self.raiz is not None:
+            maximo_propio = self._encontrar_maximo(self.raiz).obstaculo
+            minimo_otro = self._encontrar_minimo(otro.raiz).obstaculo
+            if (maximo_propio.x, maximo_propio.y) >= (minimo_otro.x, minimo_otro.y):
+                minimo_propio = self._encontrar_minimo(self.raiz).obstaculo
+                maximo_otro = self._encontrar_maximo(otro.raiz).obstaculo
+                if (maximo_otro.x, maximo_otro.y) >= (minimo_propio.x, minimo_propio.y):
+                    raise ValueError("Los rangos de claves de ambos árboles se solapan")
+                otro_va_despues = False
+
+        # El índice por carril se une aparte, después de mover los nodos principales
+        carriles_otro = otro.carriles
+        otro.carriles = None
+        if self.carriles is not None and carriles_otro is None:
+            carriles_otro = self._construir_carriles(otro.recorrido_en_profundidad())
+
+        if self.raiz is None:
+            self.raiz = otro.raiz
+        elif otro_va_despues:
+            otro.eliminar(minimo_otro)
+            self.raiz = self._unir_con_pivote(self.raiz, NodoAVL(minimo_otro), otro.raiz)
         else:
-            nodo.derecho = self._eliminar_recursivo(nodo.derecho, obstaculo)
+            otro.eliminar(maximo_otro)
+            self.raiz = self._unir_con_pivote(otro.raiz, NodoAVL(maximo_otro), self.raiz)
+        self.total_obstaculos = self.obtener_tamaño(self.raiz)
+        self.version += 1
+        otro.limpiar()
 
-        # Actualizar altura y balancear
-        nodo.actualizar_altura()
-        return self.balancear(nodo)
+        if self.carriles is not None:
+            for carril, arbol_carril in carriles_otro.items():
+                self._arbol_carril(carril).unir(arbol_carril)
+
+    def _unir_con_pivote(
+        self, izquierdo: Optional[NodoAVL], pivote: NodoAVL, derecho: Optional[NodoAVL]
+    ) -> NodoAVL:
+        """
+        Une dos subárboles AVL y un nodo pivote cuya clave queda entre ambos.
+        Desciende por el lado más alto hasta igualar alturas y rebalancea al volver.
+
+        Args:
+            izquierdo (Optional[NodoAVL]): Subárbol con claves menores al pivote
+            pivote (NodoAVL): Nodo que quedará entre ambos subárboles
+            derecho (Optional[NodoAVL]): Subárbol con claves mayores al pivote
+
+        Returns:
+            NodoAVL: Raíz del subárbol resultante
+        """
+        altura_izq = self.obtener_altura(izquierdo)
+        altura_der = self.obtener_altura(derecho)
+
+        if altura_izq > altura_der + 1:
+            izquierdo.derecho = self._unir_con_pivote(izquierdo.derecho, pivote, derecho)
+            izquierdo.actualizar_altura()
+            return self.balancear(izquierdo)
+
+        if altura_der > altura_izq + 1:
+            derecho.izquierdo = self._unir_con_pivote(izquierdo, pivote, derecho.izquierdo)
+            derecho.actualizar_altura()
+            return self.balancear(derecho)
+
+        pivote.izquierdo = izquierdo
+        pivote.derecho = derecho
+        pivote.actualizar_altura()
+        return pivote
+
+    def eliminar_hasta(self, x: float) -> "ArbolAVL":
+        """
+        Elimina de una vez todos los obstáculos con coordenada X menor o igual a `x`.
+        Reemplaza el ciclo de búsqueda + eliminación uno a uno por una sola división.
+
+        Args:
+            x (float): Límite X (inclusivo) de los obstáculos a eliminar
+
+        Returns:
+            ArbolAVL: Árbol separado con los obstáculos eliminados
+        """
+        return self.dividir((x, math.inf))
+
+    def _encontrar_maximo(self, nodo: NodoAVL) -> NodoAVL:
+        """
+        Encuentra el nodo con el valor máximo en un subárbol.
+
+        Args:
+            nodo (NodoAVL): Nodo raíz del subárbol
+
+        Returns:
+            NodoAVL: Nodo con el valor máximo
+        """
+        while nodo.derecho is not None:
+            nodo = nodo.derecho
+        return nodo
+
+    def rango(self, obstaculo: Obstaculo) -> int:
+        """
+        Obtiene la posición en orden (x, y) que ocupa, u ocuparía, un obstáculo:
+        la cantidad de obstáculos del árbol con clave menor. O(log n).
+
+        Args:
+            obstaculo (Obstaculo): Obstáculo de referencia (no necesita estar en el árbol)
+
+        Returns:
+            int: Cantidad de obstáculos con clave menor
+        """
+        return self._contar_menores((obstaculo.x, obstaculo.y))
+
+    def _contar_menores(self, clave: Tuple[float, float]) -> int:
+        """
+        Cuenta los obstáculos con clave (x, y) estrictamente menor que `clave`.
+
+        Args:
+            clave (Tuple[float, float]): Clave de referencia
+
+        Returns:
+            int: Cantidad de obstáculos menores
+        """
+        x, y = clave
+        total = 0
+        nodo = self.raiz
+        while nodo is not None:
+            actual = nodo.obstaculo
+            if actual.x < x or (actual.x == x and actual.y < y):
+                total += 1 + (nodo.izquierdo.tamaño if nodo.izquierdo else 0)
+                nodo = nodo.derecho
+            else:
+                nodo = nodo.izquierdo
+        return total
+
+    def seleccionar(self, k: int) -> Obstaculo:
+        """
+        Obtiene el k-ésimo obstáculo (desde 0) en orden (x, y). O(log n).
+
+        Args:
+            k (int): Posición buscada
+
+        Returns:
+            Obstaculo: Obstáculo en la posición k
+
+        Raises:
+            IndexError: Si k está fuera de rango
+        """
+        if not 0 <= k < self.obtener_tamaño(self.raiz):
+            raise IndexError(f"Posición {k} fuera de rango")
+
+        nodo = self.raiz
+        while True:
+            tamaño_izq = nodo.izquierdo.tamaño if nodo.izquierdo else 0
+            if k < tamaño_izq:
+                nodo = nodo.izquierdo
+            elif k == tamaño_izq:
+                return nodo.obstaculo
+            else:
+                k -= tamaño_izq + 1
+                nodo = nodo.derecho
 
     def buscar_en_rango(
         self, x_min: int, x_max: int, y_min: int, y_max: int
@@ -178,53 +546,184 @@ class ArbolAVL:
             y_max (int): Límite superior Y
 
         Returns:
-            List[Obstaculo]: Lista de obstáculos en el rango
+            List[Obstaculo]: Lista de obstáculos en el rango, ordenados por (x, y)
         """
-        resultado = []
-        self._buscar_rango_recursivo(self.raiz, x_min, x_max, y_min, y_max, resultado)
-        return resultado
+        return list(self.iterar_rango(x_min, x_max, y_min, y_max))
 
-    def _buscar_rango_recursivo(
-        self,
-        nodo: Optional[NodoAVL],
-        x_min: int,
-        x_max: int,
-        y_min: int,
-        y_max: int,
-        resultado: List[Obstaculo],
-    ) -> None:
+    def iterar_rango(
+        self, x_min: float, x_max: float, y_min: int, y_max: int
+    ) -> Iterator[Obstaculo]:
         """
-        Función recursiva para búsqueda por rango.
+        Recorre en orden (x, y) los obstáculos dentro del rango, sin recursión ni listas
+        intermedias. Usa una pila explícita, descarta los subárboles que quedan antes de
+        x_min y termina al pasar x_max, así que el llamador puede detenerse cuando quiera.
 
         Args:
-            nodo (NodoAVL): Nodo actual
-            x_min, x_max, y_min, y_max: Límites del rango
-            resultado (List[Obstaculo]): Lista donde acumular resultados
+            x_min (float): Límite inferior X
+            x_max (float): Límite superior X
+            y_min (int): Límite inferior Y (carril)
+            y_max (int): Límite superior Y (carril)
+
+        Yields:
+            Obstaculo: Obstáculos dentro del rango
+        """
+        pila: List[NodoAVL] = []
+        nodo = self.raiz
+        while True:
+            while nodo is not None:
+                if nodo.obstaculo.x < x_min:
+                    # El nodo y todo su subárbol izquierdo quedan antes del rango
+                    nodo = nodo.derecho
+                else:
+                    pila.append(nodo)
+                    nodo = nodo.izquierdo
+
+            if not pila:
+                return
+
+            nodo = pila.pop()
+            obstaculo = nodo.obstaculo
+            if obstaculo.x > x_max:
+                return
+            if y_min <= obstaculo.y <= y_max:
+                yield obstaculo
+            nodo = nodo.derecho
+
+    def iterar_desde(self, clave: Tuple[float, float], x_max: float) -> Iterator[Obstaculo]:
+        """
+        Recorre en orden los obstáculos con clave (x, y) estrictamente mayor que `clave`
+        y coordenada X menor o igual a x_max. Sirve para continuar un recorrido en
+        orden a partir del último obstáculo visto.
+
+        Args:
+            clave (Tuple[float, float]): Clave a partir de la cual continuar (exclusiva)
+            x_max (float): Límite superior X
+
+        Yields:
+            Obstaculo: Obstáculos siguientes a la clave dentro del límite
+        """
+        x, y = clave
+        pila: List[NodoAVL] = []
+        nodo = self.raiz
+        while True:
+            while nodo is not None:
+                actual = nodo.obstaculo
+                if actual.x < x or (actual.x == x and actual.y <= y):
+                    nodo = nodo.derecho
+                else:
+                    pila.append(nodo)
+                    nodo = nodo.izquierdo
+
+            if not pila:
+                return
+
+            nodo = pila.pop()
+            if nodo.obstaculo.x > x_max:
+                return
+            yield nodo.obstaculo
+            nodo = nodo.derecho
+
+    def iterar_carril(self, carril: int, x_min: float, x_max: float) -> Iterator[Obstaculo]:
+        """
+        Recorre en orden los obstáculos de un solo carril con X en [x_min, x_max].
+        Con índice por carril no visita los obstáculos de los demás carriles.
+
+        Args:
+            carril (int): Carril a consultar
+            x_min (float): Límite inferior X
+            x_max (float): Límite superior X
+
+        Returns:
+            Iterator[Obstaculo]: Obstáculos del carril dentro del rango
         """
-        if nodo is None:
-            return
+        if self.carriles is None:
+            return self.iterar_rango(x_min, x_max, carril, carril)
+        arbol_carril = self.carriles.get(carril)
+        if arbol_carril is None:
+            return iter(())
+        return arbol_carril.iterar_rango(x_min, x_max, carril, carril)
 
-        obstaculo = nodo.obstaculo
+    def siguiente_en_carril(self, carril: int, x: float) -> Optional[Obstaculo]:
+        """
+        Obtiene el primer obstáculo de un carril con coordenada X mayor o igual a `x`.
 
-        # Verificar si el obstáculo está en el rango
-        if obstaculo.esta_en_rango(x_min, x_max, y_min, y_max):
-            resultado.append(obstaculo)
+        Args:
+            carril (int): Carril a consultar
+            x (float): Posición desde la que buscar
 
-        # Decidir qué subárboles explorar basándose en la posición del nodo
-        if (
-            obstaculo.x >= x_min
-        ):  # Puede haber obstáculos en el rango en el subárbol izquierdo
-            self._buscar_rango_recursivo(
-                nodo.izquierdo, x_min, x_max, y_min, y_max, resultado
-            )
+        Returns:
+            Optional[Obstaculo]: Próximo obstáculo del carril, None si no hay
+        """
+        return next(self.iterar_carril(carril, x, math.inf), None)
 
-        if (
-            obstaculo.x <= x_max
-        ):  # Puede haber obstáculos en el rango en el subárbol derecho
-            self._buscar_rango_recursivo(
-                nodo.derecho, x_min, x_max, y_min, y_max, resultado
+    def buscar_solapados(
+        self, x_ini: float, x_fin: float, carril: Optional[int] = None
+    ) -> List[Obstaculo]:
+        """
+        Busca los obstáculos cuyo intervalo [x, x + ancho) se solapa con [x_ini, x_fin).
+        Descarta los subárboles cuyo fin máximo no llega a x_ini y se detiene en el primer
+        obstáculo que empieza en x_fin o después: O(log n + resultados).
+
+        Args:
+            x_ini (float): Inicio del intervalo consultado
+            x_fin (float): Fin (exclusivo) del intervalo consultado
+            carril (Optional[int]): Si se indica, solo obstáculos de ese carril
+
+        Returns:
+            List[Obstaculo]: Obstáculos solapados, ordenados por (x, y)
+        """
+        if carril is not None and self.carriles is not None:
+            arbol_carril = self.carriles.get(carril)
+            return arbol_carril.buscar_solapados(x_ini, x_fin) if arbol_carril else []
+
+        resultado: List[Obstaculo] = []
+        pila: List[NodoAVL] = []
+        nodo = self.raiz
+        while True:
+            while nodo is not None and nodo.fin_maximo > x_ini:
+                pila.append(nodo)
+                nodo = nodo.izquierdo
+
+            if not pila:
+                return resultado
+
+            nodo = pila.pop()
+            obstaculo = nodo.obstaculo
+            if obstaculo.x >= x_fin:
+                return resultado
+            if obstaculo.x + obstaculo.ancho > x_ini and (carril is None or obstaculo.y == carril):
+                resultado.append(obstaculo)
+            nodo = nodo.derecho
+
+    def contar_en_rango(
+        self, x_min: float, x_max: float, y_min: int, y_max: int
+    ) -> int:
+        """
+        Cuenta los obstáculos dentro del rango sin construir la lista de resultados.
+        Si el rango cubre todos los carriles se resuelve en O(log n) con los tamaños
+        de subárbol; si no, recorre solo el rango.
+
+        Args:
+            x_min (float): Límite inferior X
+            x_max (float): Límite superior X
+            y_min (int): Límite inferior Y (carril)
+            y_max (int): Límite superior Y (carril)
+
+        Returns:
+            int: Cantidad de obstáculos en el rango
+        """
+        if y_min <= Obstaculo.CARRIL_MINIMO and y_max >= Obstaculo.CARRIL_MAXIMO:
+            if x_min > x_max:
+                return 0
+            return self._contar_menores((x_max, math.inf)) - self._contar_menores(
+                (x_min, -math.inf)
             )
 
+        total = 0
+        for _ in self.iterar_rango(x_min, x_max, y_min, y_max):
+            total += 1
+        return total
+
     def recorrido_en_anchura(self) -> List[Obstaculo]:
         """
         Realiza un recorrido por anchura (BFS) del árbol.
@@ -236,10 +735,10 @@ class ArbolAVL:
             return []
 
         resultado = []
-        cola = [self.raiz]
+        cola = deque([self.raiz])
 
         while cola:
-            nodo = cola.pop(0)
+            nodo = cola.popleft()
             resultado.append(nodo.obstaculo)
 
             if nodo.izquierdo:
@@ -287,6 +786,18 @@ class ArbolAVL:
         """
         return nodo.altura if nodo is not None else 0
 
+    def obtener_tamaño(self, nodo: Optional[NodoAVL]) -> int:
+        """
+        Obtiene la cantidad de nodos del subárbol de un nodo (0 si es None).
+
+        Args:
+            nodo (Optional[NodoAVL]): Nodo a consultar
+
+        Returns:
+            int: Tamaño del subárbol
+        """
+        return nodo.tamaño if nodo is not None else 0
+
     def rotar_derecha(self, nodo: NodoAVL) -> NodoAVL:
         """
         Realiza una rotación a la derecha para balancear el árbol.
@@ -301,7 +812,7 @@ class ArbolAVL:
         nodo.izquierdo = hijo_izquierdo.derecho
         hijo_izquierdo.derecho = nodo
 
-        # Actualizar alturas
+        # Actualizar alturas y tamaños
         nodo.actualizar_altura()
         hijo_izquierdo.actualizar_altura()
 
@@ -321,7 +832,7 @@ class ArbolAVL:
         nodo.derecho = hijo_derecho.izquierdo
         hijo_derecho.izquierdo = nodo
 
-        # Actualizar alturas
+        # Actualizar alturas y tamaños
         nodo.actualizar_altura()
         hijo_derecho.actualizar_altura()
 
@@ -397,3 +908,6 @@ class ArbolAVL:
         """Elimina todos los obstáculos del árbol."""
         self.raiz = None
         self.total_obstaculos = 0
+        self.version += 1
+        if self.carriles is not None:
+            self.carriles = {}
@@ -0,0 +1,1090 @@
+"""
+Árbol AVL de obstáculos guardado como estructura de arreglos (struct-of-arrays).
+Responsabilidad: Ofrecer la misma interfaz que ArbolAVL sin crear un objeto por nodo,
+para circuitos muy grandes donde importan la memoria y la presión sobre el recolector.
+"""
+
+import math
+from array import array
+from collections import deque
+from operator import attrgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .indice_obstaculos import IndiceObstaculos, ResultadoOperacion
+from .obstaculo import Obstaculo, TipoObstaculo
+
+# El nodo 0 es el centinela nulo: altura 0, tamaño 0 y fin máximo mínimo
+NULO = 0
+FIN_MINIMO = -(2**31)
+
+TIPOS: List[TipoObstaculo] = list(TipoObstaculo)
+ID_POR_TIPO: Dict[TipoObstaculo, int] = {tipo: indice for indice, tipo in enumerate(TIPOS)}
+
+
+class VistaNodo:
+    """
+    Vista de solo lectura de un nodo de ArbolAVLArreglos con la misma forma que NodoAVL.
+    La usan el visualizador y las pantallas, que recorren el árbol desde `raiz`.
+    """
+
+    __slots__ = ("_arbol", "indice")
+
+    def __init__(self, arbol: "ArbolAVLArreglos", indice: int) -> None:
+        """
+        Crea la vista de un nodo.
+
+        Args:
+            arbol (ArbolAVLArreglos): Árbol dueño de los arreglos
+            indice (int): Índice del nodo en los arreglos
+        """
+        self._arbol = arbol
+        self.indice = indice
+
+    def _hijo(self, indice: int) -> Optional["VistaNodo"]:
+        """Vista de un hijo, o None si es el centinela."""
+        return VistaNodo(self._arbol, indice) if indice != NULO else None
+
+    @property
+    def obstaculo(self) -> Obstaculo:
+        """Obstáculo guardado en el nodo."""
+        return self._arbol._obstaculo(self.indice)
+
+    @property
+    def izquierdo(self) -> Optional["VistaNodo"]:
+        """Hijo izquierdo (None si no tiene)."""
+        return self._hijo(self._arbol._izquierdo[self.indice])
+
+    @property
+    def derecho(self) -> Optional["VistaNodo"]:
+        """Hijo derecho (None si no tiene)."""
+        return self._hijo(self._arbol._derecho[self.indice])
+
+    @property
+    def altura(self) -> int:
+        """Altura del subárbol."""
+        return self._arbol._altura[self.indice]
+
+    @property
+    def tamaño(self) -> int:
+        """Cantidad de nodos del subárbol."""
+        return self._arbol._tamaño[self.indice]
+
+    @property
+    def fin_maximo(self) -> int:
+        """Mayor x + ancho del subárbol."""
+        return self._arbol._fin_maximo[self.indice]
+
+    def obtener_factor_balance(self) -> int:
+        """
+        Calcula el factor de balance del nodo.
+
+        Returns:
+            int: Diferencia entre altura del subárbol izquierdo y derecho
+        """
+        altura = self._arbol._altura
+        return altura[self._arbol._izquierdo[self.indice]] - altura[self._arbol._derecho[self.indice]]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, VistaNodo):
+            return False
+        return self._arbol is other._arbol and self.indice == other.indice
+
+    def __hash__(self) -> int:
+        return hash((id(self._arbol), self.indice))
+
+
+class ArbolAVLArreglos(IndiceObstaculos):
+    """
+    Árbol AVL con la misma interfaz pública que ArbolAVL, pero con los nodos guardados en
+    columnas paralelas array('i'): x, y, id de tipo, ancho, alto, hijos, altura, tamaño y
+    fin máximo. Los nodos se referencian por índice y los lugares liberados se reutilizan
+    desde una lista libre. Los obstáculos se materializan al consultarlos, por lo que
+    se comparan por coordenadas y no por identidad. Las coordenadas deben ser enteras.
+    """
+
+    def __init__(self, indice_por_carril: bool = False) -> None:
+        """
+        Inicializa un árbol vacío con solo el nodo centinela.
+
+        Args:
+            indice_por_carril (bool): Si True, mantiene además un árbol por carril
+                sincronizado en cada inserción y eliminación
+        """
+        self._x = array("i", [0])
+        self._y = array("i", [0])
+        self._tipo = array("i", [0])
+        self._ancho = array("i", [0])
+        self._alto = array("i", [0])
+        self._izquierdo = array("i", [NULO])
+        self._derecho = array("i", [NULO])
+        self._altura = array("i", [0])
+        self._tamaño = array("i", [0])
+        self._fin_maximo = array("i", [FIN_MINIMO])
+        self._libres = array("i")  # Índices liberados, reutilizados antes de crecer
+        self._raiz: int = NULO
+        self.total_obstaculos: int = 0
+        self.carriles: Optional[Dict[int, "ArbolAVLArreglos"]] = {} if indice_por_carril else None
+
+    @property
+    def raiz(self) -> Optional[VistaNodo]:
+        """Vista de la raíz con la forma de NodoAVL (None si el árbol está vacío)."""
+        return VistaNodo(self, self._raiz) if self._raiz != NULO else None
+
+    @classmethod
+    def desde_lista(
+        cls, obstaculos: Iterable[Obstaculo], indice_por_carril: bool = False
+    ) -> "ArbolAVLArreglos":
+        """
+        Construye un árbol perfectamente balanceado a partir de una lista de obstáculos.
+        Ordena por (x, y) y descarta duplicados conservando la primera aparición.
+
+        Args:
+            obstaculos (Iterable[Obstaculo]): Obstáculos a cargar, en cualquier orden
+            indice_por_carril (bool): Si True, construye también el índice por carril
+
+        Returns:
+            ArbolAVLArreglos: Nuevo árbol con los obstáculos únicos
+        """
+        ordenados = sorted(obstaculos, key=attrgetter("x", "y"))
+
+        unicos: List[Obstaculo] = []
+        anterior = None
+        for obstaculo in ordenados:
+            clave = (obstaculo.x, obstaculo.y)
+            if clave != anterior:
+                unicos.append(obstaculo)
+                anterior = clave
+
+        arbol = cls(indice_por_carril)
+        arbol._raiz = arbol._construir_balanceado(*arbol._anexar_obstaculos(unicos))
+        arbol.total_obstaculos = len(unicos)
+        if indice_por_carril:
+            arbol.carriles = cls._construir_carriles(unicos)
+        return arbol
+
+    @classmethod
+    def _construir_carriles(cls, ordenados: List[Obstaculo]) -> Dict[int, "ArbolAVLArreglos"]:
+        """
+        Construye el índice por carril a partir de obstáculos ya ordenados y sin duplicados.
+
+        Args:
+            ordenados (List[Obstaculo]): Obstáculos en orden (x, y)
+
+        Returns:
+            Dict[int, ArbolAVLArreglos]: Un árbol balanceado por carril
+        """
+        por_carril: Dict[int, List[Obstaculo]] = {}
+        for obstaculo in ordenados:
+            por_carril.setdefault(obstaculo.y, []).append(obstaculo)
+
+        carriles = {}
+        for carril, lista in por_carril.items():
+            arbol_carril = cls()
+            arbol_carril._raiz = arbol_carril._construir_balanceado(
+                *arbol_carril._anexar_obstaculos(lista)
+            )
+            arbol_carril.total_obstaculos = len(lista)
+            carriles[carril] = arbol_carril
+        return carriles
+
+    def _arbol_carril(self, carril: int) -> "ArbolAVLArreglos":
+        """
+        Obtiene (creándolo si hace falta) el árbol del índice para un carril.
+
+        Args:
+            carril (int): Carril buscado
+
+        Returns:
+            ArbolAVLArreglos: Árbol con los obstáculos de ese carril
+        """
+        arbol_carril = self.carriles.get(carril)
+        if arbol_carril is None:
+            arbol_carril = self.carriles[carril] = ArbolAVLArreglos()
+        return arbol_carril
+
+    def instantanea(self) -> "ArbolAVLArreglos":
+        """
+        Copia completa e independiente del árbol. Cada columna se copia como un solo
+        bloque de memoria, sin recorrer nodos ni crear objetos por obstáculo.
+
+        Returns:
+            ArbolAVLArreglos: Copia del árbol (con su índice por carril, si lo tiene)
+        """
+        copia = ArbolAVLArreglos()
+        for columna in (
+            "_x", "_y", "_tipo", "_ancho", "_alto", "_izquierdo", "_derecho",
+            "_altura", "_tamaño", "_fin_maximo", "_libres",
+        ):
+            setattr(copia, columna, getattr(self, columna)[:])
+        copia._raiz = self._raiz
+        copia.total_obstaculos = self.total_obstaculos
+        if self.carriles is not None:
+            copia.carriles = {
+                carril: arbol_carril.instantanea() for carril, arbol_carril in self.carriles.items()
+            }
+        return copia
+
+    def _obstaculo(self, nodo: int) -> Obstaculo:
+        """
+        Materializa el obstáculo guardado en un nodo.
+
+        Args:
+            nodo (int): Índice del nodo
+
+        Returns:
+            Obstaculo: Obstáculo con los datos de las columnas
+        """
+        return Obstaculo(
+            self._x[nodo], self._y[nodo], TIPOS[self._tipo[nodo]], self._ancho[nodo], self._alto[nodo]
+        )
+
+    def _nuevo_nodo(self, obstaculo: Obstaculo) -> int:
+        """
+        Crea un nodo hoja para un obstáculo, reutilizando un índice libre si hay alguno.
+
+        Args:
+            obstaculo (Obstaculo): Obstáculo a guardar
+
+        Returns:
+            int: Índice del nuevo nodo
+        """
+        x = obstaculo.x
+        ancho = obstaculo.ancho
+        if self._libres:
+            nodo = self._libres.pop()
+            self._x[nodo] = x
+            self._y[nodo] = obstaculo.y
+            self._tipo[nodo] = ID_POR_TIPO[obstaculo.tipo]
+            self._ancho[nodo] = ancho
+            self._alto[nodo] = obstaculo.alto
+            self._izquierdo[nodo] = NULO
+            self._derecho[nodo] = NULO
+            self._altura[nodo] = 1
+            self._tamaño[nodo] = 1
+            self._fin_maximo[nodo] = x + ancho
+            return nodo
+
+        nodo = len(self._x)
+        self._x.append(x)
+        self._y.append(obstaculo.y)
+        self._tipo.append(ID_POR_TIPO[obstaculo.tipo])
+        self._ancho.append(ancho)
+        self._alto.append(obstaculo.alto)
+        self._izquierdo.append(NULO)
+        self._derecho.append(NULO)
+        self._altura.append(1)
+        self._tamaño.append(1)
+        self._fin_maximo.append(x + ancho)
+        return nodo
+
+    def _liberar(self, nodo: int) -> None:
+        """
+        Devuelve un índice a la lista libre.
+
+        Args:
+            nodo (int): Índice del nodo que ya no está en el árbol
+        """
+        self._izquierdo[nodo] = NULO
+        self._derecho[nodo] = NULO
+        self._libres.append(nodo)
+
+    def _anexar_obstaculos(self, obstaculos: List[Obstaculo]) -> Tuple[int, int]:
+        """
+        Agrega al final de las columnas un bloque contiguo de nodos sin enlazar.
+
+        Args:
+            obstaculos (List[Obstaculo]): Obstáculos ordenados y sin duplicados
+
+        Returns:
+            Tuple[int, int]: Rango [inicio, fin) de índices agregados
+        """
+        inicio = len(self._x)
+        cantidad = len(obstaculos)
+        self._x.extend(o.x for o in obstaculos)
+        self._y.extend(o.y for o in obstaculos)
+        self._tipo.extend(ID_POR_TIPO[o.tipo] for o in obstaculos)
+        self._ancho.extend(o.ancho for o in obstaculos)
+        self._alto.extend(o.alto for o in obstaculos)
+        self._reservar_enlaces(cantidad)
+        return inicio, inicio + cantidad
+
+    def _anexar_nodos(self, origen: "ArbolAVLArreglos", nodos: List[int]) -> Tuple[int, int]:
+        """
+        Copia al final de las columnas los datos de nodos de otro árbol, sin materializarlos.
+
+        Args:
+            origen (ArbolAVLArreglos): Árbol del que se copian los datos
+            nodos (List[int]): Índices en `origen`, en orden (x, y)
+
+        Returns:
+            Tuple[int, int]: Rango [inicio, fin) de índices agregados
+        """
+        inicio = len(self._x)
+        for propia, ajena in (
+            (self._x, origen._x), (self._y, origen._y), (self._tipo, origen._tipo),
+            (self._ancho, origen._ancho), (self._alto, origen._alto),
+        ):
+            propia.extend(ajena[nodo] for nodo in nodos)
+        self._reservar_enlaces(len(nodos))
+        return inicio, inicio + len(nodos)
+
+    def _reservar_enlaces(self, cantidad: int) -> None:
+        """Agrega `cantidad` entradas vacías a las columnas de enlaces y aumentos."""
+        ceros = array("i", bytes(cantidad * self._izquierdo.itemsize))
+        for columna in (self._izquierdo, self._derecho, self._altura, self._tamaño, self._fin_maximo):
+            columna.extend(ceros)
+
+    def _construir_balanceado(self, inicio: int, fin: int) -> int:
+        """
+        Enlaza recursivamente como subárbol balanceado los nodos contiguos [inicio, fin).
+
+        Args:
+            inicio (int): Índice inicial (inclusivo)
+            fin (int): Índice final (exclusivo)
+
+        Returns:
+            int: Raíz del subárbol construido
+        """
+        if inicio >= fin:
+            return NULO
+
+        medio = (inicio + fin) // 2
+        self._izquierdo[medio] = self._construir_balanceado(inicio, medio)
+        self._derecho[medio] = self._construir_balanceado(medio + 1, fin)
+        # Un subárbol perfectamente balanceado de m nodos tiene altura bit_length(m)
+        self._altura[medio] = (fin - inicio).bit_length()
+        self._tamaño[medio] = fin - inicio
+        self._actualizar_fin_maximo(medio)
+        return medio
+
+    def _actualizar(self, nodo: int) -> None:
+        """Recalcula altura, tamaño y fin máximo de un nodo a partir de sus hijos."""
+        izquierdo = self._izquierdo[nodo]
+        derecho = self._derecho[nodo]
+        altura = self._altura
+        altura_izq = altura[izquierdo]
+        altura_der = altura[derecho]
+        altura[nodo] = 1 + (altura_izq if altura_izq > altura_der else altura_der)
+        self._tamaño[nodo] = 1 + self._tamaño[izquierdo] + self._tamaño[derecho]
+        self._actualizar_fin_maximo(nodo)
+
+    def _actualizar_fin_maximo(self, nodo: int) -> None:
+        """Recalcula solo el fin máximo de un nodo a partir de sus hijos."""
+        fin_maximo = self._fin_maximo
+        fin = self._x[nodo] + self._ancho[nodo]
+        fin_izq = fin_maximo[self._izquierdo[nodo]]
+        fin_der = fin_maximo[self._derecho[nodo]]
+        if fin_izq > fin:
+            fin = fin_izq
+        if fin_der > fin:
+            fin = fin_der
+        fin_maximo[nodo] = fin
+
+    def insertar(self, obstaculo: Obstaculo) -> bool:
+        """
+        Inserta un obstáculo en el árbol manteniendo el balance AVL.
+
+        Args:
+            obstaculo (Obstaculo): Obstáculo a insertar
+
+        Returns:
+            bool: True si se insertó correctamente, False si ya existía
+        """
+        return self.insertar_con_resultado(obstaculo) is ResultadoOperacion.INSERTADO
+
+    def insertar_con_resultado(self, obstaculo: Obstaculo) -> ResultadoOperacion:
+        """
+        Inserta un obstáculo con un único descenso desde la raíz.
+
+        Args:
+            obstaculo (Obstaculo): Obstáculo a insertar
+
+        Returns:
+            ResultadoOperacion: INSERTADO o DUPLICADO
+        """
+        x = obstaculo.x
+        y = obstaculo.y
+        columna_x = self._x
+        columna_y = self._y
+        camino: List[int] = []
+        direcciones: List[bool] = []  # True = se bajó por la izquierda
+
+        nodo = self._raiz
+        while nodo:
+            actual_x = columna_x[nodo]
+            actual_y = columna_y[nodo]
+            if x == actual_x and y == actual_y:
+                return ResultadoOperacion.DUPLICADO
+            ir_izquierda = x < actual_x or (x == actual_x and y < actual_y)
+            camino.append(nodo)
+            direcciones.append(ir_izquierda)
+            nodo = self._izquierdo[nodo] if ir_izquierda else self._derecho[nodo]
+
+        self._raiz = self._rebalancear_camino(camino, direcciones, self._nuevo_nodo(obstaculo), 1)
+        self.total_obstaculos += 1
+        self.version += 1
+        if self.carriles is not None:
+            self._arbol_carril(y).insertar(obstaculo)
+        return ResultadoOperacion.INSERTADO
+
+    def _rebalancear_camino(
+        self, camino: List[int], direcciones: List[bool], subarbol: int, cambio_tamaño: int
+    ) -> int:
+        """
+        Reengancha un subárbol modificado y rebalancea sus ancestros de abajo hacia arriba.
+
+        Args:
+            camino (List[int]): Ancestros desde la raíz hasta el padre del subárbol
+            direcciones (List[bool]): Por cada ancestro, True si el subárbol cuelga a su izquierda
+            subarbol (int): Nueva raíz del subárbol modificado
+            cambio_tamaño (int): Nodos agregados (+1) o quitados (-1) en el subárbol
+
+        Returns:
+            int: Nueva raíz del árbol
+        """
+        for indice in range(len(camino) - 1, -1, -1):
+            nodo = camino[indice]
+            if direcciones[indice]:
+                self._izquierdo[nodo] = subarbol
+            else:
+                self._derecho[nodo] = subarbol
+            altura_previa = self._altura[nodo]
+            self._actualizar(nodo)
+            subarbol = self._balancear(nodo)
+            # Si el subárbol no cambió de raíz ni de altura, a los ancestros
+            # solo les falta ajustar el tamaño y el fin máximo
+            if subarbol == nodo and self._altura[nodo] == altura_previa:
+                for ancestro in range(indice - 1, -1, -1):
+                    self._tamaño[camino[ancestro]] += cambio_tamaño
+                    self._actualizar_fin_maximo(camino[ancestro])
+                return camino[0]
+        return subarbol
+
+    def eliminar(self, obstaculo: Obstaculo) -> bool:
+        """
+        Elimina un obstáculo del árbol manteniendo el balance AVL.
+
+        Args:
+            obstaculo (Obstaculo): Obstáculo a eliminar
+
+        Returns:
+            bool: True si se eliminó, False si no existía
+        """
+        return self.eliminar_con_resultado(obstaculo) is ResultadoOperacion.ELIMINADO
+
+    def eliminar_con_resultado(self, obstaculo: Obstaculo) -> ResultadoOperacion:
+        """
+        Elimina un obstáculo con un único descenso desde la raíz y libera su índice.
+
+        Args:
+            obstaculo (Obstaculo): Obstáculo a eliminar
+
+        Returns:
+            ResultadoOperacion: ELIMINADO o AUSENTE
+        """
+        x = obstaculo.x
+        y = obstaculo.y
+        columna_x = self._x
+        columna_y = self._y
+        izquierdo = self._izquierdo
+        derecho = self._derecho
+        camino: List[int] = []
+        direcciones: List[bool] = []
+
+        nodo = self._raiz
+        while nodo:
+            actual_x = columna_x[nodo]
+            actual_y = columna_y[nodo]
+            if x == actual_x and y == actual_y:
+                break
+            ir_izquierda = x < actual_x or (x == actual_x and y < actual_y)
+            camino.append(nodo)
+            direcciones.append(ir_izquierda)
+            nodo = izquierdo[nodo] if ir_izquierda else derecho[nodo]
+
+        if not nodo:
+            return ResultadoOperacion.AUSENTE
+
+        if self.carriles is not None:
+            self._arbol_carril(y).eliminar(obstaculo)
+
+        if not izquierdo[nodo]:
+            reemplazo = derecho[nodo]
+            liberado = nodo
+        elif not derecho[nodo]:
+            reemplazo = izquierdo[nodo]
+            liberado = nodo
+        else:
+            # Dos hijos: continuar el mismo descenso hasta el sucesor in-order
+            camino.append(nodo)
+            direcciones.append(False)
+            sucesor = derecho[nodo]
+            while izquierdo[sucesor]:
+                camino.append(sucesor)
+                direcciones.append(True)
+                sucesor = izquierdo[sucesor]
+            for columna in (self._x, self._y, self._tipo, self._ancho, self._alto):
+                columna[nodo] = columna[sucesor]
+            reemplazo = derecho[sucesor]
+            liberado = sucesor
+
+        self._raiz = self._rebalancear_camino(camino, direcciones, reemplazo, -1)
+        self._liberar(liberado)
+        self.total_obstaculos -= 1
+        self.version += 1
+        return ResultadoOperacion.ELIMINADO
+
+    def dividir(self, clave: Tuple[float, float]) -> "ArbolAVLArreglos":
+        """
+        Separa del árbol todos los obstáculos con clave (x, y) menor que `clave`.
+        El corte es O(log n); los k nodos separados se copian a los arreglos del nuevo
+        árbol y sus índices quedan libres aquí, así que el total es O(log n + k).
+
+        Args:
+            clave (Tuple[float, float]): Clave de corte (x, y)
+
+        Returns:
+            ArbolAVLArreglos: Nuevo árbol con los obstáculos menores; este conserva el resto
+        """
+        menores, self._raiz = self._dividir_recursivo(self._raiz, clave)
+        nodos = self._nodos_en_orden(menores)
+
+        separado = ArbolAVLArreglos()
+        separado._raiz = separado._construir_balanceado(*separado._anexar_nodos(self, nodos))
+        separado.total_obstaculos = len(nodos)
+        for nodo in nodos:
+            self._liberar(nodo)
+        self.total_obstaculos = self._tamaño[self._raiz]
+        if nodos:
+            self.version += 1
+
+        if self.carriles is not None:
+            # Las claves de cada carril se ordenan igual, así que se cortan por la misma clave
+            separado.carriles = {
+                carril: arbol_carril.dividir(clave)
+                for carril, arbol_carril in self.carriles.items()
+            }
+        return separado
+
+    def _dividir_recursivo(self, nodo: int, clave: Tuple[float, float]) -> Tuple[int, int]:
+        """
+        Función recursiva para dividir un subárbol por clave.
+
+        Args:
+            nodo (int): Raíz del subárbol a dividir
+            clave (Tuple[float, float]): Clave de corte (x, y)
+
+        Returns:
+            Tuple[int, int]: Raíces de los subárboles (claves < clave, claves >= clave)
+        """
+        if not nodo:
+            return NULO, NULO
+
+        if (self._x[nodo], self._y[nodo]) < clave:
+            menores, mayores = self._dividir_recursivo(self._derecho[nodo], clave)
+            return self._unir_con_pivote(self._izquierdo[nodo], nodo, menores), mayores
+
+        menores, mayores = self._dividir_recursivo(self._izquierdo[nodo], clave)
+        return menores, self._unir_con_pivote(mayores, nodo, self._derecho[nodo])
+
+    def unir(self, otro) -> None:
+        """
+        Une otro árbol a este. Todas las claves de `otro` deben ser mayores, o todas
+        menores, que las de este árbol. `otro` queda vacío. Sus m obstáculos se copian a
+        estos arreglos como un bloque balanceado y se enganchan en O(log n): O(m + log n).
+
+        Args:
+            otro: Árbol a absorber (ArbolAVLArreglos o cualquier árbol con la misma interfaz)
+
+        Raises:
+            ValueError: Si los rangos de claves de ambos árboles se solapan
+        """
+        if otro.esta_vacio():
+            return
+
+        ordenados = otro.recorrido_en_profundidad()
+        otro_va_despues = True
+        if self._raiz:
+            maximo_propio = self._clave(self._extremo(self._raiz, self._derecho))
+            if maximo_propio >= (ordenados[0].x, ordenados[0].y):
+                minimo_propio = self._clave(self._extremo(self._raiz, self._izquierdo))
+                if (ordenados[-1].x, ordenados[-1].y) >= minimo_propio:
+                    raise ValueError("Los rangos de claves de ambos árboles se solapan")
+                otro_va_despues = False
+
+        # El índice por carril se une aparte, después de mover los nodos principales
+        carriles_otro = otro.carriles
+        otro.carriles = None
+        if self.carriles is not None and carriles_otro is None:
+            carriles_otro = self._construir_carriles(ordenados)
+
+        if not self._raiz:
+            self._raiz = self._construir_balanceado(*self._anexar_obstaculos(ordenados))
+        elif otro_va_despues:
+            pivote = self._nuevo_nodo(ordenados[0])
+            resto = self._construir_balanceado(*self._anexar_obstaculos(ordenados[1:]))
+            self._raiz = self._unir_con_pivote(self._raiz, pivote, resto)
+        else:
+            pivote = self._nuevo_nodo(ordenados[-1])
+            resto = self._construir_balanceado(*self._anexar_obstaculos(ordenados[:-1]))
+            self._raiz = self._unir_con_pivote(resto, pivote, self._raiz)
+        self.total_obstaculos = self._tamaño[self._raiz]
+        self.version += 1
+        otro.limpiar()
+
+        if self.carriles is not None:
+            for carril, arbol_carril in carriles_otro.items():
+                self._arbol_carril(carril).unir(arbol_carril)
+
+    def _unir_con_pivote(self, izquierdo: int, pivote: int, derecho: int) -> int:
+        """
+        Une dos subárboles AVL y un nodo pivote cuya clave queda entre ambos.
+
+        Args:
+            izquierdo (int): Subárbol con claves menores al pivote
+            pivote (int): Nodo que quedará entre ambos subárboles
+            derecho (int): Subárbol con claves mayores al pivote
+
+        Returns:
+            int: Raíz del subárbol resultante
+        """
+        altura_izq = self._altura[izquierdo]
+        altura_der = self._altura[derecho]
+
+        if altura_izq > altura_der + 1:
+            self._derecho[izquierdo] = self._unir_con_pivote(self._derecho[izquierdo], pivote, derecho)
+            self._actualizar(izquierdo)
+            return self._balancear(izquierdo)
+
+        if altura_der > altura_izq + 1:
+            self._izquierdo[derecho] = self._unir_con_pivote(izquierdo, pivote, self._izquierdo[derecho])
+            self._actualizar(derecho)
+            return self._balancear(derecho)
+
+        self._izquierdo[pivote] = izquierdo
+        self._derecho[pivote] = derecho
+        self._actualizar(pivote)
+        return pivote
+
+    def eliminar_hasta(self, x: float) -> "ArbolAVLArreglos":
+        """
+        Elimina de una vez todos los obstáculos con coordenada X menor o igual a `x`.
+
+        Args:
+            x (float): Límite X (inclusivo) de los obstáculos a eliminar
+
+        Returns:
+            ArbolAVLArreglos: Árbol separado con los obstáculos eliminados
+        """
+        return self.dividir((x, math.inf))
+
+    def _extremo(self, nodo: int, hijos: array) -> int:
+        """
+        Baja siempre por la misma columna de hijos hasta el mínimo o el máximo.
+
+        Args:
+            nodo (int): Raíz del subárbol
+            hijos (array): self._izquierdo para el mínimo o self._derecho para el máximo
+
+        Returns:
+            int: Nodo extremo del subárbol
+        """
+        while hijos[nodo]:
+            nodo = hijos[nodo]
+        return nodo
+
+    def _clave(self, nodo: int) -> Tuple[int, int]:
+        """Clave (x, y) de un nodo."""
+        return self._x[nodo], self._y[nodo]
+
+    def rango(self, obstaculo: Obstaculo) -> int:
+        """
+        Obtiene la cantidad de obstáculos del árbol con clave menor que la del obstáculo.
+
+        Args:
+            obstaculo (Obstaculo): Obstáculo de referencia (no necesita estar en el árbol)
+
+        Returns:
+            int: Cantidad de obstáculos con clave menor
+        """
+        return self._contar_menores((obstaculo.x, obstaculo.y))
+
+    def _contar_menores(self, clave: Tuple[float, float]) -> int:
+        """
+        Cuenta los obstáculos con clave (x, y) estrictamente menor que `clave`.
+
+        Args:
+            clave (Tuple[float, float]): Clave de referencia
+
+        Returns:
+            int: Cantidad de obstáculos menores
+        """
+        x, y = clave
+        total = 0
+        nodo = self._raiz
+        while nodo:
+            actual_x = self._x[nodo]
+            if actual_x < x or (actual_x == x and self._y[nodo] < y):
+                total += 1 + self._tamaño[self._izquierdo[nodo]]
+                nodo = self._derecho[nodo]
+            else:
+                nodo = self._izquierdo[nodo]
+        return total
+
+    def seleccionar(self, k: int) -> Obstaculo:
+        """
+        Obtiene el k-ésimo obstáculo (desde 0) en orden (x, y). O(log n).
+
+        Args:
+            k (int): Posición buscada
+
+        Returns:
+            Obstaculo: Obstáculo en la posición k
+
+        Raises:
+            IndexError: Si k está fuera de rango
+        """
+        if not 0 <= k < self._tamaño[self._raiz]:
+            raise IndexError(f"Posición {k} fuera de rango")
+
+        nodo = self._raiz
+        while True:
+            tamaño_izq = self._tamaño[self._izquierdo[nodo]]
+            if k < tamaño_izq:
+                nodo = self._izquierdo[nodo]
+            elif k == tamaño_izq:
+                return self._obstaculo(nodo)
+            else:
+                k -= tamaño_izq + 1
+                nodo = self._derecho[nodo]
+
+    def buscar_en_rango(
+        self, x_min: int, x_max: int, y_min: int, y_max: int
+    ) -> List[Obstaculo]:
+        """
+        Busca todos los obstáculos dentro del rango especificado.
+
+        Args:
+            x_min (int): Límite inferior X
+            x_max (int): Límite superior X
+            y_min (int): Límite inferior Y
+            y_max (int): Límite superior Y
+
+        Returns:
+            List[Obstaculo]: Lista de obstáculos en el rango, ordenados por (x, y)
+        """
+        return list(self.iterar_rango(x_min, x_max, y_min, y_max))
+
+    def iterar_rango(
+        self, x_min: float, x_max: float, y_min: int, y_max: int
+    ) -> Iterator[Obstaculo]:
+        """
+        Recorre en orden (x, y) los obstáculos dentro del rango con una pila de índices.
+        Solo materializa los obstáculos que entrega.
+
+        Args:
+            x_min (float): Límite inferior X
+            x_max (float): Límite superior X
+            y_min (int): Límite inferior Y (carril)
+            y_max (int): Límite superior Y (carril)
+
+        Yields:
+            Obstaculo: Obstáculos dentro del rango
+        """
+        columna_x = self._x
+        columna_y = self._y
+        pila: List[int] = []
+        nodo = self._raiz
+        while True:
+            while nodo:
+                if columna_x[nodo] < x_min:
+                    nodo = self._derecho[nodo]
+                else:
+                    pila.append(nodo)
+                    nodo = self._izquierdo[nodo]
+
+            if not pila:
+                return
+
+            nodo = pila.pop()
+            if columna_x[nodo] > x_max:
+                return
+            if y_min <= columna_y[nodo] <= y_max:
+                yield self._obstaculo(nodo)
+            nodo = self._derecho[nodo]
+
+    def iterar_desde(self, clave: Tuple[float, float], x_max: float) -> Iterator[Obstaculo]:
+        """
+        Recorre en orden los obstáculos con clave (x, y) estrictamente mayor que `clave`
+        y coordenada X menor o igual a x_max.
+
+        Args:
+            clave (Tuple[float, float]): Clave a partir de la cual continuar (exclusiva)
+            x_max (float): Límite superior X
+
+        Yields:
+            Obstaculo: Obstáculos siguientes a la clave dentro del límite
+        """
+        x, y = clave
+        columna_x = self._x
+        pila: List[int] = []
+        nodo = self._raiz
+        while True:
+            while nodo:
+                actual_x = columna_x[nodo]
+                if actual_x < x or (actual_x == x and self._y[nodo] <= y):
+                    nodo = self._derecho[nodo]
+                else:
+                    pila.append(nodo)
+                    nodo = self._izquierdo[nodo]
+
+            if not pila:
+                return
+
+            nodo = pila.pop()
+            if columna_x[nodo] > x_max:
+                return
+            yield self._obstaculo(nodo)
+            nodo = self._derecho[nodo]
+
+    def iterar_carril(self, carril: int, x_min: float, x_max: float) -> Iterator[Obstaculo]:
+        """
+        Recorre en orden los obstáculos de un solo carril con X en [x_min, x_max].
+
+        Args:
+            carril (int): Carril a consultar
+            x_min (float): Límite inferior X
+            x_max (float): Límite superior X
+
+        Returns:
+            Iterator[Obstaculo]: Obstáculos del carril dentro del rango
+        """
+        if self.carriles is None:
+            return self.iterar_rango(x_min, x_max, carril, carril)
+        arbol_carril = self.carriles.get(carril)
+        if arbol_carril is None:
+            return iter(())
+        return arbol_carril.iterar_rango(x_min, x_max, carril, carril)
+
+    def siguiente_en_carril(self, carril: int, x: float) -> Optional[Obstaculo]:
+        """
+        Obtiene el primer obstáculo de un carril con coordenada X mayor o igual a `x`.
+
+        Args:
+            carril (int): Carril a consultar
+            x (float): Posición desde la que buscar
+
+        Returns:
+            Optional[Obstaculo]: Próximo obstáculo del carril, None si no hay
+        """
+        return next(self.iterar_carril(carril, x, math.inf), None)
+
+    def buscar_solapados(
+        self, x_ini: float, x_fin: float, carril: Optional[int] = None
+    ) -> List[Obstaculo]:
+        """
+        Busca los obstáculos cuyo intervalo [x, x + ancho) se solapa con [x_ini, x_fin).
+
+        Args:
+            x_ini (float): Inicio del intervalo consultado
+            x_fin (float): Fin (exclusivo) del intervalo consultado
+            carril (Optional[int]): Si se indica, solo obstáculos de ese carril
+
+        Returns:
+            List[Obstaculo]: Obstáculos solapados, ordenados por (x, y)
+        """
+        if carril is not None and self.carriles is not None:
+            arbol_carril = self.carriles.get(carril)
+            return arbol_carril.buscar_solapados(x_ini, x_fin) if arbol_carril else []
+
+        columna_x = self._x
+        fin_maximo = self._fin_maximo
+        resultado: List[Obstaculo] = []
+        pila: List[int] = []
+        nodo = self._raiz
+        while True:
+            # El centinela tiene fin máximo mínimo, así que también corta este ciclo
+            while fin_maximo[nodo] > x_ini:
+                pila.append(nodo)
+                nodo = self._izquierdo[nodo]
+
+            if not pila:
+                return resultado
+
+            nodo = pila.pop()
+            x = columna_x[nodo]
+            if x >= x_fin:
+                return resultado
+            if x + self._ancho[nodo] > x_ini and (carril is None or self._y[nodo] == carril):
+                resultado.append(self._obstaculo(nodo))
+            nodo = self._derecho[nodo]
+
+    def contar_en_rango(
+        self, x_min: float, x_max: float, y_min: int, y_max: int
+    ) -> int:
+        """
+        Cuenta los obstáculos dentro del rango sin construir la lista de resultados.
+
+        Args:
+            x_min (float): Límite inferior X
+            x_max (float): Límite superior X
+            y_min (int): Límite inferior Y (carril)
+            y_max (int): Límite superior Y (carril)
+
+        Returns:
+            int: Cantidad de obstáculos en el rango
+        """
+        if y_min <= Obstaculo.CARRIL_MINIMO and y_max >= Obstaculo.CARRIL_MAXIMO:
+            if x_min > x_max:
+                return 0
+            return self._contar_menores((x_max, math.inf)) - self._contar_menores(
+                (x_min, -math.inf)
+            )
+
+        total = 0
+        for _ in self.iterar_rango(x_min, x_max, y_min, y_max):
+            total += 1
+        return total
+
+    def recorrido_en_anchura(self) -> List[Obstaculo]:
+        """
+        Realiza un recorrido por anchura (BFS) del árbol.
+
+        Returns:
+            List[Obstaculo]: Obstáculos en orden de anchura
+        """
+        resultado = []
+        cola = deque([self._raiz] if self._raiz else [])
+        while cola:
+            nodo = cola.popleft()
+            resultado.append(self._obstaculo(nodo))
+            if self._izquierdo[nodo]:
+                cola.append(self._izquierdo[nodo])
+            if self._derecho[nodo]:
+                cola.append(self._derecho[nodo])
+        return resultado
+
+    def recorrido_en_profundidad(self) -> List[Obstaculo]:
+        """
+        Realiza un recorrido en profundidad (in-order) del árbol.
+
+        Returns:
+            List[Obstaculo]: Obstáculos en orden in-order
+        """
+        return [self._obstaculo(nodo) for nodo in self._nodos_en_orden(self._raiz)]
+
+    def _nodos_en_orden(self, raiz: int) -> List[int]:
+        """
+        Índices de los nodos de un subárbol en orden (x, y).
+
+        Args:
+            raiz (int): Raíz del subárbol
+
+        Returns:
+            List[int]: Índices en orden in-order
+        """
+        resultado: List[int] = []
+        pila: List[int] = []
+        nodo = raiz
+        while nodo or pila:
+            while nodo:
+                pila.append(nodo)
+                nodo = self._izquierdo[nodo]
+            nodo = pila.pop()
+            resultado.append(nodo)
+            nodo = self._derecho[nodo]
+        return resultado
+
+    def obtener_altura(self, nodo: Optional[VistaNodo]) -> int:
+        """
+        Obtiene la altura de un nodo (0 si es None).
+
+        Args:
+            nodo (Optional[VistaNodo]): Nodo a consultar, por ejemplo `raiz`
+
+        Returns:
+            int: Altura del nodo
+        """
+        return nodo.altura if nodo is not None else 0
+
+    def obtener_tamaño(self, nodo: Optional[VistaNodo]) -> int:
+        """
+        Obtiene la cantidad de nodos del subárbol de un nodo (0 si es None).
+
+        Args:
+            nodo (Optional[VistaNodo]): Nodo a consultar, por ejemplo `raiz`
+
+        Returns:
+            int: Tamaño del subárbol
+        """
+        return nodo.tamaño if nodo is not None else 0
+
+    def _rotar_derecha(self, nodo: int) -> int:
+        """Rotación a la derecha; devuelve la nueva raíz del subárbol."""
+        hijo_izquierdo = self._izquierdo[nodo]
+        self._izquierdo[nodo] = self._derecho[hijo_izquierdo]
+        self._derecho[hijo_izquierdo] = nodo
+        self._actualizar(nodo)
+        self._actualizar(hijo_izquierdo)
+        return hijo_izquierdo
+
+    def _rotar_izquierda(self, nodo: int) -> int:
+        """Rotación a la izquierda; devuelve la nueva raíz del subárbol."""
+        hijo_derecho = self._derecho[nodo]
+        self._derecho[nodo] = self._izquierdo[hijo_derecho]
+        self._izquierdo[hijo_derecho] = nodo
+        self._actualizar(nodo)
+        self._actualizar(hijo_derecho)
+        return hijo_derecho
+
+    def _balancear(self, nodo: int) -> int:
+        """
+        Balancea un nodo aplicando las rotaciones necesarias.
+
+        Args:
+            nodo (int): Nodo a balancear
+
+        Returns:
+            int: Raíz del subárbol balanceado
+        """
+        altura = self._altura
+        izquierdo = self._izquierdo[nodo]
+        derecho = self._derecho[nodo]
+        factor_balance = altura[izquierdo] - altura[derecho]
+
+        if factor_balance > 1:
+            # Rotación doble izquierda-derecha si el hijo está cargado al otro lado
+            if altura[self._izquierdo[izquierdo]] < altura[self._derecho[izquierdo]]:
+                self._izquierdo[nodo] = self._rotar_izquierda(izquierdo)
+            return self._rotar_derecha(nodo)
+
+        if factor_balance < -1:
+            if altura[self._derecho[derecho]] < altura[self._izquierdo[derecho]]:
+                self._derecho[nodo] = self._rotar_derecha(derecho)
+            return self._rotar_izquierda(nodo)
+
+        return nodo
+
+    def esta_vacio(self) -> bool:
+        """
+        Verifica si el árbol está vacío.
+
+        Returns:
+            bool: True si no tiene nodos
+        """
+        return self._raiz == NULO
+
+    def obtener_total_obstaculos(self) -> int:
+        """
+        Obtiene el número total de obstáculos en el árbol.
+
+        Returns:
+            int: Cantidad de obstáculos
+        """
+        return self.total_obstaculos
+
+    def limpiar(self) -> None:
+        """Elimina todos los obstáculos del árbol y libera los arreglos."""
+        indice_por_carril = self.carriles is not None
+        self.__init__(indice_por_carril)
+        self.version += 1
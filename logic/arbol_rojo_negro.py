@@ -0,0 +1,206 @@
+"""
+Árbol rojo-negro inclinado a la izquierda (LLRB) para gestionar obstáculos.
+Responsabilidad: Motor alternativo de IndiceObstaculos con menos rotaciones por inserción
+que el AVL, a cambio de un árbol algo más alto.
+"""
+
+from typing import Optional
+
+from .indice_obstaculos import IndiceArbolBinario, NodoBinario, ResultadoOperacion
+from .obstaculo import Obstaculo
+
+
+class NodoRojoNegro(NodoBinario):
+    """Nodo del árbol rojo-negro; `rojo` es el color del enlace que llega desde el padre."""
+
+    __slots__ = ("rojo",)
+
+    def __init__(self, obstaculo: Obstaculo) -> None:
+        """
+        Inicializa un nodo hoja rojo.
+
+        Args:
+            obstaculo (Obstaculo): Obstáculo a almacenar en este nodo
+        """
+        super().__init__(obstaculo)
+        self.rojo: bool = True
+
+
+def _es_rojo(nodo: Optional[NodoRojoNegro]) -> bool:
+    return nodo is not None and nodo.rojo
+
+
+class ArbolRojoNegro(IndiceArbolBinario):
+    """
+    Árbol rojo-negro inclinado a la izquierda (Sedgewick): los enlaces rojos solo
+    cuelgan a la izquierda y todo camino raíz-hoja tiene la misma cantidad de negros,
+    así que la altura es a lo sumo 2 log2(n).
+    """
+
+    def insertar_con_resultado(self, obstaculo: Obstaculo) -> ResultadoOperacion:
+        """
+        Inserta un obstáculo manteniendo las propiedades rojo-negro.
+
+        Args:
+            obstaculo (Obstaculo): Obstáculo a insertar
+
+        Returns:
+            ResultadoOperacion: INSERTADO o DUPLICADO
+        """
+        if self._buscar(obstaculo.x, obstaculo.y) is not None:
+            return ResultadoOperacion.DUPLICADO
+
+        self.raiz = self._insertar_recursivo(self.raiz, obstaculo)
+        self.raiz.rojo = False
+        self.total_obstaculos += 1
+        self.version += 1
+        if obstaculo.ancho > self.ancho_maximo:
+            self.ancho_maximo = obstaculo.ancho
+        return ResultadoOperacion.INSERTADO
+
+    def _insertar_recursivo(
+        self, nodo: Optional[NodoRojoNegro], obstaculo: Obstaculo
+    ) -> NodoRojoNegro:
+        """
+        Inserta una clave que no está en el subárbol y lo rebalancea al volver.
+
+        Args:
+            nodo (Optional[NodoRojoNegro]): Raíz del subárbol
+            obstaculo (Obstaculo): Obstáculo a insertar
+
+        Returns:
+            NodoRojoNegro: Nueva raíz del subárbol
+        """
+        if nodo is None:
+            return NodoRojoNegro(obstaculo)
+
+        actual = nodo.obstaculo
+        if obstaculo.x < actual.x or (obstaculo.x == actual.x and obstaculo.y < actual.y):
+            nodo.izquierdo = self._insertar_recursivo(nodo.izquierdo, obstaculo)
+        else:
+            nodo.derecho = self._insertar_recursivo(nodo.derecho, obstaculo)
+        return self._balancear(nodo)
+
+    def eliminar_con_resultado(self, obstaculo: Obstaculo) -> ResultadoOperacion:
+        """
+        Elimina un obstáculo manteniendo las propiedades rojo-negro.
+
+        Args:
+            obstaculo (Obstaculo): Obstáculo a eliminar
+
+        Returns:
+            ResultadoOperacion: ELIMINADO o AUSENTE
+        """
+        # La eliminación descendente necesita que la clave exista
+        if self._buscar(obstaculo.x, obstaculo.y) is None:
+            return ResultadoOperacion.AUSENTE
+
+        if not _es_rojo(self.raiz.izquierdo) and not _es_rojo(self.raiz.derecho):
+            self.raiz.rojo = True
+        self.raiz = self._eliminar_recursivo(self.raiz, (obstaculo.x, obstaculo.y))
+        if self.raiz is not None:
+            self.raiz.rojo = False
+        self.total_obstaculos -= 1
+        self.version += 1
+        return ResultadoOperacion.ELIMINADO
+
+    def _eliminar_recursivo(self, nodo: NodoRojoNegro, clave) -> Optional[NodoRojoNegro]:
+        """
+        Elimina una clave presente en el subárbol, empujando enlaces rojos hacia abajo
+        durante el descenso para no dejar nunca un nodo 2 vacío.
+
+        Args:
+            nodo (NodoRojoNegro): Raíz del subárbol
+            clave (Tuple[int, int]): Clave (x, y) a eliminar
+
+        Returns:
+            Optional[NodoRojoNegro]: Nueva raíz del subárbol
+        """
+        if clave < (nodo.obstaculo.x, nodo.obstaculo.y):
+            if not _es_rojo(nodo.izquierdo) and not _es_rojo(nodo.izquierdo.izquierdo):
+                nodo = self._mover_rojo_izquierda(nodo)
+            nodo.izquierdo = self._eliminar_recursivo(nodo.izquierdo, clave)
+        else:
+            if _es_rojo(nodo.izquierdo):
+                nodo = self._rotar_derecha(nodo)
+            if clave == (nodo.obstaculo.x, nodo.obstaculo.y) and nodo.derecho is None:
+                return None
+            if not _es_rojo(nodo.derecho) and not _es_rojo(nodo.derecho.izquierdo):
+                nodo = self._mover_rojo_derecha(nodo)
+            if clave == (nodo.obstaculo.x, nodo.obstaculo.y):
+                minimo = nodo.derecho
+                while minimo.izquierdo is not None:
+                    minimo = minimo.izquierdo
+                nodo.obstaculo = minimo.obstaculo
+                nodo.derecho = self._eliminar_minimo(nodo.derecho)
+            else:
+                nodo.derecho = self._eliminar_recursivo(nodo.derecho, clave)
+        return self._balancear(nodo)
+
+    def _eliminar_minimo(self, nodo: NodoRojoNegro) -> Optional[NodoRojoNegro]:
+        """Elimina el mínimo de un subárbol cuya raíz es roja o tiene hijo izquierdo rojo."""
+        if nodo.izquierdo is None:
+            return None
+        if not _es_rojo(nodo.izquierdo) and not _es_rojo(nodo.izquierdo.izquierdo):
+            nodo = self._mover_rojo_izquierda(nodo)
+        nodo.izquierdo = self._eliminar_minimo(nodo.izquierdo)
+        return self._balancear(nodo)
+
+    def _rotar_izquierda(self, nodo: NodoRojoNegro) -> NodoRojoNegro:
+        """Gira un enlace rojo derecho para que quede a la izquierda."""
+        hijo = nodo.derecho
+        nodo.derecho = hijo.izquierdo
+        hijo.izquierdo = nodo
+        hijo.rojo = nodo.rojo
+        nodo.rojo = True
+        return hijo
+
+    def _rotar_derecha(self, nodo: NodoRojoNegro) -> NodoRojoNegro:
+        """Gira un enlace rojo izquierdo para que quede a la derecha."""
+        hijo = nodo.izquierdo
+        nodo.izquierdo = hijo.derecho
+        hijo.derecho = nodo
+        hijo.rojo = nodo.rojo
+        nodo.rojo = True
+        return hijo
+
+    def _invertir_colores(self, nodo: NodoRojoNegro) -> None:
+        """Invierte el color de un nodo y de sus dos hijos."""
+        nodo.rojo = not nodo.rojo
+        nodo.izquierdo.rojo = not nodo.izquierdo.rojo
+        nodo.derecho.rojo = not nodo.derecho.rojo
+
+    def _mover_rojo_izquierda(self, nodo: NodoRojoNegro) -> NodoRojoNegro:
+        """Hace rojo al hijo izquierdo o a uno de sus hijos antes de bajar por la izquierda."""
+        self._invertir_colores(nodo)
+        if _es_rojo(nodo.derecho.izquierdo):
+            nodo.derecho = self._rotar_derecha(nodo.derecho)
+            nodo = self._rotar_izquierda(nodo)
+            self._invertir_colores(nodo)
+        return nodo
+
+    def _mover_rojo_derecha(self, nodo: NodoRojoNegro) -> NodoRojoNegro:
+        """Hace rojo al hijo derecho o a uno de sus hijos antes de bajar por la derecha."""
+        self._invertir_colores(nodo)
+        if _es_rojo(nodo.izquierdo.izquierdo):
+            nodo = self._rotar_derecha(nodo)
+            self._invertir_colores(nodo)
+        return nodo
+
+    def _balancear(self, nodo: NodoRojoNegro) -> NodoRojoNegro:
+        """
+        Restaura las propiedades LLRB de un nodo al volver de la recursión.
+
+        Args:
+            nodo (NodoRojoNegro): Nodo a balancear
+
+        Returns:
+            NodoRojoNegro: Nueva raíz del subárbol
+        """
+        if _es_rojo(nodo.derecho) and not _es_rojo(nodo.izquierdo):
+            nodo = self._rotar_izquierda(nodo)
+        if _es_rojo(nodo.izquierdo) and _es_rojo(nodo.izquierdo.izquierdo):
+            nodo = self._rotar_derecha(nodo)
+        if _es_rojo(nodo.izquierdo) and _es_rojo(nodo.derecho):
+            self._invertir_colores(nodo)
+        return nodo
@@ -0,0 +1,185 @@
+"""
+Arreglo ordenado con búsqueda binaria (bisect) para gestionar obstáculos.
+Responsabilidad: Motor alternativo de IndiceObstaculos con consultas muy baratas y
+memoria contigua, a cambio de inserciones y eliminaciones O(n) por desplazamiento.
+"""
+
+import math
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
+from typing import Iterable, Iterator, List, Tuple
+
+from .indice_obstaculos import IndiceObstaculos, ResultadoOperacion
+from .obstaculo import Obstaculo
+
+
+class ArregloOrdenado(IndiceObstaculos):
+    """
+    Dos listas paralelas ordenadas por (x, y): las claves, para buscar con bisect, y
+    los obstáculos. Insertar o eliminar desplaza la cola de las listas (una copia de
+    memoria en C), lo que en la práctica es rápido para los tamaños del juego.
+    """
+
+    def __init__(self, indice_por_carril: bool = False) -> None:
+        """
+        Inicializa un arreglo vacío.
+
+        Args:
+            indice_por_carril (bool): Se ignora; este motor no tiene índice por carril
+        """
+        self._claves: List[Tuple[int, int]] = []
+        self._obstaculos: List[Obstaculo] = []
+        self.total_obstaculos = 0
+        self.ancho_maximo = 0
+
+    @classmethod
+    def desde_lista(
+        cls, obstaculos: Iterable[Obstaculo], indice_por_carril: bool = False
+    ) -> "ArregloOrdenado":
+        """
+        Construye el arreglo ordenando una sola vez en lugar de insertar uno a uno.
+        Ante coordenadas repetidas se conserva la primera aparición.
+
+        Args:
+            obstaculos (Iterable[Obstaculo]): Obstáculos a cargar, en cualquier orden
+            indice_por_carril (bool): Se ignora; este motor no tiene índice por carril
+
+        Returns:
+            ArregloOrdenado: Nuevo arreglo con los obstáculos únicos
+        """
+        arreglo = cls(indice_por_carril)
+        anterior = None
+        for obstaculo in sorted(obstaculos, key=attrgetter("x", "y")):
+            clave = (obstaculo.x, obstaculo.y)
+            if clave != anterior:
+                arreglo._claves.append(clave)
+                arreglo._obstaculos.append(obstaculo)
+                anterior = clave
+        arreglo.total_obstaculos = len(arreglo._obstaculos)
+        arreglo.ancho_maximo = max((o.ancho for o in arreglo._obstaculos), default=0)
+        return arreglo
+
+    def insertar_con_resultado(self, obstaculo: Obstaculo) -> ResultadoOperacion:
+        """
+        Inserta un obstáculo en su posición ordenada.
+
+        Args:
+            obstaculo (Obstaculo): Obstáculo a insertar
+
+        Returns:
+            ResultadoOperacion: INSERTADO o DUPLICADO
+        """
+        clave = (obstaculo.x, obstaculo.y)
+        posicion = bisect_left(self._claves, clave)
+        if posicion < len(self._claves) and self._claves[posicion] == clave:
+            return ResultadoOperacion.DUPLICADO
+
+        self._claves.insert(posicion, clave)
+        self._obstaculos.insert(posicion, obstaculo)
+        self.total_obstaculos += 1
+        self.version += 1
+        if obstaculo.ancho > self.ancho_maximo:
+            self.ancho_maximo = obstaculo.ancho
+        return ResultadoOperacion.INSERTADO
+
+    def eliminar_con_resultado(self, obstaculo: Obstaculo) -> ResultadoOperacion:
+        """
+        Elimina el obstáculo con la misma clave (x, y).
+
+        Args:
+            obstaculo (Obstaculo): Obstáculo a eliminar
+
+        Returns:
+            ResultadoOperacion: ELIMINADO o AUSENTE
+        """
+        clave = (obstaculo.x, obstaculo.y)
+        posicion = bisect_left(self._claves, clave)
+        if posicion == len(self._claves) or self._claves[posicion] != clave:
+            return ResultadoOperacion.AUSENTE
+
+        del self._claves[posicion]
+        del self._obstaculos[posicion]
+        self.total_obstaculos -= 1
+        self.version += 1
+        return ResultadoOperacion.ELIMINADO
+
+    def iterar_desde(self, clave: Tuple[float, float], x_max: float) -> Iterator[Obstaculo]:
+        """
+        Recorre en orden los obstáculos con clave mayor que `clave` y X hasta x_max.
+
+        Args:
+            clave (Tuple[float, float]): Clave a partir de la cual continuar (exclusiva)
+            x_max (float): Límite superior X
+
+        Yields:
+            Obstaculo: Obstáculos siguientes a la clave dentro del límite
+        """
+        inicio = bisect_right(self._claves, clave)
+        fin = bisect_right(self._claves, (x_max, math.inf), inicio)
+        yield from self._obstaculos[inicio:fin]
+
+    def contar_en_rango(
+        self, x_min: float, x_max: float, y_min: int, y_max: int
+    ) -> int:
+        """
+        Cuenta los obstáculos dentro del rango. Si el rango cubre todos los carriles
+        son dos búsquedas binarias: O(log n).
+
+        Args:
+            x_min (float): Límite inferior X
+            x_max (float): Límite superior X
+            y_min (int): Límite inferior Y (carril)
+            y_max (int): Límite superior Y (carril)
+
+        Returns:
+            int: Cantidad de obstáculos en el rango
+        """
+        if y_min <= Obstaculo.CARRIL_MINIMO and y_max >= Obstaculo.CARRIL_MAXIMO:
+            if x_min > x_max:
+                return 0
+            return bisect_right(self._claves, (x_max, math.inf)) - bisect_left(
+                self._claves, (x_min, -math.inf)
+            )
+        return super().contar_en_rango(x_min, x_max, y_min, y_max)
+
+    def eliminar_hasta(self, x: float) -> "ArregloOrdenado":
+        """
+        Elimina todos los obstáculos con coordenada X menor o igual a `x` recortando
+        el prefijo de ambas listas.
+
+        Args:
+            x (float): Límite X (inclusivo) de los obstáculos a eliminar
+
+        Returns:
+            ArregloOrdenado: Arreglo con los obstáculos eliminados
+        """
+        corte = bisect_right(self._claves, (x, math.inf))
+        separado = ArregloOrdenado()
+        if corte:
+            separado._claves = self._claves[:corte]
+            separado._obstaculos = self._obstaculos[:corte]
+            del self._claves[:corte]
+            del self._obstaculos[:corte]
+        separado.total_obstaculos = corte
+        separado.ancho_maximo = self.ancho_maximo
+        self.total_obstaculos -= corte
+        if corte:
+            self.version += 1
+        return separado
+
+    def recorrido_en_profundidad(self) -> List[Obstaculo]:
+        """
+        Obtiene todos los obstáculos en orden (x, y).
+
+        Returns:
+            List[Obstaculo]: Copia de la lista ordenada
+        """
+        return list(self._obstaculos)
+
+    def limpiar(self) -> None:
+        """Elimina todos los obstáculos del arreglo."""
+        self._claves = []
+        self._obstaculos = []
+        self.total_obstaculos = 0
+        self.ancho_maximo = 0
+        self.version += 1
@@ -5,6 +5,11 @@ Responsabilidad: Gestionar posición, movimiento, estado y colisiones del carrit
 
 from enum import Enum
 
+from .registro import obtener_registro
+
+_registro = obtener_registro("carrito")
+_registro_colisiones = obtener_registro("colisiones")
+
 
 class EstadoCarrito(Enum):
     """Estados posibles del carrito durante el juego."""
@@ -21,6 +26,24 @@ class Carrito:
     Maneja movimiento automático en X y control manual en Y.
     """
 
+    __slots__ = (
+        "x",
+        "y",
+        "energia_actual",
+        "energia_maxima",
+        "estado",
+        "velocidad_x",
+        "velocidad_y",
+        "altura_salto",
+        "tiempo_salto",
+        "duracion_salto",
+        "ancho",
+        "alto",
+        "color_normal",
+        "color_saltando",
+        "color_actual",
+    )
+
     def __init__(
         self,
         x_inicial: int = 50,
@@ -71,9 +94,12 @@ class Carrito:
         consumo_energia = 0.01 * self.velocidad_x  # Reducido a 1/5 del valor anterior
         self.energia_actual = max(0, self.energia_actual - consumo_energia)
         
-        # Imprimir información de depuración cada 100 frames aproximadamente
-        if int(self.x) % 100 == 0:
-            print(f"Energía actual: {self.energia_actual:.2f}, Consumo: {consumo_energia:.4f}, Velocidad: {self.velocidad_x}")
+        # Información de depuración cada 100 píxeles aproximadamente
+        if _registro.depurando and int(self.x) % 100 == 0:
+            _registro.depurar(
+                "Energía actual: %.2f, Consumo: %.4f, Velocidad: %s",
+                self.energia_actual, consumo_energia, self.velocidad_x,
+            )
 
     def mover_automaticamente(self) -> None:
         """
@@ -186,10 +212,10 @@ class Carrito:
         colision = colision_x and colision_y
         
         # Información de depuración en caso de colisión
-        if colision:
-            print(f"¡COLISIÓN! con {obstaculo}")
-            print(f"Carrito: {carrito_rect}")
-            print(f"Obstáculo: {obstaculo_rect}")
+        if colision and _registro_colisiones.depurando:
+            _registro_colisiones.depurar("¡COLISIÓN! con %s", obstaculo)
+            _registro_colisiones.depurar("Carrito: %s", carrito_rect)
+            _registro_colisiones.depurar("Obstáculo: %s", obstaculo_rect)
         
         return colision
 
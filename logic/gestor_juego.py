@@ -7,8 +7,19 @@ import json
 from enum import Enum
 from typing import List, Dict, Any, Optional
 from .arbol_avl import ArbolAVL
+from .indice_obstaculos import IndiceObstaculos
+from .motores_indice import MOTOR_POR_DEFECTO, obtener_motor
 from .carrito import Carrito, EstadoCarrito
-from .obstaculo import Obstaculo, TipoObstaculo
+from .obstaculo import Obstaculo, ObstaculoCompacto, TipoObstaculo
+from .perfilador import PerfiladorFrames
+from .registro import obtener_registro
+from .ventana_visible import VentanaVisible
+
+_registro_config = obtener_registro("config")
+_registro_juego = obtener_registro("juego")
+_registro_ventana = obtener_registro("ventana")
+_registro_arbol = obtener_registro("arbol")
+_registro_colisiones = obtener_registro("colisiones")
 
 
 class EstadoJuego(Enum):
@@ -34,7 +45,10 @@ class GestorJuego:
             archivo_configuracion (str): Ruta al archivo de configuración JSON
         """
         self.estado_actual: EstadoJuego = EstadoJuego.MENU_INICIAL
-        self.arbol_obstaculos: ArbolAVL = ArbolAVL()
+        self.indice_por_carril: bool = True  # Árbol secundario por carril para colisiones
+        self.obstaculos_compactos: bool = False  # Usar dimensiones por tipo en vez de por obstáculo
+        self.motor_arbol: str = MOTOR_POR_DEFECTO  # Nombre en motores_indice.MOTORES
+        self.arbol_obstaculos: IndiceObstaculos = ArbolAVL(self.indice_por_carril)
         self.carrito: Optional[Carrito] = None
         self.archivo_configuracion: str = archivo_configuracion
 
@@ -48,10 +62,19 @@ class GestorJuego:
 
         # Estado del juego
         self.distancia_recorrida: int = 0
-        self.obstaculos_visibles: List[Obstaculo] = []
+        self.ventana_visible: VentanaVisible = VentanaVisible()
+        self.obstaculos_visibles = self.ventana_visible.obstaculos  # Ordenados por distancia
+        self.obstaculos_entrantes: List[Obstaculo] = []  # Entraron a la vista en el último frame
+        self.obstaculos_salientes: List[Obstaculo] = []  # Salieron de la vista en el último frame
+        self._descartados: List[Obstaculo] = []  # Eliminados al chocar, salen en el próximo frame
         self.rango_vision: int = 1000  # píxeles hacia adelante (aumentado)
         self.puntuacion: int = 0
         self.tiempo_juego: float = 0
+        self.colisiones: int = 0  # Choques en la partida actual
+
+        # Tiempos por fase de cada frame (se activa con "perfilar" o desde la pantalla)
+        self.perfilador: PerfiladorFrames = PerfiladorFrames()
+        self.archivo_perfil: str = "perfil_frames.json"
 
     def cargar_configuracion(self) -> bool:
         """
@@ -76,12 +99,18 @@ class GestorJuego:
                     "color_carrito_inicial", "azul"
                 )
                 self.energia_inicial = configuracion.get("energia_inicial", 100)
+                self.indice_por_carril = configuracion.get("indice_por_carril", True)
+                self.obstaculos_compactos = configuracion.get("obstaculos_compactos", False)
+                self.motor_arbol = configuracion.get("motor_arbol", MOTOR_POR_DEFECTO)
+                self.perfilador.activar(configuracion.get("perfilar", False))
+                self.archivo_perfil = configuracion.get("archivo_perfil", "perfil_frames.json")
                 
                 # Validar tipos y rangos
                 if not isinstance(self.velocidad_carrito, (int, float)) or self.velocidad_carrito <= 0:
                     raise ValueError("velocidad_carrito debe ser un número positivo")
                 if not isinstance(self.distancia_total, int) or self.distancia_total <= 0:
                     raise ValueError("distancia_total debe ser un entero positivo")
+                obtener_motor(self.motor_arbol)  # Valida el nombre del motor
 
                 # Cargar daños personalizados por tipo de obstáculo si existen
                 daños_config = config.get("daño_obstaculos", {})
@@ -91,31 +120,30 @@ class GestorJuego:
                             tipo_enum = TipoObstaculo(tipo_str)
                             Obstaculo.DAÑO_POR_TIPO[tipo_enum] = daño
                         except ValueError:
-                            print(f"Tipo de obstáculo desconocido: {tipo_str}")
+                            _registro_config.avisar("Tipo de obstáculo desconocido: %s", tipo_str)
 
-                # Cargar obstáculos predefinidos
+                # Cargar obstáculos predefinidos (los que ya estaban en el árbol se conservan)
                 obstaculos_config = config.get("obstaculos", [])
-                print(f"Cargando {len(obstaculos_config)} obstáculos desde configuración...")
-                for obs_data in obstaculos_config:
-                    obstaculo = self._crear_obstaculo_desde_dict(obs_data)
-                    if self.arbol_obstaculos.insertar(obstaculo):
-                        print(f"Obstáculo cargado: ({obstaculo.x}, {obstaculo.y}) tipo {obstaculo.tipo.value}")
-                    else:
-                        print(f"Error cargando obstáculo: ({obstaculo.x}, {obstaculo.y})")
-
-                print(f"Total de obstáculos en el árbol: {self.arbol_obstaculos.obtener_total_obstaculos()}")
+                _registro_config.informar("Cargando %d obstáculos desde configuración...", len(obstaculos_config))
+                self._construir_arbol(
+                    obstaculos_config, self.arbol_obstaculos.recorrido_en_profundidad()
+                )
+
+                _registro_config.informar(
+                    "Total de obstáculos en el árbol: %d", self.arbol_obstaculos.obtener_total_obstaculos()
+                )
                 return True
         except FileNotFoundError:
-            print(f"Error: No se encontró el archivo {self.archivo_configuracion}")
+            _registro_config.error("Error: No se encontró el archivo %s", self.archivo_configuracion)
             return False
         except json.JSONDecodeError as e:
-            print(f"Error: Archivo JSON mal formateado - {e}")
+            _registro_config.error("Error: Archivo JSON mal formateado - %s", e)
             return False
         except KeyError as e:
-            print(f"Error: Falta la clave requerida {e} en la configuración")
+            _registro_config.error("Error: Falta la clave requerida %s en la configuración", e)
             return False
         except ValueError as e:
-            print(f"Error: Valor inválido en la configuración - {e}")
+            _registro_config.error("Error: Valor inválido en la configuración - %s", e)
             return False
 
     def guardar_configuracion(self) -> bool:
@@ -153,7 +181,7 @@ class GestorJuego:
 
             return True
         except (IOError, json.JSONEncodeError) as e:
-            print(f"Error guardando configuración: {e}")
+            _registro_config.error("Error guardando configuración: %s", e)
             return False
 
     def inicializar_juego(self) -> None:
@@ -168,9 +196,11 @@ class GestorJuego:
 
         # Reiniciar estado del juego
         self.distancia_recorrida = 0
-        self.obstaculos_visibles = []
+        self._reiniciar_ventana_visible()
         self.puntuacion = 0
         self.tiempo_juego = 0
+        self.colisiones = 0
+        self.perfilador.limpiar()
 
         # Cambiar estado
         self.estado_actual = EstadoJuego.JUGANDO
@@ -197,49 +227,65 @@ class GestorJuego:
         if self.carrito is None:
             return
 
+        perfilador = self.perfilador
+        inicio_frame = t = perfilador.marcar()
+
         # Actualizar carrito
         self.carrito.actualizar(delta_tiempo)
+        t = perfilador.registrar("actualizar.carrito", t)
+
+        # Actualizar obstáculos visibles (solo se procesan los que entran y salen)
+        self.actualizar_obstaculos_visibles()
+        t = perfilador.registrar("actualizar.ventana", t)
+
+        # Eliminar obstáculos que ya pasó el carrito (optimización del árbol)
+        self.eliminar_obstaculos_pasados()
+        t = perfilador.registrar("actualizar.poda", t)
 
         # Actualizar distancia recorrida
         distancia_anterior = self.distancia_recorrida
         self.distancia_recorrida = self.carrito.x - 50  # Posición inicial
-        
+
         # Acumular puntos por distancia recorrida (0.1 puntos por unidad de distancia)
         distancia_nueva = self.distancia_recorrida - distancia_anterior
         if distancia_nueva > 0:
             self.puntuacion += distancia_nueva * 0.1
 
-        # Actualizar obstáculos visibles
-        obstaculos_visibles_antes = set(self.obstaculos_visibles)
-        self.actualizar_obstaculos_visibles()
-        obstaculos_visibles_ahora = set(self.obstaculos_visibles)
-        
-        # Eliminar obstáculos que ya pasó el carrito (optimización del árbol)
-        self.eliminar_obstaculos_pasados()
-        
-        # Detectar obstáculos superados (ya no están en el rango visible)
-        obstaculos_superados = obstaculos_visibles_antes - obstaculos_visibles_ahora
+        # Detectar obstáculos superados (salieron del rango visible en este frame)
+        obstaculos_superados = self.obstaculos_salientes
         if obstaculos_superados:
             # Premiar al jugador por cada obstáculo evitado exitosamente
-            self.puntuacion += len(obstaculos_superados) * 5
-            print(f"¡{len(obstaculos_superados)} obstáculos superados! +{len(obstaculos_superados) * 5} puntos")
+            puntos_ganados = len(obstaculos_superados) * 5
+            self.puntuacion += puntos_ganados
+            _registro_juego.depurar(
+                "¡%d obstáculos superados! +%d puntos", len(obstaculos_superados), puntos_ganados
+            )
+
+        t = perfilador.registrar("actualizar.puntuacion", t)
 
         # Verificar colisiones
         obstaculos_colisionados = self.verificar_colisiones()
         for obstaculo in obstaculos_colisionados:
             self.procesar_colision(obstaculo)
+        perfilador.registrar("actualizar.colisiones", t)
 
         # Verificar condiciones de fin de juego
-        if self.verificar_condiciones_fin_juego():
+        terminado = self.verificar_condiciones_fin_juego()
+        if terminado:
             self.estado_actual = EstadoJuego.JUEGO_TERMINADO
 
         # Actualizar tiempo de juego
         self.tiempo_juego += delta_tiempo
+        perfilador.registrar("actualizar.total", inicio_frame)
+
+        if terminado:
+            self._guardar_perfil()
 
     def actualizar_obstaculos_visibles(self) -> None:
         """
-        Consulta el árbol AVL para obtener obstáculos en el rango de visión.
-        Esta es la función clave que demuestra la eficiencia del árbol.
+        Desliza la ventana de visión sobre el árbol AVL hasta la posición del carrito.
+        Solo recorre los obstáculos que entran o salen de la vista desde el frame anterior
+        y los deja en obstaculos_entrantes / obstaculos_salientes.
         """
         if self.carrito is None:
             return
@@ -248,24 +294,30 @@ class GestorJuego:
         x_actual = self.carrito.x
         x_min = x_actual
         x_max = x_actual + self.rango_vision
-        y_min = 0  # Todos los carriles
-        y_max = 5  # Ahora tenemos 6 carriles (0-5)
 
-        # Usar la búsqueda eficiente del árbol AVL
-        self.obstaculos_visibles = self.arbol_obstaculos.buscar_en_rango(
-            x_min, x_max, y_min, y_max
+        # La ventana cubre todos los carriles y avanza en orden por el árbol AVL
+        self.obstaculos_entrantes, self.obstaculos_salientes = self.ventana_visible.desplazar(
+            self.arbol_obstaculos, x_min, x_max
         )
+        if self._descartados:
+            # Los eliminados al chocar dejan la vista en este frame y cuentan como superados
+            self.obstaculos_salientes.extend(self._descartados)
+            self._descartados = []
         
-        # Imprimir información de depuración cada 300 frames aproximadamente
-        if int(self.tiempo_juego * 10) % 300 == 0:
-            print(f"Posición carrito: {x_actual}, Buscando obstáculos entre {x_min} y {x_max}")
-            print(f"Obstáculos encontrados: {len(self.obstaculos_visibles)}")
-            print(f"Obstáculos totales en árbol: {self.arbol_obstaculos.obtener_total_obstaculos()}")
-            
+        # Información de depuración cada 300 frames aproximadamente
+        if _registro_ventana.depurando and int(self.tiempo_juego * 10) % 300 == 0:
+            _registro_ventana.depurar(
+                "Posición carrito: %s, Buscando obstáculos entre %s y %s", x_actual, x_min, x_max
+            )
+            _registro_ventana.depurar("Obstáculos encontrados: %d", len(self.obstaculos_visibles))
+            _registro_ventana.depurar(
+                "Obstáculos totales en árbol: %d", self.arbol_obstaculos.obtener_total_obstaculos()
+            )
+
             if len(self.obstaculos_visibles) > 0:
-                print("Primer obstáculo visible:", self.obstaculos_visibles[0])
+                _registro_ventana.depurar("Primer obstáculo visible: %s", self.obstaculos_visibles[0])
             else:
-                print("No hay obstáculos visibles en este rango")
+                _registro_ventana.depurar("No hay obstáculos visibles en este rango")
 
     def eliminar_obstaculos_pasados(self) -> None:
         """
@@ -279,25 +331,23 @@ class GestorJuego:
         x_carrito = self.carrito.x
         x_limite_pasado = x_carrito - 200  # 200 píxeles atrás del carrito
         
-        # Buscar obstáculos que están en la zona pasada
-        obstaculos_pasados = self.arbol_obstaculos.buscar_en_rango(
-            0, x_limite_pasado, 0, 5  # Desde el inicio hasta el límite pasado, todos los carriles
-        )
-        
-        # Eliminar obstáculos pasados del árbol
-        obstaculos_eliminados = 0
-        for obstaculo in obstaculos_pasados:
-            if self.arbol_obstaculos.eliminar(obstaculo):
-                obstaculos_eliminados += 1
+        # Separar de una vez todo el prefijo del árbol que quedó en la zona pasada
+        obstaculos_pasados = self.arbol_obstaculos.eliminar_hasta(x_limite_pasado)
+        obstaculos_eliminados = obstaculos_pasados.obtener_total_obstaculos()
         
         # Información de depuración cada cierto tiempo
-        if obstaculos_eliminados > 0:
-            print(f"Eliminados {obstaculos_eliminados} obstáculos pasados del árbol AVL")
-            print(f"Total de obstáculos restantes: {self.arbol_obstaculos.obtener_total_obstaculos()}")
+        if obstaculos_eliminados > 0 and _registro_arbol.depurando:
+            _registro_arbol.depurar("Eliminados %d obstáculos pasados del árbol AVL", obstaculos_eliminados)
+            _registro_arbol.depurar(
+                "Total de obstáculos restantes: %d", self.arbol_obstaculos.obtener_total_obstaculos()
+            )
 
     def verificar_colisiones(self) -> List[Obstaculo]:
         """
         Verifica colisiones entre el carrito y los obstáculos visibles.
+        Consulta en el árbol solo los obstáculos del carril del carrito cuyo intervalo
+        [x, x + ancho) se solapa con el del carrito: O(log n + choques), sin importar
+        qué tan lejos llegue el rango de visión.
         Las barreras se pueden evitar saltando.
 
         Returns:
@@ -306,13 +356,22 @@ class GestorJuego:
         if not self.carrito or not self.obstaculos_visibles:
             return []
 
+        x_carrito = self.carrito.x
+        candidatos = self.arbol_obstaculos.buscar_solapados(
+            x_carrito, x_carrito + self.carrito.ancho, self.carrito.y
+        )
+
         obstaculos_colisionados = []
-        for obstaculo in self.obstaculos_visibles:
+        for obstaculo in candidatos:
+            # Como antes, solo cuentan los obstáculos visibles (desde la posición del carrito)
+            if obstaculo.x < x_carrito:
+                continue
+
             # Verificar si hay colisión básica
             if self.carrito.colisiona_con(obstaculo):
                 # Si es una barrera y el carrito está saltando, NO hay colisión
                 if obstaculo.es_barrera() and self.carrito.esta_saltando():
-                    print(f"🦘 ¡Saltando sobre barrera en ({obstaculo.x}, {obstaculo.y})!")
+                    _registro_colisiones.depurar("🦘 ¡Saltando sobre barrera en (%s, %s)!", obstaculo.x, obstaculo.y)
                     continue
                     
                 obstaculos_colisionados.append(obstaculo)
@@ -330,6 +389,7 @@ class GestorJuego:
             return
 
         # Aplicar daño al carrito
+        self.colisiones += 1
         daño = obstaculo.obtener_daño()
         self.carrito.recibir_daño(daño)
 
@@ -341,13 +401,20 @@ class GestorJuego:
         self.puntuacion = max(0, self.puntuacion - puntos_perdidos)
         
         # Mostrar información de colisión
-        print(f"¡COLISIÓN! con {obstaculo.tipo.value} - Daño: {daño} - Puntos perdidos: {puntos_perdidos}")
-        print(f"Energía restante: {self.carrito.energia_actual:.1f} - Puntuación: {self.puntuacion:.1f}")
+        _registro_colisiones.informar(
+            "¡COLISIÓN! con %s - Daño: %s - Puntos perdidos: %s", obstaculo.tipo.value, daño, puntos_perdidos
+        )
+        _registro_colisiones.informar(
+            "Energía restante: %.1f - Puntuación: %.1f", self.carrito.energia_actual, self.puntuacion
+        )
 
         # Remover obstáculo del árbol (opcional, dependiendo del tipo)
         if obstaculo.tipo in [TipoObstaculo.CONO, TipoObstaculo.ACEITE]:
             if self.arbol_obstaculos.eliminar(obstaculo):
-                print(f"Obstáculo {obstaculo.tipo.value} eliminado del árbol")
+                # Ya no está en el árbol: sale de la vista en el próximo frame
+                if self.ventana_visible.descartar(obstaculo):
+                    self._descartados.append(obstaculo)
+                _registro_arbol.depurar("Obstáculo %s eliminado del árbol", obstaculo.tipo.value)
                 # Al eliminar un obstáculo, se modifica el árbol AVL
                 # Esto es importante para mostrar el comportamiento dinámico del árbol
 
@@ -430,13 +497,15 @@ class GestorJuego:
             self.carrito.reiniciar()
 
         self.distancia_recorrida = 0
-        self.obstaculos_visibles = []
+        self._reiniciar_ventana_visible()
         self.puntuacion = 0
         self.tiempo_juego = 0
+        self.colisiones = 0
+        self.perfilador.limpiar()
         self.estado_actual = EstadoJuego.JUGANDO
         
         # 🌳 REINICIAR EL ÁRBOL AVL: Limpiar y recargar desde JSON
-        print("🔄 Reiniciando árbol AVL...")
+        _registro_arbol.informar("🔄 Reiniciando árbol AVL...")
         self.arbol_obstaculos.limpiar()
         
         # Recargar obstáculos desde la configuración JSON
@@ -445,22 +514,15 @@ class GestorJuego:
                 config = json.load(file)
                 
             obstaculos_config = config.get("obstaculos", [])
-            print(f"Recargando {len(obstaculos_config)} obstáculos desde configuración...")
+            _registro_arbol.informar("Recargando %d obstáculos desde configuración...", len(obstaculos_config))
             
-            obstaculos_cargados = 0
-            for obs_data in obstaculos_config:
-                obstaculo = self._crear_obstaculo_desde_dict(obs_data)
-                if self.arbol_obstaculos.insertar(obstaculo):
-                    obstaculos_cargados += 1
-                else:
-                    print(f"Error recargando obstáculo: ({obstaculo.x}, {obstaculo.y})")
-                    
-            print(f"✅ Árbol reiniciado: {obstaculos_cargados} obstáculos restaurados")
-            print(f"Total en árbol: {self.arbol_obstaculos.obtener_total_obstaculos()}")
+            obstaculos_cargados = self._construir_arbol(obstaculos_config)
+            _registro_arbol.informar("✅ Árbol reiniciado: %d obstáculos restaurados", obstaculos_cargados)
+            _registro_arbol.informar("Total en árbol: %d", self.arbol_obstaculos.obtener_total_obstaculos())
             
         except Exception as e:
-            print(f"⚠️ Error al recargar obstáculos: {e}")
-            print("El juego continuará con el árbol vacío")
+            _registro_arbol.error("⚠️ Error al recargar obstáculos: %s", e)
+            _registro_arbol.error("El juego continuará con el árbol vacío")
 
     def pausar_juego(self) -> None:
         """
@@ -489,15 +551,70 @@ class GestorJuego:
             * 100,
             "puntuacion": self.puntuacion,
             "tiempo_juego": self.tiempo_juego,
+            "colisiones": self.colisiones,
             "energia_porcentaje": energia_porcentaje * 100,
             "obstaculos_visibles": len(self.obstaculos_visibles),
             "total_obstaculos": self.arbol_obstaculos.obtener_total_obstaculos(),
             "estado_juego": self.estado_actual.value,
         }
 
+    def _guardar_perfil(self) -> None:
+        """
+        Guarda en archivo_perfil los tiempos por fase de la partida, si se midieron
+        (archivo_perfil vacío = no guardar).
+        """
+        if not self.archivo_perfil or not self.perfilador.activo or not self.perfilador.fases:
+            return
+        try:
+            self.perfilador.guardar(self.archivo_perfil)
+            _registro_juego.informar("Perfil de frames guardado en %s", self.archivo_perfil)
+        except OSError as e:
+            _registro_juego.error("Error guardando el perfil de frames: %s", e)
+
+    def _reiniciar_ventana_visible(self) -> None:
+        """
+        Vacía la ventana de obstáculos visibles y los cambios del último frame.
+        """
+        self.ventana_visible.reiniciar()
+        self.obstaculos_visibles = self.ventana_visible.obstaculos
+        self.obstaculos_entrantes = []
+        self.obstaculos_salientes = []
+        self._descartados = []
+
+    def _construir_arbol(
+        self,
+        obstaculos_config: List[Dict[str, Any]],
+        existentes: Optional[List[Obstaculo]] = None,
+    ) -> int:
+        """
+        Reemplaza el árbol de obstáculos por uno construido en bloque con desde_lista,
+        usando la implementación elegida en motor_arbol.
+
+        Args:
+            obstaculos_config (List[dict]): Obstáculos en formato JSON
+            existentes (Optional[List[Obstaculo]]): Obstáculos a conservar; tienen prioridad
+                sobre los de la configuración cuando coinciden las coordenadas
+
+        Returns:
+            int: Cantidad de obstáculos en el nuevo árbol
+        """
+        obstaculos = list(existentes or [])
+        obstaculos.extend(
+            self._crear_obstaculo_desde_dict(obs_data) for obs_data in obstaculos_config
+        )
+        motor = obtener_motor(self.motor_arbol)
+        self.arbol_obstaculos = motor.desde_lista(obstaculos, self.indice_por_carril)
+
+        total = self.arbol_obstaculos.obtener_total_obstaculos()
+        if total < len(obstaculos):
+            _registro_config.avisar("Se descartaron %d obstáculos con coordenadas repetidas", len(obstaculos) - total)
+        return total
+
     def _crear_obstaculo_desde_dict(self, datos_obstaculo: Dict[str, Any]) -> Obstaculo:
         """
         Crea un obstáculo a partir de un diccionario de configuración.
+        Con obstaculos_compactos activo crea un ObstaculoCompacto, salvo que el JSON
+        pida dimensiones distintas a las de su tipo.
 
         Args:
             datos_obstaculo (dict): Datos del obstáculo desde JSON
@@ -516,7 +633,12 @@ class GestorJuego:
         
         # Validar que la posición Y es válida (0, 1, 2, 3, 4, 5)
         if y not in [0, 1, 2, 3, 4, 5]:
-            print(f"ADVERTENCIA: Posición Y inválida: {y}, se ajustará a un valor válido")
+            _registro_config.avisar("ADVERTENCIA: Posición Y inválida: %s, se ajustará a un valor válido", y)
             y = max(0, min(5, y))
 
+        if self.obstaculos_compactos:
+            ancho_tipo, alto_tipo = ObstaculoCompacto.DIMENSIONES_POR_TIPO[tipo]
+            if ancho == ancho_tipo and (alto == alto_tipo or tipo == TipoObstaculo.BARRERA):
+                return ObstaculoCompacto(x, y, tipo)
+
         return Obstaculo(x, y, tipo, ancho, alto)
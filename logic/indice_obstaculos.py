@@ -0,0 +1,452 @@
+"""
+Interfaz común de los índices ordenados de obstáculos.
+Responsabilidad: Definir las operaciones que el juego necesita de cualquier motor
+(AVL, rojo-negro, treap, lista de saltos, arreglo ordenado) y las implementaciones
+por defecto que se derivan de unas pocas operaciones básicas.
+"""
+
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+from enum import Enum
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from .obstaculo import Obstaculo
+
+
+class ResultadoOperacion(Enum):
+    """Resultado de una inserción o eliminación en el índice."""
+
+    INSERTADO = "insertado"
+    DUPLICADO = "duplicado"
+    ELIMINADO = "eliminado"
+    AUSENTE = "ausente"
+
+
+class IndiceObstaculos(ABC):
+    """
+    Índice de obstáculos ordenado por la clave (x, y), sin claves repetidas.
+
+    Un motor nuevo solo necesita implementar insertar_con_resultado,
+    eliminar_con_resultado, iterar_desde, recorrido_en_profundidad y limpiar, y mantener
+    total_obstaculos, ancho_maximo y version. El resto de las consultas tiene una versión por
+    defecto basada en iterar_desde que cada motor puede reemplazar por una más rápida.
+    """
+
+    raiz = None  # Los motores con forma de árbol binario exponen aquí su raíz
+    carriles = None  # Solo los motores AVL mantienen índice por carril
+    total_obstaculos: int = 0
+    ancho_maximo: int = 0  # Cota superior de los anchos insertados, para buscar_solapados
+    version: int = 0  # Contador de modificaciones: sube en cada cambio de contenido o forma
+
+    @classmethod
+    def desde_lista(
+        cls, obstaculos: Iterable[Obstaculo], indice_por_carril: bool = False
+    ) -> "IndiceObstaculos":
+        """
+        Construye un índice con los obstáculos dados. Ante coordenadas repetidas se
+        conserva la primera aparición.
+
+        Args:
+            obstaculos (Iterable[Obstaculo]): Obstáculos a cargar, en cualquier orden
+            indice_por_carril (bool): Índice por carril (los motores sin él lo ignoran)
+
+        Returns:
+            IndiceObstaculos: Nuevo índice con los obstáculos únicos
+        """
+        indice = cls(indice_por_carril)
+        for obstaculo in obstaculos:
+            indice.insertar(obstaculo)
+        return indice
+
+    @abstractmethod
+    def insertar_con_resultado(self, obstaculo: Obstaculo) -> ResultadoOperacion:
+        """
+        Inserta un obstáculo si su clave (x, y) no estaba en el índice.
+
+        Args:
+            obstaculo (Obstaculo): Obstáculo a insertar
+
+        Returns:
+            ResultadoOperacion: INSERTADO o DUPLICADO
+        """
+
+    @abstractmethod
+    def eliminar_con_resultado(self, obstaculo: Obstaculo) -> ResultadoOperacion:
+        """
+        Elimina el obstáculo con la misma clave (x, y).
+
+        Args:
+            obstaculo (Obstaculo): Obstáculo a eliminar
+
+        Returns:
+            ResultadoOperacion: ELIMINADO o AUSENTE
+        """
+
+    @abstractmethod
+    def iterar_desde(self, clave: Tuple[float, float], x_max: float) -> Iterator[Obstaculo]:
+        """
+        Recorre en orden los obstáculos con clave (x, y) estrictamente mayor que `clave`
+        y coordenada X menor o igual a x_max.
+
+        Args:
+            clave (Tuple[float, float]): Clave a partir de la cual continuar (exclusiva)
+            x_max (float): Límite superior X
+
+        Yields:
+            Obstaculo: Obstáculos siguientes a la clave dentro del límite
+        """
+
+    @abstractmethod
+    def recorrido_en_profundidad(self) -> List[Obstaculo]:
+        """
+        Obtiene todos los obstáculos en orden (x, y).
+
+        Returns:
+            List[Obstaculo]: Obstáculos en orden in-order
+        """
+
+    @abstractmethod
+    def limpiar(self) -> None:
+        """Elimina todos los obstáculos del índice."""
+
+    def insertar(self, obstaculo: Obstaculo) -> bool:
+        """
+        Inserta un obstáculo en el índice.
+
+        Args:
+            obstaculo (Obstaculo): Obstáculo a insertar
+
+        Returns:
+            bool: True si se insertó correctamente, False si ya existía
+        """
+        return self.insertar_con_resultado(obstaculo) is ResultadoOperacion.INSERTADO
+
+    def eliminar(self, obstaculo: Obstaculo) -> bool:
+        """
+        Elimina un obstáculo del índice.
+
+        Args:
+            obstaculo (Obstaculo): Obstáculo a eliminar
+
+        Returns:
+            bool: True si se eliminó, False si no existía
+        """
+        return self.eliminar_con_resultado(obstaculo) is ResultadoOperacion.ELIMINADO
+
+    def iterar_rango(
+        self, x_min: float, x_max: float, y_min: int, y_max: int
+    ) -> Iterator[Obstaculo]:
+        """
+        Recorre en orden (x, y) los obstáculos dentro del rango.
+
+        Args:
+            x_min (float): Límite inferior X
+            x_max (float): Límite superior X
+            y_min (int): Límite inferior Y (carril)
+            y_max (int): Límite superior Y (carril)
+
+        Yields:
+            Obstaculo: Obstáculos dentro del rango
+        """
+        for obstaculo in self.iterar_desde((x_min, -math.inf), x_max):
+            if y_min <= obstaculo.y <= y_max:
+                yield obstaculo
+
+    def buscar_en_rango(
+        self, x_min: int, x_max: int, y_min: int, y_max: int
+    ) -> List[Obstaculo]:
+        """
+        Busca todos los obstáculos dentro del rango especificado.
+
+        Args:
+            x_min (int): Límite inferior X
+            x_max (int): Límite superior X
+            y_min (int): Límite inferior Y
+            y_max (int): Límite superior Y
+
+        Returns:
+            List[Obstaculo]: Lista de obstáculos en el rango, ordenados por (x, y)
+        """
+        return list(self.iterar_rango(x_min, x_max, y_min, y_max))
+
+    def contar_en_rango(
+        self, x_min: float, x_max: float, y_min: int, y_max: int
+    ) -> int:
+        """
+        Cuenta los obstáculos dentro del rango sin construir la lista de resultados.
+
+        Args:
+            x_min (float): Límite inferior X
+            x_max (float): Límite superior X
+            y_min (int): Límite inferior Y (carril)
+            y_max (int): Límite superior Y (carril)
+
+        Returns:
+            int: Cantidad de obstáculos en el rango
+        """
+        total = 0
+        for _ in self.iterar_rango(x_min, x_max, y_min, y_max):
+            total += 1
+        return total
+
+    def iterar_carril(self, carril: int, x_min: float, x_max: float) -> Iterator[Obstaculo]:
+        """
+        Recorre en orden los obstáculos de un solo carril con X en [x_min, x_max].
+
+        Args:
+            carril (int): Carril a consultar
+            x_min (float): Límite inferior X
+            x_max (float): Límite superior X
+
+        Returns:
+            Iterator[Obstaculo]: Obstáculos del carril dentro del rango
+        """
+        return self.iterar_rango(x_min, x_max, carril, carril)
+
+    def siguiente_en_carril(self, carril: int, x: float) -> Optional[Obstaculo]:
+        """
+        Obtiene el primer obstáculo de un carril con coordenada X mayor o igual a `x`.
+
+        Args:
+            carril (int): Carril a consultar
+            x (float): Posición desde la que buscar
+
+        Returns:
+            Optional[Obstaculo]: Próximo obstáculo del carril, None si no hay
+        """
+        return next(self.iterar_carril(carril, x, math.inf), None)
+
+    def buscar_solapados(
+        self, x_ini: float, x_fin: float, carril: Optional[int] = None
+    ) -> List[Obstaculo]:
+        """
+        Busca los obstáculos cuyo intervalo [x, x + ancho) se solapa con [x_ini, x_fin).
+        Como ningún obstáculo es más ancho que ancho_maximo, basta recorrer desde
+        x_ini - ancho_maximo.
+
+        Args:
+            x_ini (float): Inicio del intervalo consultado
+            x_fin (float): Fin (exclusivo) del intervalo consultado
+            carril (Optional[int]): Si se indica, solo obstáculos de ese carril
+
+        Returns:
+            List[Obstaculo]: Obstáculos solapados, ordenados por (x, y)
+        """
+        resultado: List[Obstaculo] = []
+        for obstaculo in self.iterar_desde((x_ini - self.ancho_maximo, math.inf), x_fin):
+            if obstaculo.x >= x_fin:
+                break
+            if obstaculo.x + obstaculo.ancho > x_ini and (carril is None or obstaculo.y == carril):
+                resultado.append(obstaculo)
+        return resultado
+
+    def eliminar_hasta(self, x: float) -> "IndiceObstaculos":
+        """
+        Elimina todos los obstáculos con coordenada X menor o igual a `x`.
+
+        Args:
+            x (float): Límite X (inclusivo) de los obstáculos a eliminar
+
+        Returns:
+            IndiceObstaculos: Índice del mismo tipo con los obstáculos eliminados
+        """
+        pasados = list(self.iterar_desde((-math.inf, -math.inf), x))
+        for obstaculo in pasados:
+            self.eliminar(obstaculo)
+        return type(self).desde_lista(pasados)
+
+    def recorrido_en_anchura(self) -> List[Obstaculo]:
+        """
+        Realiza un recorrido por anchura. Los motores sin forma de árbol no tienen
+        niveles, así que por defecto devuelven el orden (x, y).
+
+        Returns:
+            List[Obstaculo]: Obstáculos en orden de anchura
+        """
+        return self.recorrido_en_profundidad()
+
+    def obtener_altura(self, nodo) -> int:
+        """
+        Obtiene la altura de un nodo (0 si es None).
+
+        Args:
+            nodo: Nodo a consultar, por ejemplo `raiz`
+
+        Returns:
+            int: Altura del nodo
+        """
+        return nodo.altura if nodo is not None else 0
+
+    def esta_vacio(self) -> bool:
+        """
+        Verifica si el índice está vacío.
+
+        Returns:
+            bool: True si no tiene obstáculos
+        """
+        return self.total_obstaculos == 0
+
+    def obtener_total_obstaculos(self) -> int:
+        """
+        Obtiene el número total de obstáculos en el índice.
+
+        Returns:
+            int: Cantidad de obstáculos
+        """
+        return self.total_obstaculos
+
+
+class NodoBinario:
+    """
+    Nodo de un árbol binario de búsqueda sin altura guardada (rojo-negro, treap).
+    Calcula altura y factor de balance bajo demanda recorriendo el subárbol; como no
+    tiene `tamaño`, el visualizador no los muestra para no recorrerlo en cada frame.
+    """
+
+    __slots__ = ("obstaculo", "izquierdo", "derecho")
+
+    def __init__(self, obstaculo: Obstaculo) -> None:
+        """
+        Inicializa un nodo hoja.
+
+        Args:
+            obstaculo (Obstaculo): Obstáculo a almacenar en este nodo
+        """
+        self.obstaculo: Obstaculo = obstaculo
+        self.izquierdo: Optional["NodoBinario"] = None
+        self.derecho: Optional["NodoBinario"] = None
+
+    @property
+    def altura(self) -> int:
+        """Altura del subárbol, calculada recorriéndolo (O(tamaño del subárbol))."""
+        izquierdo = self.izquierdo.altura if self.izquierdo else 0
+        derecho = self.derecho.altura if self.derecho else 0
+        return 1 + max(izquierdo, derecho)
+
+    def obtener_factor_balance(self) -> int:
+        """
+        Calcula el factor de balance del nodo.
+
+        Returns:
+            int: Diferencia entre altura del subárbol izquierdo y derecho
+        """
+        izquierdo = self.izquierdo.altura if self.izquierdo else 0
+        derecho = self.derecho.altura if self.derecho else 0
+        return izquierdo - derecho
+
+
+class IndiceArbolBinario(IndiceObstaculos):
+    """
+    Base de los motores con forma de árbol binario de búsqueda cuyos nodos tienen
+    obstaculo, izquierdo y derecho: aporta los recorridos y la iteración en orden.
+    """
+
+    def __init__(self, indice_por_carril: bool = False) -> None:
+        """
+        Inicializa un árbol vacío.
+
+        Args:
+            indice_por_carril (bool): Se ignora; este motor no tiene índice por carril
+        """
+        self.raiz: Optional[NodoBinario] = None
+        self.total_obstaculos = 0
+        self.ancho_maximo = 0
+
+    def _buscar(self, x: float, y: float) -> Optional[NodoBinario]:
+        """
+        Busca el nodo con clave (x, y).
+
+        Args:
+            x (float): Coordenada X
+            y (float): Coordenada Y
+
+        Returns:
+            Optional[NodoBinario]: Nodo encontrado, None si no existe
+        """
+        nodo = self.raiz
+        while nodo is not None:
+            actual = nodo.obstaculo
+            if x == actual.x and y == actual.y:
+                return nodo
+            if x < actual.x or (x == actual.x and y < actual.y):
+                nodo = nodo.izquierdo
+            else:
+                nodo = nodo.derecho
+        return None
+
+    def iterar_desde(self, clave: Tuple[float, float], x_max: float) -> Iterator[Obstaculo]:
+        """
+        Recorre en orden los obstáculos con clave mayor que `clave` y X hasta x_max,
+        con una pila explícita.
+
+        Args:
+            clave (Tuple[float, float]): Clave a partir de la cual continuar (exclusiva)
+            x_max (float): Límite superior X
+
+        Yields:
+            Obstaculo: Obstáculos siguientes a la clave dentro del límite
+        """
+        x, y = clave
+        pila: List[NodoBinario] = []
+        nodo = self.raiz
+        while True:
+            while nodo is not None:
+                actual = nodo.obstaculo
+                if actual.x < x or (actual.x == x and actual.y <= y):
+                    nodo = nodo.derecho
+                else:
+                    pila.append(nodo)
+                    nodo = nodo.izquierdo
+
+            if not pila:
+                return
+
+            nodo = pila.pop()
+            if nodo.obstaculo.x > x_max:
+                return
+            yield nodo.obstaculo
+            nodo = nodo.derecho
+
+    def recorrido_en_profundidad(self) -> List[Obstaculo]:
+        """
+        Realiza un recorrido en profundidad (in-order) del árbol.
+
+        Returns:
+            List[Obstaculo]: Obstáculos en orden in-order
+        """
+        return list(self.iterar_desde((-math.inf, -math.inf), math.inf))
+
+    def recorrido_en_anchura(self) -> List[Obstaculo]:
+        """
+        Realiza un recorrido por anchura (BFS) del árbol.
+
+        Returns:
+            List[Obstaculo]: Obstáculos en orden de anchura
+        """
+        resultado = []
+        cola = deque([self.raiz] if self.raiz is not None else [])
+        while cola:
+            nodo = cola.popleft()
+            resultado.append(nodo.obstaculo)
+            if nodo.izquierdo:
+                cola.append(nodo.izquierdo)
+            if nodo.derecho:
+                cola.append(nodo.derecho)
+        return resultado
+
+    def esta_vacio(self) -> bool:
+        """
+        Verifica si el árbol está vacío.
+
+        Returns:
+            bool: True si no tiene nodos
+        """
+        return self.raiz is None
+
+    def limpiar(self) -> None:
+        """Elimina todos los obstáculos del árbol."""
+        self.raiz = None
+        self.total_obstaculos = 0
+        self.ancho_maximo = 0
+        self.version += 1
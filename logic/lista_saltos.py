@@ -0,0 +1,205 @@
+"""
+Lista de saltos (skip list) para gestionar obstáculos.
+Responsabilidad: Motor alternativo de IndiceObstaculos sin rotaciones, con búsquedas
+O(log n) esperadas y recorridos en orden que siguen un solo enlace por obstáculo.
+"""
+
+import math
+import random
+from typing import Iterator, List, Optional, Tuple
+
+from .indice_obstaculos import IndiceObstaculos, ResultadoOperacion
+from .obstaculo import Obstaculo
+
+
+class NodoSaltos:
+    """Nodo de la lista de saltos con un enlace siguiente por nivel."""
+
+    __slots__ = ("obstaculo", "siguientes")
+
+    def __init__(self, obstaculo: Optional[Obstaculo], niveles: int) -> None:
+        """
+        Inicializa un nodo sin enlaces.
+
+        Args:
+            obstaculo (Optional[Obstaculo]): Obstáculo del nodo (None en la cabecera)
+            niveles (int): Cantidad de niveles en los que aparece el nodo
+        """
+        self.obstaculo = obstaculo
+        self.siguientes: List[Optional["NodoSaltos"]] = [None] * niveles
+
+
+class ListaSaltos(IndiceObstaculos):
+    """
+    Lista enlazada ordenada por (x, y) con niveles de enlaces "expresos": cada nodo
+    aparece en el nivel i+1 con probabilidad 1/2 si aparece en el nivel i.
+    """
+
+    NIVEL_MAXIMO = 32
+
+    def __init__(self, indice_por_carril: bool = False, semilla: Optional[int] = None) -> None:
+        """
+        Inicializa una lista vacía.
+
+        Args:
+            indice_por_carril (bool): Se ignora; este motor no tiene índice por carril
+            semilla (Optional[int]): Semilla de los niveles, para resultados reproducibles
+        """
+        self._cabecera = NodoSaltos(None, self.NIVEL_MAXIMO)
+        self._niveles = 1  # Niveles en uso
+        self._aleatorio = random.Random(semilla)
+        self.total_obstaculos = 0
+        self.ancho_maximo = 0
+
+    def _nivel_aleatorio(self) -> int:
+        """Sortea la cantidad de niveles de un nodo nuevo (distribución geométrica)."""
+        bits = self._aleatorio.getrandbits(self.NIVEL_MAXIMO - 1)
+        # Cantidad de unos consecutivos desde el bit menos significativo, más uno
+        return min(((bits ^ (bits + 1)).bit_length()), self.NIVEL_MAXIMO)
+
+    def _predecesores(self, x: float, y: float, estricto: bool = True) -> List[NodoSaltos]:
+        """
+        Busca en cada nivel el último nodo con clave menor que (x, y).
+
+        Args:
+            x (float): Coordenada X de la clave
+            y (float): Coordenada Y de la clave
+            estricto (bool): Si es False, busca el último nodo con clave menor o igual
+
+        Returns:
+            List[NodoSaltos]: Un predecesor por nivel en uso (índice 0 = nivel inferior)
+        """
+        predecesores: List[NodoSaltos] = [self._cabecera] * self._niveles
+        nodo = self._cabecera
+        for nivel in range(self._niveles - 1, -1, -1):
+            siguiente = nodo.siguientes[nivel]
+            while siguiente is not None:
+                actual = siguiente.obstaculo
+                if actual.x < x or (actual.x == x and (actual.y < y or (not estricto and actual.y == y))):
+                    nodo = siguiente
+                    siguiente = nodo.siguientes[nivel]
+                else:
+                    break
+            predecesores[nivel] = nodo
+        return predecesores
+
+    def insertar_con_resultado(self, obstaculo: Obstaculo) -> ResultadoOperacion:
+        """
+        Inserta un obstáculo enlazándolo en un número aleatorio de niveles.
+
+        Args:
+            obstaculo (Obstaculo): Obstáculo a insertar
+
+        Returns:
+            ResultadoOperacion: INSERTADO o DUPLICADO
+        """
+        predecesores = self._predecesores(obstaculo.x, obstaculo.y)
+        siguiente = predecesores[0].siguientes[0]
+        if siguiente is not None and siguiente.obstaculo.x == obstaculo.x and siguiente.obstaculo.y == obstaculo.y:
+            return ResultadoOperacion.DUPLICADO
+
+        niveles = self._nivel_aleatorio()
+        if niveles > self._niveles:
+            predecesores.extend([self._cabecera] * (niveles - self._niveles))
+            self._niveles = niveles
+
+        nuevo = NodoSaltos(obstaculo, niveles)
+        for nivel in range(niveles):
+            nuevo.siguientes[nivel] = predecesores[nivel].siguientes[nivel]
+            predecesores[nivel].siguientes[nivel] = nuevo
+
+        self.total_obstaculos += 1
+        self.version += 1
+        if obstaculo.ancho > self.ancho_maximo:
+            self.ancho_maximo = obstaculo.ancho
+        return ResultadoOperacion.INSERTADO
+
+    def eliminar_con_resultado(self, obstaculo: Obstaculo) -> ResultadoOperacion:
+        """
+        Elimina un obstáculo desenlazándolo de todos sus niveles.
+
+        Args:
+            obstaculo (Obstaculo): Obstáculo a eliminar
+
+        Returns:
+            ResultadoOperacion: ELIMINADO o AUSENTE
+        """
+        predecesores = self._predecesores(obstaculo.x, obstaculo.y)
+        nodo = predecesores[0].siguientes[0]
+        if nodo is None or nodo.obstaculo.x != obstaculo.x or nodo.obstaculo.y != obstaculo.y:
+            return ResultadoOperacion.AUSENTE
+
+        for nivel in range(len(nodo.siguientes)):
+            predecesores[nivel].siguientes[nivel] = nodo.siguientes[nivel]
+        self._recortar_niveles()
+        self.total_obstaculos -= 1
+        self.version += 1
+        return ResultadoOperacion.ELIMINADO
+
+    def _recortar_niveles(self) -> None:
+        """Descarta los niveles superiores que quedaron vacíos."""
+        while self._niveles > 1 and self._cabecera.siguientes[self._niveles - 1] is None:
+            self._niveles -= 1
+
+    def iterar_desde(self, clave: Tuple[float, float], x_max: float) -> Iterator[Obstaculo]:
+        """
+        Recorre en orden los obstáculos con clave mayor que `clave` y X hasta x_max.
+        Ubica el inicio en O(log n) esperado y luego sigue el nivel inferior.
+
+        Args:
+            clave (Tuple[float, float]): Clave a partir de la cual continuar (exclusiva)
+            x_max (float): Límite superior X
+
+        Yields:
+            Obstaculo: Obstáculos siguientes a la clave dentro del límite
+        """
+        nodo = self._predecesores(clave[0], clave[1], estricto=False)[0].siguientes[0]
+        while nodo is not None and nodo.obstaculo.x <= x_max:
+            yield nodo.obstaculo
+            nodo = nodo.siguientes[0]
+
+    def recorrido_en_profundidad(self) -> List[Obstaculo]:
+        """
+        Obtiene todos los obstáculos en orden (x, y) siguiendo el nivel inferior.
+
+        Returns:
+            List[Obstaculo]: Obstáculos en orden
+        """
+        return list(self.iterar_desde((-math.inf, -math.inf), math.inf))
+
+    def eliminar_hasta(self, x: float) -> "ListaSaltos":
+        """
+        Elimina todos los obstáculos con coordenada X menor o igual a `x` cortando
+        la lista en cada nivel: O(log n) esperado más contar los k separados.
+
+        Args:
+            x (float): Límite X (inclusivo) de los obstáculos a eliminar
+
+        Returns:
+            ListaSaltos: Lista con los obstáculos eliminados
+        """
+        separada = ListaSaltos()
+        ultimos = self._predecesores(x, math.inf)
+        for nivel in range(self._niveles):
+            if ultimos[nivel] is not self._cabecera:
+                separada._cabecera.siguientes[nivel] = self._cabecera.siguientes[nivel]
+                self._cabecera.siguientes[nivel] = ultimos[nivel].siguientes[nivel]
+                ultimos[nivel].siguientes[nivel] = None
+        separada._niveles = self._niveles
+        separada._recortar_niveles()
+        self._recortar_niveles()
+
+        separada.total_obstaculos = sum(1 for _ in separada.iterar_desde((-math.inf, -math.inf), math.inf))
+        separada.ancho_maximo = self.ancho_maximo
+        self.total_obstaculos -= separada.total_obstaculos
+        if separada.total_obstaculos:
+            self.version += 1
+        return separada
+
+    def limpiar(self) -> None:
+        """Elimina todos los obstáculos de la lista."""
+        self._cabecera = NodoSaltos(None, self.NIVEL_MAXIMO)
+        self._niveles = 1
+        self.total_obstaculos = 0
+        self.ancho_maximo = 0
+        self.version += 1
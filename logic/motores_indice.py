@@ -0,0 +1,47 @@
+"""
+Registro de motores de índice de obstáculos.
+Responsabilidad: Asociar el nombre configurable ("motor_arbol" en configuracion.json)
+con la implementación de IndiceObstaculos correspondiente.
+"""
+
+from typing import Dict, Type
+
+from .arbol_avl import ArbolAVL
+from .arbol_avl_arreglos import ArbolAVLArreglos
+from .arbol_rojo_negro import ArbolRojoNegro
+from .arreglo_ordenado import ArregloOrdenado
+from .indice_obstaculos import IndiceObstaculos
+from .lista_saltos import ListaSaltos
+from .treap import Treap
+
+MOTOR_POR_DEFECTO = "avl"
+
+MOTORES: Dict[str, Type[IndiceObstaculos]] = {
+    "avl": ArbolAVL,
+    "avl_arreglos": ArbolAVLArreglos,
+    "rojo_negro": ArbolRojoNegro,
+    "treap": Treap,
+    "lista_saltos": ListaSaltos,
+    "arreglo_ordenado": ArregloOrdenado,
+}
+
+
+def obtener_motor(nombre: str) -> Type[IndiceObstaculos]:
+    """
+    Obtiene la clase de índice registrada con un nombre.
+
+    Args:
+        nombre (str): Nombre del motor, por ejemplo "avl" o "treap"
+
+    Returns:
+        Type[IndiceObstaculos]: Clase del motor
+
+    Raises:
+        ValueError: Si no hay ningún motor con ese nombre
+    """
+    try:
+        return MOTORES[nombre]
+    except KeyError:
+        raise ValueError(
+            f"Motor de índice desconocido: {nombre!r} (opciones: {', '.join(MOTORES)})"
+        ) from None
@@ -10,9 +10,12 @@ from .obstaculo import Obstaculo
 class NodoAVL:
     """
     Nodo individual del árbol AVL que contiene un obstáculo.
-    Mantiene referencias a hijos, altura y factor de balance.
+    Mantiene referencias a hijos, altura, tamaño del subárbol, el mayor extremo
+    derecho de sus obstáculos (para consultas de solapamiento) y factor de balance.
     """
 
+    __slots__ = ("obstaculo", "izquierdo", "derecho", "altura", "tamaño", "fin_maximo")
+
     def __init__(self, obstaculo: Obstaculo) -> None:
         """
         Inicializa un nodo AVL con un obstáculo.
@@ -24,6 +27,8 @@ class NodoAVL:
         self.izquierdo: Optional["NodoAVL"] = None
         self.derecho: Optional["NodoAVL"] = None
         self.altura: int = 1
+        self.tamaño: int = 1  # Cantidad de nodos del subárbol con raíz en este nodo
+        self.fin_maximo: int = obstaculo.x + obstaculo.ancho  # Mayor x + ancho del subárbol
 
     def obtener_factor_balance(self) -> int:
         """
@@ -38,11 +43,30 @@ class NodoAVL:
 
     def actualizar_altura(self) -> None:
         """
-        Actualiza la altura del nodo basándose en las alturas de sus hijos.
+        Actualiza la altura, el tamaño y el fin máximo del subárbol basándose en los de sus hijos.
         """
-        altura_izq = self.izquierdo.altura if self.izquierdo else 0
-        altura_der = self.derecho.altura if self.derecho else 0
+        izquierdo = self.izquierdo
+        derecho = self.derecho
+        altura_izq = izquierdo.altura if izquierdo else 0
+        altura_der = derecho.altura if derecho else 0
         self.altura = 1 + max(altura_izq, altura_der)
+        self.tamaño = (
+            1
+            + (izquierdo.tamaño if izquierdo else 0)
+            + (derecho.tamaño if derecho else 0)
+        )
+        self.actualizar_fin_maximo()
+
+    def actualizar_fin_maximo(self) -> None:
+        """
+        Actualiza el mayor extremo derecho (x + ancho) de los obstáculos del subárbol.
+        """
+        fin = self.obstaculo.x + self.obstaculo.ancho
+        if self.izquierdo is not None and self.izquierdo.fin_maximo > fin:
+            fin = self.izquierdo.fin_maximo
+        if self.derecho is not None and self.derecho.fin_maximo > fin:
+            fin = self.derecho.fin_maximo
+        self.fin_maximo = fin
 
     def es_mayor_que(self, otro_obstaculo: Obstaculo) -> bool:
         """
@@ -5,6 +5,10 @@ Responsabilidad: Encapsular las propiedades y comportamiento de un obstáculo in
 
 from enum import Enum
 
+from .registro import obtener_registro
+
+_registro = obtener_registro("ventana")
+
 
 class TipoObstaculo(Enum):
     """Tipos de obstáculos disponibles en el juego."""
@@ -16,11 +20,18 @@ class TipoObstaculo(Enum):
     BARRERA = "barrera"
 
 
-class Obstaculo:
+class ObstaculoBase:
     """
-    Representa un obstáculo en el juego con posición, tipo y propiedades de daño.
+    Comportamiento común de los obstáculos: posición, tipo, daño y colisión.
+    Las subclases deciden cómo se guardan el ancho y el alto.
     """
 
+    __slots__ = ("x", "y", "tipo")
+
+    # Carriles válidos para la coordenada Y
+    CARRIL_MINIMO = 0
+    CARRIL_MAXIMO = 5
+
     # Configuración de daño por tipo de obstáculo
     DAÑO_POR_TIPO = {
         TipoObstaculo.ROCA: 20,
@@ -30,35 +41,6 @@ class Obstaculo:
         TipoObstaculo.BARRERA: 25,
     }
 
-    def __init__(
-        self,
-        x: int,
-        y: int,
-        tipo: TipoObstaculo,
-        ancho: int = 30,
-        alto: int = 30,
-    ) -> None:
-        """
-        Crea un nuevo obstáculo.
-
-        Args:
-            x (int): Posición X en la carretera (distancia)
-            y (int): Posición Y (carril: 0-5, donde 0,1,2=carriles inferiores y 3,4,5=carriles superiores)
-            tipo (TipoObstaculo): Tipo de obstáculo
-            ancho (int): Ancho del obstáculo en píxeles
-            alto (int): Alto del obstáculo en píxeles
-        """
-        self.x = x
-        self.y = y
-        self.tipo = tipo
-        self.ancho = ancho
-        
-        # Las barreras son más altas (ocupan 2 carriles de altura)
-        if tipo == TipoObstaculo.BARRERA:
-            self.alto = 100  # Doble altura para ocupar 2 carriles
-        else:
-            self.alto = alto
-            
     def es_barrera(self) -> bool:
         """
         Verifica si este obstáculo es una barrera.
@@ -117,9 +99,12 @@ class Obstaculo:
         en_rango_x = x_min <= self.x <= x_max
         en_rango_y = y_min <= self.y <= y_max
         
-        # Debugging para ver si está en rango
-        if en_rango_x and en_rango_y and (self.x - x_min < 100):  # Solo imprimir los que están cerca del límite
-            print(f"Obstáculo en rango: {self} - X: {x_min} <= {self.x} <= {x_max}, Y: {y_min} <= {self.y} <= {y_max}")
+        # Debugging para ver si está en rango (solo los que están cerca del límite)
+        if _registro.depurando and en_rango_x and en_rango_y and (self.x - x_min < 100):
+            _registro.depurar(
+                "Obstáculo en rango: %s - X: %s <= %s <= %s, Y: %s <= %s <= %s",
+                self, x_min, self.x, x_max, y_min, self.y, y_max,
+            )
             
         return en_rango_x and en_rango_y
 
@@ -146,12 +131,12 @@ class Obstaculo:
         Compara dos obstáculos por coordenadas.
 
         Args:
-            other (Obstaculo): Otro obstáculo a comparar
+            other (ObstaculoBase): Otro obstáculo a comparar
 
         Returns:
             bool: True si tienen las mismas coordenadas
         """
-        if not isinstance(other, Obstaculo):
+        if not isinstance(other, ObstaculoBase):
             return False
         return self.x == other.x and self.y == other.y
 
@@ -163,3 +148,81 @@ class Obstaculo:
             int: Hash del obstáculo
         """
         return hash((self.x, self.y))
+
+
+class Obstaculo(ObstaculoBase):
+    """
+    Representa un obstáculo en el juego con posición, tipo y propiedades de daño.
+    """
+
+    __slots__ = ("ancho", "alto")
+
+    def __init__(
+        self,
+        x: int,
+        y: int,
+        tipo: TipoObstaculo,
+        ancho: int = 30,
+        alto: int = 30,
+    ) -> None:
+        """
+        Crea un nuevo obstáculo.
+
+        Args:
+            x (int): Posición X en la carretera (distancia)
+            y (int): Posición Y (carril: 0-5, donde 0,1,2=carriles inferiores y 3,4,5=carriles superiores)
+            tipo (TipoObstaculo): Tipo de obstáculo
+            ancho (int): Ancho del obstáculo en píxeles
+            alto (int): Alto del obstáculo en píxeles
+        """
+        self.x = x
+        self.y = y
+        self.tipo = tipo
+        self.ancho = ancho
+        
+        # Las barreras son más altas (ocupan 2 carriles de altura)
+        if tipo == TipoObstaculo.BARRERA:
+            self.alto = 100  # Doble altura para ocupar 2 carriles
+        else:
+            self.alto = alto
+
+
+class ObstaculoCompacto(ObstaculoBase):
+    """
+    Obstáculo sin ancho ni alto propios: usa las dimensiones por defecto de su tipo.
+    Ocupa menos memoria que Obstaculo en circuitos con cientos de miles de obstáculos.
+    """
+
+    __slots__ = ()
+
+    # Dimensiones (ancho, alto) por tipo; las barreras ocupan 2 carriles de altura
+    DIMENSIONES_POR_TIPO = {
+        TipoObstaculo.ROCA: (30, 30),
+        TipoObstaculo.CONO: (30, 30),
+        TipoObstaculo.HUECO: (30, 30),
+        TipoObstaculo.ACEITE: (30, 30),
+        TipoObstaculo.BARRERA: (30, 100),
+    }
+
+    def __init__(self, x: int, y: int, tipo: TipoObstaculo) -> None:
+        """
+        Crea un nuevo obstáculo compacto.
+
+        Args:
+            x (int): Posición X en la carretera (distancia)
+            y (int): Posición Y (carril: 0-5)
+            tipo (TipoObstaculo): Tipo de obstáculo
+        """
+        self.x = x
+        self.y = y
+        self.tipo = tipo
+
+    @property
+    def ancho(self) -> int:
+        """Ancho por defecto del tipo de obstáculo, en píxeles."""
+        return self.DIMENSIONES_POR_TIPO[self.tipo][0]
+
+    @property
+    def alto(self) -> int:
+        """Alto por defecto del tipo de obstáculo, en píxeles."""
+        return self.DIMENSIONES_POR_TIPO[self.tipo][1]
@@ -0,0 +1,209 @@
+"""
+Perfilador de tiempos por fase de cada frame.
+Responsabilidad: Medir cuánto tarda cada fase de GestorJuego.actualizar y de
+PantallaJuego.dibujar, resumir los tiempos en percentiles móviles (p50/p95/p99) y
+guardarlos en JSON al terminar la partida.
+
+Uso (las fases se encadenan: cada registrar devuelve el inicio de la siguiente):
+    t = perfilador.marcar()
+    ...fase 1...
+    t = perfilador.registrar("actualizar.carrito", t)
+    ...fase 2...
+    perfilador.registrar("actualizar.ventana", t)
+
+Una fase repartida en varios tramos del frame se suma aparte y se registra una vez
+con agregar(fase, segundos).
+
+Desactivado, marcar, registrar y agregar apuntan a funciones vacías y no leen el reloj.
+"""
+
+import json
+import time
+from collections import deque
+from typing import Dict, List
+
+
+def _cero(*args) -> float:
+    """Reemplaza a marcar, registrar y agregar mientras el perfilador está desactivado."""
+    return 0.0
+
+
+class HistogramaMovil:
+    """
+    Últimas muestras de una fase, para percentiles, más totales de toda la partida.
+    """
+
+    __slots__ = ("muestras", "cantidad", "suma", "maximo")
+
+    def __init__(self, capacidad: int) -> None:
+        """
+        Crea un histograma vacío.
+
+        Args:
+            capacidad (int): Cantidad de muestras recientes que se conservan
+        """
+        self.muestras: deque = deque(maxlen=capacidad)
+        self.cantidad: int = 0
+        self.suma: float = 0.0
+        self.maximo: float = 0.0
+
+    def agregar(self, segundos: float) -> None:
+        """
+        Agrega una muestra.
+
+        Args:
+            segundos (float): Duración medida
+        """
+        self.muestras.append(segundos)
+        self.cantidad += 1
+        self.suma += segundos
+        if segundos > self.maximo:
+            self.maximo = segundos
+
+    def combinar(self, otro: "HistogramaMovil") -> None:
+        """
+        Suma las muestras de otro histograma (por ejemplo, de otra partida).
+
+        Args:
+            otro (HistogramaMovil): Histograma a sumar
+        """
+        self.muestras.extend(otro.muestras)
+        self.cantidad += otro.cantidad
+        self.suma += otro.suma
+        self.maximo = max(self.maximo, otro.maximo)
+
+    def percentiles(self, *cuantiles: float) -> List[float]:
+        """
+        Calcula percentiles (rango más cercano) sobre las muestras recientes.
+
+        Args:
+            *cuantiles (float): Percentiles pedidos, entre 0 y 100
+
+        Returns:
+            List[float]: Un valor en segundos por percentil pedido
+        """
+        ordenadas = sorted(self.muestras)
+        if not ordenadas:
+            return [0.0 for _ in cuantiles]
+        ultimo = len(ordenadas) - 1
+        return [ordenadas[min(ultimo, int(len(ordenadas) * q / 100))] for q in cuantiles]
+
+    def resumen(self) -> Dict[str, float]:
+        """
+        Resume el histograma en milisegundos.
+
+        Returns:
+            Dict[str, float]: p50, p95, p99 recientes y media y máximo de la partida
+        """
+        p50, p95, p99 = self.percentiles(50, 95, 99)
+        return {
+            "p50_ms": p50 * 1e3,
+            "p95_ms": p95 * 1e3,
+            "p99_ms": p99 * 1e3,
+            "media_ms": self.suma / self.cantidad * 1e3 if self.cantidad else 0.0,
+            "max_ms": self.maximo * 1e3,
+            "muestras": self.cantidad,
+        }
+
+
+class PerfiladorFrames:
+    """
+    Registra la duración de cada fase del frame en un HistogramaMovil por fase.
+    """
+
+    __slots__ = ("activo", "capacidad", "fases", "marcar", "registrar", "agregar")
+
+    def __init__(self, activo: bool = False, capacidad: int = 3600) -> None:
+        """
+        Crea el perfilador.
+
+        Args:
+            activo (bool): Si empieza midiendo
+            capacidad (int): Frames recientes usados para los percentiles (3600 = 1 min a 60 FPS)
+        """
+        self.capacidad = capacidad
+        self.fases: Dict[str, HistogramaMovil] = {}
+        self.activar(activo)
+
+    def activar(self, activo: bool = True) -> None:
+        """
+        Activa o desactiva la medición. Lo ya medido se conserva.
+
+        Args:
+            activo (bool): True para medir
+        """
+        self.activo = activo
+        self.marcar = time.perf_counter if activo else _cero
+        self.registrar = self._registrar if activo else _cero
+        self.agregar = self._agregar if activo else _cero
+
+    def _registrar(self, fase: str, inicio: float) -> float:
+        """
+        Registra la duración de una fase.
+
+        Args:
+            fase (str): Nombre de la fase ("actualizar.carrito", "dibujar.hud", ...)
+            inicio (float): Valor de marcar() al empezar la fase
+
+        Returns:
+            float: Instante actual, que sirve de inicio para la fase siguiente
+        """
+        ahora = time.perf_counter()
+        self._agregar(fase, ahora - inicio)
+        return ahora
+
+    def _agregar(self, fase: str, segundos: float) -> float:
+        """
+        Registra una duración ya medida, por ejemplo la suma de varios tramos.
+
+        Args:
+            fase (str): Nombre de la fase
+            segundos (float): Duración de la fase en este frame
+
+        Returns:
+            float: La misma duración
+        """
+        histograma = self.fases.get(fase)
+        if histograma is None:
+            histograma = self.fases[fase] = HistogramaMovil(self.capacidad)
+        histograma.agregar(segundos)
+        return segundos
+
+    def limpiar(self) -> None:
+        """Descarta todas las mediciones."""
+        self.fases.clear()
+
+    def combinar(self, otro: "PerfiladorFrames") -> None:
+        """
+        Suma las mediciones de otro perfilador, fase por fase.
+
+        Args:
+            otro (PerfiladorFrames): Perfilador a sumar
+        """
+        for fase, histograma in otro.fases.items():
+            if fase not in self.fases:
+                self.fases[fase] = HistogramaMovil(self.capacidad)
+            self.fases[fase].combinar(histograma)
+
+    def resumen(self) -> Dict[str, Dict[str, float]]:
+        """
+        Resume todas las fases medidas.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Resumen de HistogramaMovil por fase, en orden de aparición
+        """
+        return {fase: histograma.resumen() for fase, histograma in self.fases.items()}
+
+    def guardar(self, ruta: str) -> None:
+        """
+        Guarda el resumen en un archivo JSON.
+
+        Args:
+            ruta (str): Ruta del archivo
+
+        Raises:
+            OSError: Si no se pudo escribir el archivo
+        """
+        documento = {"capacidad": self.capacidad, "fases": self.resumen()}
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            json.dump(documento, archivo, indent=2, ensure_ascii=False)
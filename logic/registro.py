@@ -0,0 +1,189 @@
+"""
+Registro de mensajes del juego por niveles y categorías.
+Responsabilidad: Reemplazar los print de depuración por un registro central sobre el
+módulo logging, con filtros por categoría y llamadas desactivadas que no cuestan nada.
+
+Uso:
+    _registro = obtener_registro("colisiones")
+    _registro.informar("Choque con %s, daño %d", obstaculo, daño)   # formatea solo si se emite
+    if _registro.depurando:                                         # guarda para caminos calientes
+        _registro.depurar("Rectángulo: %s", rect)
+
+Configuración: configurar(...) o la variable de entorno CARRITOS_REGISTRO, por ejemplo
+    CARRITOS_REGISTRO=aviso                        (nivel global)
+    CARRITOS_REGISTRO=info,colisiones=depuracion   (nivel global y por categoría)
+"""
+
+import contextlib
+import logging
+import os
+import sys
+from typing import Dict, Iterator, Optional
+
+# Nombre del logger padre de todas las categorías
+RAIZ = "carritos"
+
+NIVELES: Dict[str, int] = {
+    "depuracion": logging.DEBUG,
+    "info": logging.INFO,
+    "aviso": logging.WARNING,
+    "error": logging.ERROR,
+}
+
+NIVEL_POR_DEFECTO = "info"
+VARIABLE_ENTORNO = "CARRITOS_REGISTRO"
+
+
+def _nada(*args, **kwargs) -> None:
+    """Reemplaza a los métodos de los niveles desactivados."""
+
+
+class _ManejadorConsola(logging.StreamHandler):
+    """Escribe en el sys.stdout vigente, así redirect_stdout también lo captura."""
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, valor) -> None:
+        pass
+
+
+class Registro:
+    """
+    Registro de una categoría.
+    Los métodos de los niveles desactivados apuntan a una función vacía y los argumentos
+    se formatean solo al emitir. `depurando` permite saltarse incluso la llamada en los
+    caminos que se ejecutan cada frame.
+    """
+
+    __slots__ = ("categoria", "_logger", "depurando", "depurar", "informar", "avisar", "error")
+
+    def __init__(self, categoria: str) -> None:
+        """
+        Crea el registro de una categoría.
+
+        Args:
+            categoria (str): Nombre de la categoría ("colisiones", "ventana", ...)
+        """
+        self.categoria = categoria
+        self._logger = logging.getLogger(f"{RAIZ}.{categoria}")
+        self._actualizar()
+
+    def _actualizar(self) -> None:
+        """Vuelve a enlazar los métodos según los niveles activos."""
+        logger = self._logger
+        self.depurando = logger.isEnabledFor(logging.DEBUG)
+        self.depurar = logger.debug if self.depurando else _nada
+        self.informar = logger.info if logger.isEnabledFor(logging.INFO) else _nada
+        self.avisar = logger.warning if logger.isEnabledFor(logging.WARNING) else _nada
+        self.error = logger.error if logger.isEnabledFor(logging.ERROR) else _nada
+
+
+_registros: Dict[str, Registro] = {}
+
+
+def obtener_registro(categoria: str) -> Registro:
+    """
+    Obtiene (o crea) el registro de una categoría.
+
+    Args:
+        categoria (str): Nombre de la categoría
+
+    Returns:
+        Registro: Registro compartido de esa categoría
+    """
+    registro = _registros.get(categoria)
+    if registro is None:
+        registro = _registros[categoria] = Registro(categoria)
+    return registro
+
+
+def _nivel(nombre: str) -> int:
+    """Convierte un nombre de nivel en su valor de logging."""
+    if nombre not in NIVELES:
+        raise ValueError(f"Nivel desconocido: {nombre!r} (opciones: {', '.join(NIVELES)})")
+    return NIVELES[nombre]
+
+
+def _actualizar_registros() -> None:
+    """Aplica la configuración vigente a todos los registros creados."""
+    for registro in _registros.values():
+        registro._actualizar()
+
+
+def configurar(nivel: str = NIVEL_POR_DEFECTO, categorias: Optional[Dict[str, str]] = None) -> None:
+    """
+    Fija el nivel global y, opcionalmente, niveles propios de algunas categorías.
+    Las categorías no mencionadas vuelven al nivel global.
+
+    Args:
+        nivel (str): Nivel global (una de las claves de NIVELES)
+        categorias (Optional[Dict[str, str]]): Nivel por categoría
+
+    Raises:
+        ValueError: Si algún nivel no existe
+    """
+    categorias = {categoria: _nivel(valor) for categoria, valor in (categorias or {}).items()}
+    raiz = logging.getLogger(RAIZ)
+    raiz.setLevel(_nivel(nivel))
+    for nombre, logger in list(logging.root.manager.loggerDict.items()):
+        if nombre.startswith(f"{RAIZ}.") and isinstance(logger, logging.Logger):
+            logger.setLevel(logging.NOTSET)
+    for categoria, valor in categorias.items():
+        logging.getLogger(f"{RAIZ}.{categoria}").setLevel(valor)
+    _actualizar_registros()
+
+
+def configurar_desde_texto(texto: str) -> None:
+    """
+    Configura el registro con el formato de CARRITOS_REGISTRO: "nivel,categoria=nivel,...".
+
+    Args:
+        texto (str): Especificación de niveles
+
+    Raises:
+        ValueError: Si algún nivel no existe
+    """
+    nivel = NIVEL_POR_DEFECTO
+    categorias = {}
+    for parte in filter(None, (p.strip() for p in texto.split(","))):
+        if "=" in parte:
+            categoria, valor = parte.split("=", 1)
+            categorias[categoria.strip()] = valor.strip()
+        else:
+            nivel = parte
+    configurar(nivel, categorias)
+
+
+@contextlib.contextmanager
+def silenciado(hasta: str = "aviso") -> Iterator[None]:
+    """
+    Desactiva temporalmente todos los mensajes hasta el nivel dado, inclusive.
+
+    Args:
+        hasta (str): Nivel más alto que se silencia
+    """
+    anterior = logging.root.manager.disable
+    logging.disable(_nivel(hasta))
+    _actualizar_registros()
+    try:
+        yield
+    finally:
+        logging.disable(anterior)
+        _actualizar_registros()
+
+
+def _inicializar() -> None:
+    """Conecta el registro a la consola con el formato de los antiguos print."""
+    raiz = logging.getLogger(RAIZ)
+    raiz.propagate = False
+    if not raiz.handlers:
+        manejador = _ManejadorConsola()
+        manejador.setFormatter(logging.Formatter("%(message)s"))
+        raiz.addHandler(manejador)
+    configurar_desde_texto(os.environ.get(VARIABLE_ENTORNO, NIVEL_POR_DEFECTO))
+
+
+_inicializar()
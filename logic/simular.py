@@ -0,0 +1,273 @@
+"""
+Simulación del juego sin ventana ni pygame.
+Responsabilidad: Ejecutar partidas completas con GestorJuego.actualizar a paso fijo, tan
+rápido como permita la CPU, con una política de entrada guionada o aleatoria, y reportar
+frames por segundo, ticks por partida y estadísticas finales.
+
+Ejecutar con: uv run python -m logic.simular [--partidas 100] [--politica aleatoria] [--guion guion.json]
+"""
+
+import argparse
+import contextlib
+import json
+import random
+import time
+from typing import Any, Dict, List, Optional
+
+from .gestor_juego import EstadoJuego, GestorJuego
+from .perfilador import PerfiladorFrames
+from .registro import silenciado
+
+# Acciones de entrada: nombres de los métodos del carrito que llaman las teclas en main.py
+ACCIONES = ("mover_arriba", "mover_abajo", "saltar")
+
+
+class PoliticaEntrada:
+    """Decide qué acción del jugador aplicar en cada tick (por defecto, ninguna)."""
+
+    def reiniciar(self) -> None:
+        """Vuelve la política a su estado inicial antes de una partida nueva."""
+
+    def decidir(self, gestor: GestorJuego, tick: int) -> Optional[str]:
+        """
+        Elige la acción del tick.
+
+        Args:
+            gestor (GestorJuego): Juego en curso
+            tick (int): Número de tick, desde 0
+
+        Returns:
+            Optional[str]: Una de ACCIONES, o None para no hacer nada
+        """
+        return None
+
+
+class PoliticaAleatoria(PoliticaEntrada):
+    """Aprieta una tecla al azar en una fracción de los ticks."""
+
+    def __init__(self, semilla: Optional[int] = None, probabilidad: float = 0.05) -> None:
+        """
+        Crea la política.
+
+        Args:
+            semilla (Optional[int]): Semilla para partidas reproducibles
+            probabilidad (float): Probabilidad de actuar en cada tick
+        """
+        self.semilla = semilla
+        self.probabilidad = probabilidad
+        self._aleatorio = random.Random(semilla)
+
+    def decidir(self, gestor: GestorJuego, tick: int) -> Optional[str]:
+        """Elige una acción al azar con la probabilidad configurada."""
+        if self._aleatorio.random() < self.probabilidad:
+            return self._aleatorio.choice(ACCIONES)
+        return None
+
+
+class PoliticaGuion(PoliticaEntrada):
+    """Repite un guion fijo de acciones por número de tick."""
+
+    def __init__(self, guion: Dict[int, str]) -> None:
+        """
+        Crea la política.
+
+        Args:
+            guion (Dict[int, str]): Acción a aplicar en cada tick indicado
+
+        Raises:
+            ValueError: Si el guion contiene una acción desconocida
+        """
+        desconocidas = set(guion.values()) - set(ACCIONES)
+        if desconocidas:
+            raise ValueError(f"Acciones desconocidas en el guion: {sorted(desconocidas)}")
+        self.guion = guion
+
+    @classmethod
+    def desde_archivo(cls, ruta: str) -> "PoliticaGuion":
+        """
+        Carga un guion JSON: un objeto {"tick": "accion"} o una lista de [tick, "accion"].
+
+        Args:
+            ruta (str): Ruta al archivo del guion
+
+        Returns:
+            PoliticaGuion: Política con el guion cargado
+        """
+        with open(ruta, "r", encoding="utf-8") as archivo:
+            datos = json.load(archivo)
+        pares = datos.items() if isinstance(datos, dict) else datos
+        return cls({int(tick): accion for tick, accion in pares})
+
+    def decidir(self, gestor: GestorJuego, tick: int) -> Optional[str]:
+        """Devuelve la acción guionada para el tick, si la hay."""
+        return self.guion.get(tick)
+
+
+POLITICAS = ("ninguna", "aleatoria", "guion")
+
+
+def crear_politica(nombre: str, semilla: int = 0, guion: Optional[str] = None) -> PoliticaEntrada:
+    """
+    Crea una política de entrada por nombre.
+
+    Args:
+        nombre (str): Una de POLITICAS
+        semilla (int): Semilla de la política aleatoria
+        guion (Optional[str]): Ruta al guion JSON de la política guionada
+
+    Returns:
+        PoliticaEntrada: Política lista para una partida
+
+    Raises:
+        ValueError: Si la política no existe o falta el guion
+    """
+    if nombre == "aleatoria":
+        return PoliticaAleatoria(semilla)
+    if nombre == "guion":
+        if not guion:
+            raise ValueError("La política guion requiere un archivo de guion")
+        return PoliticaGuion.desde_archivo(guion)
+    if nombre == "ninguna":
+        return PoliticaEntrada()
+    raise ValueError(f"Política desconocida: {nombre!r} (opciones: {', '.join(POLITICAS)})")
+
+
+def simular_partida(
+    gestor: GestorJuego,
+    politica: PoliticaEntrada,
+    paso: float = 1 / 60,
+    max_ticks: int = 1_000_000,
+) -> Dict[str, Any]:
+    """
+    Juega una partida completa a paso fijo sobre un gestor ya configurado.
+
+    Args:
+        gestor (GestorJuego): Juego con la configuración y los obstáculos cargados
+        politica (PoliticaEntrada): Política que decide la entrada en cada tick
+        paso (float): Delta de tiempo fijo por tick, en segundos
+        max_ticks (int): Corta la partida si no terminó antes
+
+    Returns:
+        Dict[str, Any]: ticks, segundos de CPU, fps y las estadísticas finales del juego
+    """
+    politica.reiniciar()
+    gestor.inicializar_juego()
+
+    tick = 0
+    inicio = time.perf_counter()
+    while gestor.estado_actual == EstadoJuego.JUGANDO and tick < max_ticks:
+        accion = politica.decidir(gestor, tick)
+        if accion is not None:
+            getattr(gestor.carrito, accion)()
+        gestor.actualizar(paso)
+        tick += 1
+    segundos = time.perf_counter() - inicio
+
+    return {
+        "ticks": tick,
+        "segundos": segundos,
+        "fps": tick / segundos if segundos > 0 else float("inf"),
+        "estadisticas": gestor.obtener_estadisticas(),
+    }
+
+
+def simular(
+    archivo_configuracion: str,
+    partidas: int,
+    crear_politica,
+    paso: float = 1 / 60,
+    max_ticks: int = 1_000_000,
+    silencioso: bool = True,
+    perfilador: Optional[PerfiladorFrames] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Juega varias partidas, cada una con un GestorJuego recién cargado.
+
+    Args:
+        archivo_configuracion (str): Ruta al JSON de configuración
+        partidas (int): Cantidad de partidas
+        crear_politica: Función (número de partida) -> PoliticaEntrada
+        paso (float): Delta de tiempo fijo por tick
+        max_ticks (int): Límite de ticks por partida
+        silencioso (bool): Si True, desactiva los mensajes del juego salvo los errores
+        perfilador (Optional[PerfiladorFrames]): Si se da, acumula los tiempos por fase de todas las partidas
+
+    Returns:
+        List[Dict[str, Any]]: Resultado de cada partida
+
+    Raises:
+        ValueError: Si la configuración no se pudo cargar
+    """
+    resultados = []
+    with silenciado() if silencioso else contextlib.nullcontext():
+        for numero in range(partidas):
+            gestor = GestorJuego(archivo_configuracion)
+            if not gestor.cargar_configuracion():
+                raise ValueError(f"No se pudo cargar la configuración {archivo_configuracion}")
+            if perfilador is not None:
+                gestor.perfilador.activar(True)
+                gestor.archivo_perfil = ""
+            resultados.append(simular_partida(gestor, crear_politica(numero), paso, max_ticks))
+            if perfilador is not None:
+                perfilador.combinar(gestor.perfilador)
+    return resultados
+
+
+def main() -> None:
+    """Punto de entrada por línea de comandos."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--config", default="data/configuracion.json")
+    parser.add_argument("--partidas", type=int, default=1)
+    parser.add_argument("--politica", choices=POLITICAS, default="aleatoria")
+    parser.add_argument("--guion", help="JSON con las acciones por tick (para --politica guion)")
+    parser.add_argument("--semilla", type=int, default=0, help="Semilla de la primera partida aleatoria")
+    parser.add_argument("--paso", type=float, default=1 / 60, help="Delta de tiempo fijo por tick")
+    parser.add_argument("--max-ticks", type=int, default=1_000_000)
+    parser.add_argument("--perfilar", action="store_true", help="Mostrar percentiles por fase de actualizar")
+    parser.add_argument("--verbose", action="store_true", help="Mostrar los mensajes del juego (ver logic.registro)")
+    args = parser.parse_args()
+
+    if args.politica == "guion" and not args.guion:
+        parser.error("--politica guion requiere --guion")
+
+    perfilador = PerfiladorFrames(capacidad=1_000_000) if args.perfilar else None
+    resultados = simular(
+        args.config,
+        args.partidas,
+        lambda numero: crear_politica(args.politica, args.semilla + numero, args.guion),
+        args.paso,
+        args.max_ticks,
+        not args.verbose,
+        perfilador,
+    )
+
+    print(f"{'#':>5} | {'ticks':>7} | {'fps':>9} | {'estado':>15} | {'distancia':>9} | {'energía %':>9} | {'puntos':>8}")
+    print("-" * 80)
+    for numero, resultado in enumerate(resultados):
+        estadisticas = resultado["estadisticas"]
+        print(
+            f"{numero:>5} | {resultado['ticks']:>7} | {resultado['fps']:>9.0f} | "
+            f"{estadisticas['estado_juego']:>15} | {estadisticas['distancia_recorrida']:>9.0f} | "
+            f"{estadisticas['energia_porcentaje']:>9.1f} | {estadisticas['puntuacion']:>8.1f}"
+        )
+
+    ticks = sum(r["ticks"] for r in resultados)
+    segundos = sum(r["segundos"] for r in resultados)
+    print(
+        f"\n{len(resultados)} partidas, {ticks} ticks en {segundos:.3f} s: "
+        f"{ticks / segundos if segundos else float('inf'):.0f} ticks/s, "
+        f"{ticks / len(resultados):.0f} ticks por partida"
+    )
+
+    if perfilador is not None:
+        print(f"\n{'fase':<24} | {'p50 µs':>8} | {'p95 µs':>8} | {'p99 µs':>8} | {'máx µs':>8}")
+        print("-" * 68)
+        for fase, datos in perfilador.resumen().items():
+            print(
+                f"{fase:<24} | {datos['p50_ms'] * 1e3:>8.1f} | {datos['p95_ms'] * 1e3:>8.1f} | "
+                f"{datos['p99_ms'] * 1e3:>8.1f} | {datos['max_ms'] * 1e3:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+Simulación en lote de partidas sin ventana, repartida en varios procesos.
+Responsabilidad: Jugar todas las combinaciones (pista, política, semilla) en un
+ProcessPoolExecutor y escribir el resultado de cada partida en CSV o JSONL a medida que
+llega, para balancear pistas simulando miles de partidas.
+
+Ejecutar con: uv run python -m logic.simular_lote --cursos data/configuracion.json --politicas aleatoria guion:guion.json --semillas 1000 --salida lote.jsonl
+"""
+
+import argparse
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from typing import Any, Dict, Iterator, List, Tuple
+
+from .gestor_juego import GestorJuego
+from .registro import configurar
+from .simular import POLITICAS, crear_politica, simular_partida
+
+# Columnas de cada fila de resultados, en el orden del CSV
+CAMPOS = (
+    "curso",
+    "politica",
+    "semilla",
+    "estado",
+    "puntuacion",
+    "distancia",
+    "colisiones",
+    "energia_porcentaje",
+    "ticks",
+    "segundos",
+)
+
+# Trabajo: (archivo de pista, política "nombre" o "guion:ruta", semilla)
+Trabajo = Tuple[str, str, int]
+
+
+def generar_trabajos(cursos: List[str], politicas: List[str], semillas: range) -> List[Trabajo]:
+    """
+    Arma todas las combinaciones de pista, política y semilla.
+
+    Args:
+        cursos (List[str]): Archivos de configuración con las pistas
+        politicas (List[str]): Políticas: "ninguna", "aleatoria" o "guion:ruta.json"
+        semillas (range): Semillas de cada combinación
+
+    Returns:
+        List[Trabajo]: Un trabajo por partida
+
+    Raises:
+        ValueError: Si alguna política no existe
+    """
+    for politica in politicas:
+        nombre = politica.split(":", 1)[0]
+        if nombre not in POLITICAS:
+            raise ValueError(f"Política desconocida: {politica!r} (opciones: {', '.join(POLITICAS)})")
+    return list(product(cursos, politicas, semillas))
+
+
+def _silenciar_proceso() -> None:
+    """Deja solo los errores del juego en cada proceso trabajador."""
+    configurar("error")
+
+
+def jugar_trabajo(trabajo: Trabajo, paso: float = 1 / 60, max_ticks: int = 1_000_000) -> Dict[str, Any]:
+    """
+    Juega una partida de un trabajo y la resume en una fila de resultados.
+
+    Args:
+        trabajo (Trabajo): Pista, política y semilla
+        paso (float): Delta de tiempo fijo por tick
+        max_ticks (int): Límite de ticks de la partida
+
+    Returns:
+        Dict[str, Any]: Fila con las columnas de CAMPOS
+
+    Raises:
+        ValueError: Si la configuración no se pudo cargar
+    """
+    curso, politica, semilla = trabajo
+    nombre, _, guion = politica.partition(":")
+
+    gestor = GestorJuego(curso)
+    if not gestor.cargar_configuracion():
+        raise ValueError(f"No se pudo cargar la configuración {curso}")
+    gestor.archivo_perfil = ""  # Miles de partidas: ningún perfil por partida
+    resultado = simular_partida(gestor, crear_politica(nombre, semilla, guion or None), paso, max_ticks)
+
+    estadisticas = resultado["estadisticas"]
+    return {
+        "curso": curso,
+        "politica": politica,
+        "semilla": semilla,
+        "estado": estadisticas["estado_juego"],
+        "puntuacion": estadisticas["puntuacion"],
+        "distancia": estadisticas["distancia_recorrida"],
+        "colisiones": estadisticas["colisiones"],
+        "energia_porcentaje": estadisticas["energia_porcentaje"],
+        "ticks": resultado["ticks"],
+        "segundos": resultado["segundos"],
+    }
+
+
+def _jugar_con_parametros(argumentos: Tuple[Trabajo, float, int]) -> Dict[str, Any]:
+    """Adaptador de jugar_trabajo para ProcessPoolExecutor.map."""
+    return jugar_trabajo(*argumentos)
+
+
+def simular_lote(
+    trabajos: List[Trabajo],
+    procesos: int = None,
+    paso: float = 1 / 60,
+    max_ticks: int = 1_000_000,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Juega los trabajos en paralelo y entrega cada fila en el orden de los trabajos.
+    Los trabajos viajan a los procesos en bloques para que el costo de comunicación
+    no domine en partidas cortas.
+
+    Args:
+        trabajos (List[Trabajo]): Partidas a jugar
+        procesos (int): Procesos trabajadores (None = uno por núcleo)
+        paso (float): Delta de tiempo fijo por tick
+        max_ticks (int): Límite de ticks por partida
+
+    Yields:
+        Dict[str, Any]: Fila de resultados de cada partida
+    """
+    procesos = procesos or os.cpu_count() or 1
+    bloque = max(1, len(trabajos) // (procesos * 8))
+    argumentos = ((trabajo, paso, max_ticks) for trabajo in trabajos)
+    with ProcessPoolExecutor(max_workers=procesos, initializer=_silenciar_proceso) as ejecutor:
+        yield from ejecutor.map(_jugar_con_parametros, argumentos, chunksize=bloque)
+
+
+def main() -> None:
+    """Punto de entrada por línea de comandos."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cursos", nargs="+", default=["data/configuracion.json"])
+    parser.add_argument("--politicas", nargs="+", default=["aleatoria"], help="ninguna, aleatoria o guion:ruta.json")
+    parser.add_argument("--semillas", type=int, default=100, help="Semillas por pista y política")
+    parser.add_argument("--semilla-inicial", type=int, default=0)
+    parser.add_argument("--procesos", type=int, default=None, help="Por defecto, uno por núcleo")
+    parser.add_argument("--paso", type=float, default=1 / 60)
+    parser.add_argument("--max-ticks", type=int, default=1_000_000)
+    parser.add_argument("--salida", default="lote.jsonl", help="Extensión .csv o .jsonl")
+    args = parser.parse_args()
+
+    semillas = range(args.semilla_inicial, args.semilla_inicial + args.semillas)
+    try:
+        trabajos = generar_trabajos(args.cursos, args.politicas, semillas)
+    except ValueError as e:
+        parser.error(str(e))
+    formato_csv = args.salida.endswith(".csv")
+
+    partidas = ticks = 0
+    inicio = time.perf_counter()
+    with open(args.salida, "w", encoding="utf-8", newline="") as archivo:
+        if formato_csv:
+            escritor = csv.DictWriter(archivo, fieldnames=CAMPOS)
+            escritor.writeheader()
+        for fila in simular_lote(trabajos, args.procesos, args.paso, args.max_ticks):
+            if formato_csv:
+                escritor.writerow(fila)
+            else:
+                archivo.write(json.dumps(fila, ensure_ascii=False) + "\n")
+            partidas += 1
+            ticks += fila["ticks"]
+            if partidas % 100 == 0:
+                archivo.flush()
+                print(f"{partidas}/{len(trabajos)} partidas", end="\r", flush=True)
+    duracion = time.perf_counter() - inicio
+
+    print(
+        f"{partidas} partidas en {duracion:.2f} s: {partidas / duracion:.1f} partidas/s, "
+        f"{ticks / duracion:.0f} ticks/s -> {args.salida}"
+    )
+
+
+if __name__ == "__main__":
+    main()
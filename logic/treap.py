@@ -0,0 +1,213 @@
+"""
+Treap (árbol binario de búsqueda con prioridades aleatorias) para gestionar obstáculos.
+Responsabilidad: Motor alternativo de IndiceObstaculos cuya división por clave es
+O(log n) esperado, lo que abarata eliminar_hasta.
+"""
+
+import math
+import random
+from typing import Optional, Tuple
+
+from .indice_obstaculos import IndiceArbolBinario, NodoBinario, ResultadoOperacion
+from .obstaculo import Obstaculo
+
+
+class NodoTreap(NodoBinario):
+    """Nodo del treap: ordenado por clave como un ABB y por prioridad como un montículo."""
+
+    __slots__ = ("prioridad",)
+
+    def __init__(self, obstaculo: Obstaculo, prioridad: float) -> None:
+        """
+        Inicializa un nodo hoja.
+
+        Args:
+            obstaculo (Obstaculo): Obstáculo a almacenar en este nodo
+            prioridad (float): Prioridad aleatoria; los padres tienen prioridad mayor
+        """
+        super().__init__(obstaculo)
+        self.prioridad: float = prioridad
+
+
+class Treap(IndiceArbolBinario):
+    """
+    Treap con montículo de máximos sobre prioridades aleatorias: la forma del árbol es la
+    de un ABB construido en orden aleatorio, con altura O(log n) esperada.
+    """
+
+    def __init__(self, indice_por_carril: bool = False, semilla: Optional[int] = None) -> None:
+        """
+        Inicializa un treap vacío.
+
+        Args:
+            indice_por_carril (bool): Se ignora; este motor no tiene índice por carril
+            semilla (Optional[int]): Semilla de las prioridades, para resultados reproducibles
+        """
+        super().__init__(indice_por_carril)
+        self._aleatorio = random.Random(semilla)
+
+    def insertar_con_resultado(self, obstaculo: Obstaculo) -> ResultadoOperacion:
+        """
+        Inserta un obstáculo como hoja y lo sube rotando mientras su prioridad sea mayor.
+
+        Args:
+            obstaculo (Obstaculo): Obstáculo a insertar
+
+        Returns:
+            ResultadoOperacion: INSERTADO o DUPLICADO
+        """
+        nuevo = NodoTreap(obstaculo, self._aleatorio.random())
+        self.raiz, insertado = self._insertar_recursivo(self.raiz, nuevo)
+        if not insertado:
+            return ResultadoOperacion.DUPLICADO
+
+        self.total_obstaculos += 1
+        self.version += 1
+        if obstaculo.ancho > self.ancho_maximo:
+            self.ancho_maximo = obstaculo.ancho
+        return ResultadoOperacion.INSERTADO
+
+    def _insertar_recursivo(
+        self, nodo: Optional[NodoTreap], nuevo: NodoTreap
+    ) -> Tuple[NodoTreap, bool]:
+        """
+        Inserta un nodo en el subárbol y restaura el orden de montículo al volver.
+
+        Args:
+            nodo (Optional[NodoTreap]): Raíz del subárbol
+            nuevo (NodoTreap): Nodo a insertar
+
+        Returns:
+            Tuple[NodoTreap, bool]: Nueva raíz del subárbol y si se insertó
+        """
+        if nodo is None:
+            return nuevo, True
+
+        actual = nodo.obstaculo
+        x = nuevo.obstaculo.x
+        y = nuevo.obstaculo.y
+        if x == actual.x and y == actual.y:
+            return nodo, False
+
+        if x < actual.x or (x == actual.x and y < actual.y):
+            nodo.izquierdo, insertado = self._insertar_recursivo(nodo.izquierdo, nuevo)
+            if nodo.izquierdo.prioridad > nodo.prioridad:
+                nodo = self._rotar_derecha(nodo)
+        else:
+            nodo.derecho, insertado = self._insertar_recursivo(nodo.derecho, nuevo)
+            if nodo.derecho.prioridad > nodo.prioridad:
+                nodo = self._rotar_izquierda(nodo)
+        return nodo, insertado
+
+    def eliminar_con_resultado(self, obstaculo: Obstaculo) -> ResultadoOperacion:
+        """
+        Elimina un obstáculo reemplazando su nodo por la unión de sus dos subárboles.
+
+        Args:
+            obstaculo (Obstaculo): Obstáculo a eliminar
+
+        Returns:
+            ResultadoOperacion: ELIMINADO o AUSENTE
+        """
+        x = obstaculo.x
+        y = obstaculo.y
+        padre: Optional[NodoTreap] = None
+        nodo = self.raiz
+        while nodo is not None:
+            actual = nodo.obstaculo
+            if x == actual.x and y == actual.y:
+                break
+            padre = nodo
+            nodo = nodo.izquierdo if x < actual.x or (x == actual.x and y < actual.y) else nodo.derecho
+
+        if nodo is None:
+            return ResultadoOperacion.AUSENTE
+
+        reemplazo = self._unir(nodo.izquierdo, nodo.derecho)
+        if padre is None:
+            self.raiz = reemplazo
+        elif padre.izquierdo is nodo:
+            padre.izquierdo = reemplazo
+        else:
+            padre.derecho = reemplazo
+        self.total_obstaculos -= 1
+        self.version += 1
+        return ResultadoOperacion.ELIMINADO
+
+    def eliminar_hasta(self, x: float) -> "Treap":
+        """
+        Elimina todos los obstáculos con coordenada X menor o igual a `x` con una
+        sola división del treap: O(log n) esperado más contar los k separados.
+
+        Args:
+            x (float): Límite X (inclusivo) de los obstáculos a eliminar
+
+        Returns:
+            Treap: Treap con los obstáculos eliminados
+        """
+        separado = Treap()
+        separado.raiz, self.raiz = self._dividir(self.raiz, (x, math.inf))
+        separado.total_obstaculos = sum(1 for _ in separado.iterar_desde((-math.inf, -math.inf), math.inf))
+        separado.ancho_maximo = self.ancho_maximo
+        self.total_obstaculos -= separado.total_obstaculos
+        if separado.total_obstaculos:
+            self.version += 1
+        return separado
+
+    def _dividir(
+        self, nodo: Optional[NodoTreap], clave: Tuple[float, float]
+    ) -> Tuple[Optional[NodoTreap], Optional[NodoTreap]]:
+        """
+        Divide un subárbol en las claves menores que `clave` y las mayores o iguales.
+
+        Args:
+            nodo (Optional[NodoTreap]): Raíz del subárbol
+            clave (Tuple[float, float]): Clave de corte (x, y)
+
+        Returns:
+            Tuple: Raíces de los subárboles (claves < clave, claves >= clave)
+        """
+        if nodo is None:
+            return None, None
+        if (nodo.obstaculo.x, nodo.obstaculo.y) < clave:
+            nodo.derecho, mayores = self._dividir(nodo.derecho, clave)
+            return nodo, mayores
+        menores, nodo.izquierdo = self._dividir(nodo.izquierdo, clave)
+        return menores, nodo
+
+    def _unir(
+        self, izquierdo: Optional[NodoTreap], derecho: Optional[NodoTreap]
+    ) -> Optional[NodoTreap]:
+        """
+        Une dos treaps cuyas claves izquierdas son todas menores que las derechas.
+
+        Args:
+            izquierdo (Optional[NodoTreap]): Treap con las claves menores
+            derecho (Optional[NodoTreap]): Treap con las claves mayores
+
+        Returns:
+            Optional[NodoTreap]: Raíz del treap unido
+        """
+        if izquierdo is None:
+            return derecho
+        if derecho is None:
+            return izquierdo
+        if izquierdo.prioridad > derecho.prioridad:
+            izquierdo.derecho = self._unir(izquierdo.derecho, derecho)
+            return izquierdo
+        derecho.izquierdo = self._unir(izquierdo, derecho.izquierdo)
+        return derecho
+
+    def _rotar_derecha(self, nodo: NodoTreap) -> NodoTreap:
+        """Rotación a la derecha; devuelve la nueva raíz del subárbol."""
+        hijo = nodo.izquierdo
+        nodo.izquierdo = hijo.derecho
+        hijo.derecho = nodo
+        return hijo
+
+    def _rotar_izquierda(self, nodo: NodoTreap) -> NodoTreap:
+        """Rotación a la izquierda; devuelve la nueva raíz del subárbol."""
+        hijo = nodo.derecho
+        nodo.derecho = hijo.izquierdo
+        hijo.izquierdo = nodo
+        return hijo
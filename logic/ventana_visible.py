@@ -0,0 +1,101 @@
+"""
+Ventana deslizante con los obstáculos visibles delante del carrito.
+Responsabilidad: Mantener el conjunto visible de forma incremental y reportar qué entró y qué salió.
+"""
+
+import math
+from collections import deque
+from typing import Deque, List, Optional, Set, Tuple
+
+from .indice_obstaculos import IndiceObstaculos
+from .obstaculo import Obstaculo
+
+
+class VentanaVisible:
+    """
+    Ventana [x_min, x_max] que solo avanza hacia adelante sobre el recorrido en orden del árbol.
+    Guarda un cursor con la clave (x, y) del último obstáculo que entró, así cada frame
+    solo recorre los obstáculos nuevos y saca por el frente los que quedaron atrás.
+    Las claves visibles se mantienen también en un conjunto, con un contador de versión
+    que sube cada vez que el conjunto cambia.
+    """
+
+    def __init__(self) -> None:
+        """Inicializa una ventana vacía."""
+        self.obstaculos: Deque[Obstaculo] = deque()  # Visibles, ordenados por (x, y)
+        self.claves: Set[Tuple[float, float]] = set()  # Claves (x, y) de los visibles
+        self.version: int = 0
+        self._cursor: Optional[Tuple[float, float]] = None
+
+    def desplazar(
+        self, arbol: IndiceObstaculos, x_min: float, x_max: float
+    ) -> Tuple[List[Obstaculo], List[Obstaculo]]:
+        """
+        Mueve la ventana a [x_min, x_max] y devuelve los cambios respecto al frame anterior.
+        El costo es O(log n) más la cantidad de obstáculos que entran o salen.
+
+        Args:
+            arbol (IndiceObstaculos): Índice de obstáculos a recorrer
+            x_min (float): Nuevo límite inferior X (no debe retroceder)
+            x_max (float): Nuevo límite superior X (no debe retroceder)
+
+        Returns:
+            Tuple[List[Obstaculo], List[Obstaculo]]: Obstáculos que entraron y que salieron
+        """
+        salieron: List[Obstaculo] = []
+        while self.obstaculos and self.obstaculos[0].x < x_min:
+            obstaculo = self.obstaculos.popleft()
+            self.claves.discard((obstaculo.x, obstaculo.y))
+            salieron.append(obstaculo)
+
+        # Los obstáculos que quedaron atrás sin llegar a ser visibles se saltan
+        inicio = (x_min, -math.inf)
+        if self._cursor is not None and self._cursor > inicio:
+            inicio = self._cursor
+
+        entraron = list(arbol.iterar_desde(inicio, x_max))
+        if entraron:
+            self.obstaculos.extend(entraron)
+            self.claves.update((obstaculo.x, obstaculo.y) for obstaculo in entraron)
+            ultimo = entraron[-1]
+            self._cursor = (ultimo.x, ultimo.y)
+        else:
+            self._cursor = inicio
+
+        if entraron or salieron:
+            self.version += 1
+        return entraron, salieron
+
+    def descartar(self, obstaculo: Obstaculo) -> bool:
+        """
+        Quita de la ventana un obstáculo que se eliminó del árbol mientras era visible.
+
+        Args:
+            obstaculo (Obstaculo): Obstáculo a quitar
+
+        Returns:
+            bool: True si estaba en la ventana
+        """
+        try:
+            self.obstaculos.remove(obstaculo)
+        except ValueError:
+            return False
+        self.claves.discard((obstaculo.x, obstaculo.y))
+        self.version += 1
+        return True
+
+    def reiniciar(self) -> None:
+        """Vacía la ventana (sin reemplazar la cola) y vuelve el cursor al inicio."""
+        self.obstaculos.clear()
+        self.claves.clear()
+        self.version += 1
+        self._cursor = None
+
+    def __len__(self) -> int:
+        """
+        Cantidad de obstáculos visibles.
+
+        Returns:
+            int: Obstáculos en la ventana
+        """
+        return len(self.obstaculos)
@@ -8,7 +8,9 @@ Configurado para ejecutarse con pygame-zero.
 import pygame
 from pgzero.constants import keys
 from logic.gestor_juego import GestorJuego, EstadoJuego
+from logic.registro import obtener_registro
 from view.pantalla_configuracion import PantallaConfiguracion
+from view.overlays import GestorOverlays
 from view.pantalla_juego import PantallaJuego
 
 # Configuración de pygame-zero
@@ -20,17 +22,20 @@ TITLE = "Carrito con Obstaculos Dinamicos - Arbol AVL"
 import os
 os.environ['SDL_VIDEO_CENTERED'] = '1'
 
+_registro = obtener_registro("juego")
+
 # Instancias globales para pygame-zero
 gestor_juego = None
 pantalla_configuracion = None
 pantalla_juego = None
+gestor_overlays = None
 
 
 def inicializar_juego():
     """
     Inicializa todos los componentes del juego.
     """
-    global gestor_juego, pantalla_configuracion, pantalla_juego
+    global gestor_juego, pantalla_configuracion, pantalla_juego, gestor_overlays
 
     # Crear el gestor principal
     gestor_juego = GestorJuego()
@@ -42,13 +47,14 @@ def inicializar_juego():
 
     pantalla_juego = PantallaJuego(WIDTH, HEIGHT)
     pantalla_juego.gestor_juego = gestor_juego
+    gestor_overlays = GestorOverlays(WIDTH, HEIGHT)
 
     # Cambiar directamente a configuracion
     gestor_juego.cambiar_estado(EstadoJuego.CONFIGURACION)
 
-    print("Juego inicializado correctamente")
-    print("Estado inicial: Configuracion")
-    print("Arbol AVL listo para recibir obstaculos")
+    _registro.informar("Juego inicializado correctamente")
+    _registro.informar("Estado inicial: Configuracion")
+    _registro.informar("Arbol AVL listo para recibir obstaculos")
 
 
 def draw():
@@ -59,123 +65,163 @@ def draw():
         inicializar_juego()
         return
 
-    # Limpiar pantalla
-    screen.fill((50, 50, 100))  # Azul oscuro
+    estado = gestor_juego.estado_actual
+    if estado == EstadoJuego.JUGANDO:
+        # La pantalla de juego repinta solo lo que cambió desde el frame anterior
+        gestor_overlays.invalidar()
+        pantalla_juego.dibujar(screen, _textos_depuracion())
+        return
 
-    # Dibujar según el estado actual
-    if gestor_juego.estado_actual == EstadoJuego.CONFIGURACION:
-        pantalla_configuracion.dibujar(screen)
-    elif gestor_juego.estado_actual == EstadoJuego.JUGANDO:
-        pantalla_juego.dibujar(screen)
-    elif gestor_juego.estado_actual == EstadoJuego.PAUSADO:
-        pantalla_juego.dibujar(screen)
-        # Dibujar overlay de pausa
-        # Crear overlay semitransparente
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))  # Negro con transparencia
-        screen.blit(overlay, (0, 0))
-        
-        # Texto de PAUSA
-        screen.draw.text(
-            "PAUSA",
-            center=(WIDTH//2, HEIGHT//2 - 50),
-            fontsize=48,
-            color="white"
-        )
-        
-        # Instrucciones
-        screen.draw.text(
-            "Presiona P para continuar",
-            center=(WIDTH//2, HEIGHT//2 + 20),
-            fontsize=20,
-            color="yellow"
-        )
-    elif gestor_juego.estado_actual == EstadoJuego.JUEGO_TERMINADO:
-        pantalla_juego.dibujar(screen)
-        # Dibujar overlay de fin de juego
-        # Crear overlay semitransparente
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))  # Negro con transparencia más oscura
-        screen.blit(overlay, (0, 0))
-        
-        # Obtener estadísticas del juego
-        stats = gestor_juego.obtener_estadisticas()
-        
-        # Título de FIN DE JUEGO
-        screen.draw.text(
-            "JUEGO TERMINADO",
-            center=(WIDTH//2, HEIGHT//2 - 80),
-            fontsize=40,
-            color="red"
-        )
-        
-        # Mostrar razón del fin del juego
-        if gestor_juego.carrito and not gestor_juego.carrito.esta_vivo():
-            reason = "Sin energía"
-        elif gestor_juego.distancia_recorrida >= gestor_juego.distancia_total:
-            reason = "¡Meta alcanzada!"
-        else:
-            reason = "Juego terminado"
-            
-        screen.draw.text(
-            reason,
-            center=(WIDTH//2, HEIGHT//2 - 40),
-            fontsize=24,
-            color="yellow"
-        )
-        
-        # Estadísticas finales
-        screen.draw.text(
-            f"Puntuación final: {int(stats['puntuacion'])}",
-            center=(WIDTH//2, HEIGHT//2 - 5),
-            fontsize=20,
-            color="white"
-        )
-        
-        screen.draw.text(
-            f"Distancia recorrida: {int(stats['distancia_recorrida'])} m",
-            center=(WIDTH//2, HEIGHT//2 + 20),
-            fontsize=20,
-            color="white"
-        )
-        
-        screen.draw.text(
-            f"Tiempo jugado: {stats['tiempo_juego']:.1f} seg",
-            center=(WIDTH//2, HEIGHT//2 + 45),
-            fontsize=20,
-            color="white"
-        )
-        
-        # Instrucciones para reiniciar
-        screen.draw.text(
-            "Presiona R para reiniciar",
-            center=(WIDTH//2, HEIGHT//2 + 80),
-            fontsize=18,
-            color="lime"
-        )
-        
-        screen.draw.text(
-            "Presiona ESC para configurar",
-            center=(WIDTH//2, HEIGHT//2 + 105),
-            fontsize=18,
-            color="cyan"
-        )
+    # Los overlays se componen una vez y se copian mientras no cambie lo que muestran:
+    # estado, textos y la vista del juego de fondo (árbol, hitboxes, perfil)
+    if estado == EstadoJuego.PAUSADO:
+        clave = (estado, pantalla_juego.firma_vista(), tuple(_textos_depuracion()))
+        gestor_overlays.dibujar(screen, clave, _dibujar_pausa)
+    elif estado == EstadoJuego.JUEGO_TERMINADO:
+        textos = _textos_fin_juego()
+        clave = (estado, pantalla_juego.firma_vista(), textos, tuple(_textos_depuracion()))
+        gestor_overlays.dibujar(screen, clave, _dibujar_fin_juego, textos)
+    else:
+        gestor_overlays.invalidar()
+
+        # Limpiar pantalla
+        screen.fill((50, 50, 100))  # Azul oscuro
 
-    # Dibujar información de debug (temporal)
+        if estado == EstadoJuego.CONFIGURACION:
+            pantalla_configuracion.dibujar(screen)
+        _dibujar_textos_depuracion(screen)
+
+    # Lo dibujado encima tapa la pantalla de juego: al volver se dibuja entera
+    pantalla_juego.compositor.invalidar()
+
+
+def _dibujar_pausa(screen):
+    """
+    Compone la pantalla de pausa: el juego detenido bajo un velo y las instrucciones.
+
+    Args:
+        screen: Pantalla de pygame-zero
+    """
+    pantalla_juego.dibujar(screen)
+    screen.blit(gestor_overlays.velo(128), (0, 0))  # Negro con transparencia
+
+    # Texto de PAUSA
     screen.draw.text(
-        f"Estado: {gestor_juego.estado_actual.value}",
-        (10, 10),
+        "PAUSA",
+        center=(WIDTH//2, HEIGHT//2 - 50),
+        fontsize=48,
+        color="white"
+    )
+
+    # Instrucciones
+    screen.draw.text(
+        "Presiona P para continuar",
+        center=(WIDTH//2, HEIGHT//2 + 20),
         fontsize=20,
-        color="white",
+        color="yellow"
+    )
+    _dibujar_textos_depuracion(screen)
+
+
+def _textos_fin_juego():
+    """
+    Arma los textos variables de la pantalla de fin de juego.
+
+    Returns:
+        Tuple[str, ...]: Razón del fin, puntuación, distancia y tiempo jugado
+    """
+    stats = gestor_juego.obtener_estadisticas()
+
+    # Razón del fin del juego
+    if gestor_juego.carrito and not gestor_juego.carrito.esta_vivo():
+        reason = "Sin energía"
+    elif gestor_juego.distancia_recorrida >= gestor_juego.distancia_total:
+        reason = "¡Meta alcanzada!"
+    else:
+        reason = "Juego terminado"
+
+    return (
+        reason,
+        f"Puntuación final: {int(stats['puntuacion'])}",
+        f"Distancia recorrida: {int(stats['distancia_recorrida'])} m",
+        f"Tiempo jugado: {stats['tiempo_juego']:.1f} seg",
+    )
+
+
+def _dibujar_fin_juego(screen, textos):
+    """
+    Compone la pantalla de fin de juego: el juego bajo un velo más oscuro, la razón
+    del fin, las estadísticas finales y las instrucciones.
+
+    Args:
+        screen: Pantalla de pygame-zero
+        textos (Tuple[str, ...]): Textos de _textos_fin_juego
+    """
+    reason, puntuacion, distancia, tiempo = textos
+    pantalla_juego.dibujar(screen)
+    screen.blit(gestor_overlays.velo(180), (0, 0))  # Negro con transparencia más oscura
+
+    # Título de FIN DE JUEGO
+    screen.draw.text(
+        "JUEGO TERMINADO",
+        center=(WIDTH//2, HEIGHT//2 - 80),
+        fontsize=40,
+        color="red"
+    )
+
+    screen.draw.text(
+        reason,
+        center=(WIDTH//2, HEIGHT//2 - 40),
+        fontsize=24,
+        color="yellow"
+    )
+
+    # Estadísticas finales
+    screen.draw.text(puntuacion, center=(WIDTH//2, HEIGHT//2 - 5), fontsize=20, color="white")
+    screen.draw.text(distancia, center=(WIDTH//2, HEIGHT//2 + 20), fontsize=20, color="white")
+    screen.draw.text(tiempo, center=(WIDTH//2, HEIGHT//2 + 45), fontsize=20, color="white")
+
+    # Instrucciones para reiniciar
+    screen.draw.text(
+        "Presiona R para reiniciar",
+        center=(WIDTH//2, HEIGHT//2 + 80),
+        fontsize=18,
+        color="lime"
     )
 
+    screen.draw.text(
+        "Presiona ESC para configurar",
+        center=(WIDTH//2, HEIGHT//2 + 105),
+        fontsize=18,
+        color="cyan"
+    )
+    _dibujar_textos_depuracion(screen)
+
+
+def _dibujar_textos_depuracion(screen):
+    """
+    Dibuja la información de debug (temporal) encima de la pantalla actual.
+
+    Args:
+        screen: Pantalla de pygame-zero
+    """
+    for texto, posicion, tamaño, color in _textos_depuracion():
+        screen.draw.text(texto, posicion, fontsize=tamaño, color=color)
+
+
+def _textos_depuracion():
+    """
+    Arma los textos de depuración que se muestran encima de cualquier pantalla.
+
+    Returns:
+        List[Tuple]: Tuplas (texto, posición, tamaño, color)
+    """
+    textos = [(f"Estado: {gestor_juego.estado_actual.value}", (10, 10), 20, "white")]
     if gestor_juego.arbol_obstaculos:
-        screen.draw.text(
-            f"Obstáculos en árbol: {gestor_juego.arbol_obstaculos.obtener_total_obstaculos()}",
-            (10, 35),
-            fontsize=16,
-            color="white",
+        textos.append(
+            (f"Obstáculos en árbol: {gestor_juego.arbol_obstaculos.obtener_total_obstaculos()}", (10, 35), 16, "white")
         )
+    return textos
 
 
 def update(dt):
@@ -191,6 +237,14 @@ def update(dt):
     # Actualizar el gestor principal
     gestor_juego.actualizar(dt)
 
+    # Avanzar la animación de recorrido del árbol, si hay una en curso; en pausa
+    # queda detenida junto con el juego (y el overlay compuesto sigue valiendo)
+    jugando = gestor_juego.estado_actual == EstadoJuego.JUGANDO
+    if jugando and pantalla_juego and pantalla_juego.visualizador_arbol:
+        pantalla_juego.visualizador_arbol.avanzar_animacion(dt)
+    if pantalla_configuracion:
+        pantalla_configuracion.visualizador.avanzar_animacion(dt)
+
 
 def on_key_down(key):
     """
@@ -206,7 +260,7 @@ def on_key_down(key):
     if key == keys.ESCAPE:
         # Cambiar entre configuración y juego
         if gestor_juego.estado_actual == EstadoJuego.CONFIGURACION:
-            print("Saliendo del juego...")
+            _registro.informar("Saliendo del juego...")
             exit()
         else:
             gestor_juego.cambiar_estado(EstadoJuego.CONFIGURACION)
@@ -214,9 +268,9 @@ def on_key_down(key):
     # Delegar a la pantalla actual
     if gestor_juego.estado_actual == EstadoJuego.CONFIGURACION:
         resultado = pantalla_configuracion.manejar_tecla(key)
-        print(f"Resultado de la tecla en configuración: {resultado}")
+        _registro.depurar("Resultado de la tecla en configuración: %s", resultado)
         if resultado == "iniciar_juego":
-            print("¡Iniciando juego desde teclado!")
+            _registro.informar("¡Iniciando juego desde teclado!")
             gestor_juego.cambiar_estado(EstadoJuego.JUGANDO)
             gestor_juego.inicializar_juego()
 
@@ -234,12 +288,16 @@ def on_key_down(key):
             pantalla_juego.mostrar_arbol = not pantalla_juego.mostrar_arbol
         elif key == keys.H:  # Mostrar/ocultar hitboxes (modo debug)
             pantalla_juego.mostrar_hitbox = not pantalla_juego.mostrar_hitbox
+        elif key == keys.F:  # Mostrar/ocultar tiempos por fase del frame
+            pantalla_juego.alternar_perfil()
         elif key == keys.B:  # Mostrar recorrido en anchura
             if pantalla_juego.visualizador_arbol and pantalla_juego.mostrar_arbol:
                 pantalla_juego.visualizador_arbol.iniciar_recorrido_anchura(gestor_juego.arbol_obstaculos)
         elif key == keys.D:  # Mostrar recorrido en profundidad
             if pantalla_juego.visualizador_arbol and pantalla_juego.mostrar_arbol:
                 pantalla_juego.visualizador_arbol.iniciar_recorrido_profundidad(gestor_juego.arbol_obstaculos)
+        else:
+            pantalla_juego.manejar_tecla_vista_arbol(key)
 
     elif gestor_juego.estado_actual == EstadoJuego.PAUSADO:
         # Controles cuando el juego está pausado
@@ -249,14 +307,18 @@ def on_key_down(key):
             pantalla_juego.mostrar_arbol = not pantalla_juego.mostrar_arbol
         elif key == keys.H:  # Mostrar/ocultar hitboxes (modo debug)
             pantalla_juego.mostrar_hitbox = not pantalla_juego.mostrar_hitbox
+        elif key == keys.F:  # Mostrar/ocultar tiempos por fase del frame
+            pantalla_juego.alternar_perfil()
+        else:
+            pantalla_juego.manejar_tecla_vista_arbol(key)
     
     elif gestor_juego.estado_actual == EstadoJuego.JUEGO_TERMINADO:
         # Controles cuando el juego ha terminado
         if key == keys.R:
-            print("¡Reiniciando juego!")
+            _registro.informar("¡Reiniciando juego!")
             gestor_juego.reiniciar_juego()
         elif key == keys.SPACE:
-            print("¡Reiniciando juego con ESPACIO!")
+            _registro.informar("¡Reiniciando juego con ESPACIO!")
             gestor_juego.reiniciar_juego()
         # ESC ya está manejado en las teclas globales
 
@@ -274,9 +336,9 @@ def on_mouse_down(pos):
     # Delegar a la pantalla actual
     if gestor_juego.estado_actual == EstadoJuego.CONFIGURACION:
         resultado = pantalla_configuracion.manejar_clic_mouse(pos)
-        print(f"Resultado del clic en configuración: {resultado}")
+        _registro.depurar("Resultado del clic en configuración: %s", resultado)
         if resultado == "iniciar_juego":
-            print("¡Iniciando juego desde clic del mouse!")
+            _registro.informar("¡Iniciando juego desde clic del mouse!")
             gestor_juego.cambiar_estado(EstadoJuego.JUGANDO)
             gestor_juego.inicializar_juego()
 
@@ -285,10 +347,10 @@ def main():
     """
     Función principal para ejecutar sin pygame-zero.
     """
-    print("Iniciando Juego de Carrito con Obstaculos Dinamicos")
-    print("Estructura de datos: Arbol AVL")
-    print("Para ejecutar: uv run pgzrun main.py")
-    print("O alternativamente: uv run python main.py")
+    _registro.informar("Iniciando Juego de Carrito con Obstaculos Dinamicos")
+    _registro.informar("Estructura de datos: Arbol AVL")
+    _registro.informar("Para ejecutar: uv run pgzrun main.py")
+    _registro.informar("O alternativamente: uv run python main.py")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the AVL tree operations and invariants.
+"""
+
+import random
+
+from logic.arbol_avl import ArbolAVL, ResultadoOperacion
+from logic.obstaculo import Obstaculo, ObstaculoCompacto, TipoObstaculo
+
+
+def _verificar_invariantes(arbol):
+    """Checks ordering, heights, balance and total count of the tree."""
+    def revisar(nodo, minimo, maximo):
+        if nodo is None:
+            return 0, 0
+        clave = (nodo.obstaculo.x, nodo.obstaculo.y)
+        fines = [nodo.obstaculo.x + nodo.obstaculo.ancho]
+        fines += [hijo.fin_maximo for hijo in (nodo.izquierdo, nodo.derecho) if hijo]
+        assert nodo.fin_maximo == max(fines), f"Wrong max end at {clave}"
+        assert minimo is None or clave > minimo, f"Order broken at {clave}"
+        assert maximo is None or clave < maximo, f"Order broken at {clave}"
+        altura_izq, total_izq = revisar(nodo.izquierdo, minimo, clave)
+        altura_der, total_der = revisar(nodo.derecho, clave, maximo)
+        assert abs(altura_izq - altura_der) <= 1, f"Unbalanced node {clave}"
+        assert nodo.altura == 1 + max(altura_izq, altura_der), f"Wrong height at {clave}"
+        assert nodo.tamaño == total_izq + total_der + 1, f"Wrong size at {clave}"
+        return nodo.altura, nodo.tamaño
+
+    _, total = revisar(arbol.raiz, None, None)
+    assert total == arbol.obtener_total_obstaculos(), "Total count out of sync"
+
+
+def _verificar_carriles(arbol):
+    """Checks that the per-lane index holds exactly the obstacles of each lane."""
+    por_carril = {}
+    for obstaculo in arbol.recorrido_en_profundidad():
+        por_carril.setdefault(obstaculo.y, []).append((obstaculo.x, obstaculo.y))
+    for carril, arbol_carril in arbol.carriles.items():
+        _verificar_invariantes(arbol_carril)
+        claves = [(o.x, o.y) for o in arbol_carril.recorrido_en_profundidad()]
+        assert claves == por_carril.get(carril, []), f"Lane {carril} out of sync"
+    assert set(por_carril) <= set(arbol.carriles), "Missing lane trees"
+
+
+def _obstaculos_aleatorios(cantidad, semilla=7):
+    generador = random.Random(semilla)
+    claves = generador.sample(range(cantidad * 20), cantidad)
+    return [Obstaculo(clave // 6, clave % 6, TipoObstaculo.ROCA) for clave in claves]
+
+
+def test_single_pass_results():
+    """Test that insert/delete report what happened in a single descent."""
+    print("🧪 Testing single-pass insert/delete results...")
+    arbol = ArbolAVL()
+    obstaculo = Obstaculo(100, 2, TipoObstaculo.CONO)
+
+    assert arbol.insertar_con_resultado(obstaculo) is ResultadoOperacion.INSERTADO
+    assert arbol.insertar_con_resultado(Obstaculo(100, 2, TipoObstaculo.ROCA)) is ResultadoOperacion.DUPLICADO
+    assert arbol.obtener_total_obstaculos() == 1
+
+    assert arbol.eliminar_con_resultado(Obstaculo(100, 3, TipoObstaculo.ROCA)) is ResultadoOperacion.AUSENTE
+    assert arbol.eliminar_con_resultado(obstaculo) is ResultadoOperacion.ELIMINADO
+    assert arbol.eliminar_con_resultado(obstaculo) is ResultadoOperacion.AUSENTE
+    assert arbol.esta_vacio()
+    print("✅ Results reported correctly")
+
+
+def test_random_mutations_keep_invariants():
+    """Test that random inserts and deletes keep the AVL invariants."""
+    print("🧪 Testing AVL invariants under random mutations...")
+    obstaculos = _obstaculos_aleatorios(500)
+    arbol = ArbolAVL()
+    for obstaculo in obstaculos:
+        assert arbol.insertar(obstaculo)
+    _verificar_invariantes(arbol)
+
+    random.Random(3).shuffle(obstaculos)
+    for obstaculo in obstaculos[:300]:
+        assert arbol.eliminar(obstaculo)
+        assert not arbol.eliminar(obstaculo)
+    _verificar_invariantes(arbol)
+
+    esperados = sorted((o.x, o.y) for o in obstaculos[300:])
+    assert [(o.x, o.y) for o in arbol.recorrido_en_profundidad()] == esperados
+    print("✅ Invariants hold after 500 inserts and 300 deletes")
+
+
+def test_bulk_load_from_list():
+    """Test that desde_lista sorts, removes duplicates and builds a balanced tree."""
+    print("🧪 Testing bulk load from list...")
+    obstaculos = _obstaculos_aleatorios(1000)
+    primero = Obstaculo(obstaculos[0].x, obstaculos[0].y, TipoObstaculo.BARRERA)
+    arbol = ArbolAVL.desde_lista(obstaculos + [primero] + obstaculos[:10])
+
+    _verificar_invariantes(arbol)
+    assert arbol.obtener_total_obstaculos() == 1000
+    assert arbol.obtener_altura(arbol.raiz) == 10  # ceil(log2(1001))
+    # Ante coordenadas repetidas se conserva la primera aparición
+    recorrido = arbol.recorrido_en_profundidad()
+    assert next(o for o in recorrido if o == primero) is obstaculos[0]
+    assert ArbolAVL.desde_lista([]).esta_vacio()
+    print("✅ Bulk load builds a balanced tree without duplicates")
+
+
+def test_split_join_and_prefix_delete():
+    """Test dividir/unir and eliminar_hasta keep the tree consistent."""
+    print("🧪 Testing split, join and prefix delete...")
+    obstaculos = _obstaculos_aleatorios(800)
+    arbol = ArbolAVL.desde_lista(obstaculos)
+    claves = sorted((o.x, o.y) for o in obstaculos)
+
+    corte = claves[300]
+    menores = arbol.dividir(corte)
+    _verificar_invariantes(arbol)
+    _verificar_invariantes(menores)
+    assert [(o.x, o.y) for o in menores.recorrido_en_profundidad()] == claves[:300]
+    assert [(o.x, o.y) for o in arbol.recorrido_en_profundidad()] == claves[300:]
+
+    # Unir en cualquier orden restaura el árbol completo
+    arbol.unir(menores)
+    assert menores.esta_vacio()
+    _verificar_invariantes(arbol)
+    assert [(o.x, o.y) for o in arbol.recorrido_en_profundidad()] == claves
+
+    x_limite = claves[500][0]
+    pasados = arbol.eliminar_hasta(x_limite)
+    _verificar_invariantes(arbol)
+    assert all(o.x <= x_limite for o in pasados.recorrido_en_profundidad())
+    assert all(o.x > x_limite for o in arbol.recorrido_en_profundidad())
+    assert pasados.obtener_total_obstaculos() + arbol.obtener_total_obstaculos() == 800
+
+    try:
+        arbol.unir(ArbolAVL.desde_lista([Obstaculo(claves[-1][0], 6, TipoObstaculo.ROCA), Obstaculo(-1, 0, TipoObstaculo.ROCA)]))
+        assert False, "Overlapping trees must not be joined"
+    except ValueError:
+        pass
+    print("✅ Split and join keep the AVL invariants")
+
+
+def test_range_iterator_matches_brute_force():
+    """Test that iterar_rango/contar_en_rango match a linear scan and stop early."""
+    print("🧪 Testing lazy range iterator...")
+    obstaculos = _obstaculos_aleatorios(600)
+    arbol = ArbolAVL.desde_lista(obstaculos)
+
+    for x_min, x_max, y_min, y_max in [(0, 500, 0, 5), (200, 900, 2, 3), (1500, 1400, 0, 5), (-10, 10**6, 4, 4)]:
+        esperados = sorted(
+            (o.x, o.y) for o in obstaculos if x_min <= o.x <= x_max and y_min <= o.y <= y_max
+        )
+        assert [(o.x, o.y) for o in arbol.iterar_rango(x_min, x_max, y_min, y_max)] == esperados
+        assert [(o.x, o.y) for o in arbol.buscar_en_rango(x_min, x_max, y_min, y_max)] == esperados
+        assert arbol.contar_en_rango(x_min, x_max, y_min, y_max) == len(esperados)
+
+    iterador = arbol.iterar_rango(0, 10**6, 0, 5)
+    primero = next(iterador)
+    assert (primero.x, primero.y) == min((o.x, o.y) for o in obstaculos)
+    print("✅ Range iterator matches brute force")
+
+
+def test_order_statistics():
+    """Test rango, seleccionar and logarithmic contar_en_rango with subtree sizes."""
+    print("🧪 Testing order statistics...")
+    obstaculos = _obstaculos_aleatorios(700)
+    arbol = ArbolAVL()
+    for obstaculo in obstaculos:
+        arbol.insertar(obstaculo)
+    for obstaculo in obstaculos[::3]:
+        arbol.eliminar(obstaculo)
+    _verificar_invariantes(arbol)
+
+    ordenados = arbol.recorrido_en_profundidad()
+    for k in (0, 1, len(ordenados) // 2, len(ordenados) - 1):
+        assert arbol.seleccionar(k) is ordenados[k]
+        assert arbol.rango(ordenados[k]) == k
+    assert arbol.rango(Obstaculo(-1, 0, TipoObstaculo.ROCA)) == 0
+    try:
+        arbol.seleccionar(len(ordenados))
+        assert False, "seleccionar must reject out-of-range positions"
+    except IndexError:
+        pass
+
+    for x_min, x_max in [(0, 400), (123, 1234), (900, 100)]:
+        esperados = sum(1 for o in ordenados if x_min <= o.x <= x_max)
+        assert arbol.contar_en_rango(x_min, x_max, 0, 5) == esperados
+    print("✅ Order statistics are correct")
+
+
+def test_lane_index_stays_in_sync():
+    """Test that the per-lane index follows inserts, deletes, split and join."""
+    print("🧪 Testing per-lane index...")
+    obstaculos = _obstaculos_aleatorios(600)
+    arbol = ArbolAVL.desde_lista(obstaculos[:300], indice_por_carril=True)
+    _verificar_carriles(arbol)
+
+    for obstaculo in obstaculos[300:]:
+        arbol.insertar(obstaculo)
+    for obstaculo in obstaculos[::4]:
+        arbol.eliminar(obstaculo)
+    _verificar_carriles(arbol)
+
+    pasados = arbol.eliminar_hasta(500)
+    _verificar_carriles(arbol)
+    _verificar_carriles(pasados)
+    arbol.unir(pasados)
+    _verificar_carriles(arbol)
+
+    for carril in range(6):
+        esperados = [o for o in arbol.recorrido_en_profundidad() if o.y == carril and 100 <= o.x <= 1500]
+        assert list(arbol.iterar_carril(carril, 100, 1500)) == esperados
+        siguiente = arbol.siguiente_en_carril(carril, 1000)
+        assert siguiente == next((o for o in arbol.recorrido_en_profundidad() if o.y == carril and o.x >= 1000), None)
+    print("✅ Per-lane index stays in sync")
+
+
+def test_overlap_query_with_widths():
+    """Test buscar_solapados against a brute-force interval overlap check."""
+    print("🧪 Testing interval overlap query...")
+    generador = random.Random(5)
+    obstaculos = [
+        Obstaculo(o.x, o.y, TipoObstaculo.ROCA, ancho=generador.choice([10, 30, 80, 250]))
+        for o in _obstaculos_aleatorios(700)
+    ]
+    for indice_por_carril in (False, True):
+        arbol = ArbolAVL(indice_por_carril)
+        for obstaculo in obstaculos:
+            arbol.insertar(obstaculo)
+        for obstaculo in obstaculos[::5]:
+            arbol.eliminar(obstaculo)
+        _verificar_invariantes(arbol)
+        presentes = arbol.recorrido_en_profundidad()
+
+        for _ in range(100):
+            x_ini = generador.randint(-50, 2500)
+            x_fin = x_ini + generador.choice([1, 40, 300])
+            carril = generador.choice([None, 0, 3, 5])
+            esperados = [
+                o for o in presentes
+                if o.x < x_fin and o.x + o.ancho > x_ini and (carril is None or o.y == carril)
+            ]
+            assert arbol.buscar_solapados(x_ini, x_fin, carril) == esperados
+    print("✅ Overlap query matches brute force")
+
+
+def test_compact_obstacles_interoperate():
+    """Test that slotted and compact obstacles share keys, dimensions and tree behaviour."""
+    print("🧪 Testing compact obstacles...")
+    for tipo in TipoObstaculo:
+        normal = Obstaculo(40, 1, tipo)
+        compacto = ObstaculoCompacto(40, 1, tipo)
+        assert compacto == normal and hash(compacto) == hash(normal)
+        assert (compacto.ancho, compacto.alto) == (normal.ancho, normal.alto)
+        assert not hasattr(compacto, "__dict__") and not hasattr(normal, "__dict__")
+
+    mezclados = [
+        ObstaculoCompacto(o.x, o.y, o.tipo) if i % 2 else o
+        for i, o in enumerate(_obstaculos_aleatorios(400))
+    ]
+    arbol = ArbolAVL.desde_lista(mezclados, indice_por_carril=True)
+    _verificar_invariantes(arbol)
+    _verificar_carriles(arbol)
+    assert arbol.buscar_solapados(0, 10**6) == sorted(mezclados, key=lambda o: (o.x, o.y))
+    print("✅ Compact obstacles behave like regular ones")
+
+
+if __name__ == "__main__":
+    test_single_pass_results()
+    test_random_mutations_keep_invariants()
+    test_bulk_load_from_list()
+    test_split_join_and_prefix_delete()
+    test_range_iterator_matches_brute_force()
+    test_order_statistics()
+    test_lane_index_stays_in_sync()
+    test_overlap_query_with_widths()
+    test_compact_obstacles_interoperate()
+    print("\n🎉 All AVL tree tests passed!")
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the struct-of-arrays AVL backend against the node-based tree.
+"""
+
+import json
+import random
+
+from logic.arbol_avl import ArbolAVL
+from logic.arbol_avl_arreglos import ArbolAVLArreglos
+from logic.gestor_juego import GestorJuego
+from logic.obstaculo import Obstaculo, TipoObstaculo
+from test_arbol_avl import _obstaculos_aleatorios, _verificar_carriles, _verificar_invariantes
+
+
+def _claves(obstaculos):
+    return [(o.x, o.y, o.tipo, o.ancho) for o in obstaculos]
+
+
+def test_matches_node_tree_under_mutations():
+    """Test that both backends give the same answers for the same operations."""
+    print("🧪 Testing struct-of-arrays backend against ArbolAVL...")
+    generador = random.Random(9)
+    tipos = list(TipoObstaculo)
+    obstaculos = [
+        Obstaculo(o.x, o.y, generador.choice(tipos), ancho=generador.choice([10, 30, 120]))
+        for o in _obstaculos_aleatorios(900)
+    ]
+    nodos = ArbolAVL.desde_lista(obstaculos[:400], indice_por_carril=True)
+    arreglos = ArbolAVLArreglos.desde_lista(obstaculos[:400], indice_por_carril=True)
+
+    for obstaculo in obstaculos[400:]:
+        assert arreglos.insertar_con_resultado(obstaculo) is nodos.insertar_con_resultado(obstaculo)
+    for obstaculo in obstaculos[::3]:
+        assert arreglos.eliminar_con_resultado(obstaculo) is nodos.eliminar_con_resultado(obstaculo)
+    _verificar_invariantes(arreglos)
+    _verificar_carriles(arreglos)
+    assert _claves(arreglos.recorrido_en_profundidad()) == _claves(nodos.recorrido_en_profundidad())
+    assert _claves(arreglos.recorrido_en_anchura()) == _claves(nodos.recorrido_en_anchura())
+    # Los índices liberados se reutilizan antes de hacer crecer las columnas
+    columnas = len(arreglos._x)
+    arreglos.insertar(obstaculos[0])
+    assert len(arreglos._x) == columnas
+
+    nodos.insertar(obstaculos[0])
+    for _ in range(100):
+        x_ini = generador.randint(0, 3000)
+        x_fin = x_ini + generador.choice([1, 50, 400])
+        carril = generador.choice([None, 1, 4])
+        assert _claves(arreglos.buscar_solapados(x_ini, x_fin, carril)) == _claves(
+            nodos.buscar_solapados(x_ini, x_fin, carril)
+        )
+        assert arreglos.contar_en_rango(x_ini, x_fin, 0, 5) == nodos.contar_en_rango(x_ini, x_fin, 0, 5)
+        assert arreglos.buscar_en_rango(x_ini, x_fin, 2, 3) == nodos.buscar_en_rango(x_ini, x_fin, 2, 3)
+    k = nodos.obtener_total_obstaculos() // 2
+    assert arreglos.seleccionar(k) == nodos.seleccionar(k)
+    assert arreglos.rango(obstaculos[5]) == nodos.rango(obstaculos[5])
+    print("✅ Both backends agree")
+
+
+def test_split_join_and_snapshot():
+    """Test dividir/unir and that snapshots are independent buffer copies."""
+    print("🧪 Testing split, join and snapshots on the array backend...")
+    obstaculos = _obstaculos_aleatorios(600)
+    arbol = ArbolAVLArreglos.desde_lista(obstaculos, indice_por_carril=True)
+    claves = sorted((o.x, o.y) for o in obstaculos)
+
+    copia = arbol.instantanea()
+    pasados = arbol.eliminar_hasta(claves[250][0])
+    _verificar_invariantes(arbol)
+    _verificar_invariantes(pasados)
+    _verificar_carriles(arbol)
+    _verificar_carriles(pasados)
+    assert [(o.x, o.y) for o in pasados.recorrido_en_profundidad()] == [c for c in claves if c[0] <= claves[250][0]]
+
+    arbol.unir(pasados)
+    assert pasados.esta_vacio()
+    _verificar_invariantes(arbol)
+    _verificar_carriles(arbol)
+    assert [(o.x, o.y) for o in arbol.recorrido_en_profundidad()] == claves
+
+    for obstaculo in obstaculos[:100]:
+        arbol.eliminar(obstaculo)
+    assert copia.obtener_total_obstaculos() == 600
+    assert [(o.x, o.y) for o in copia.recorrido_en_profundidad()] == claves
+    _verificar_carriles(copia)
+    print("✅ Split, join and snapshots work on the array backend")
+
+
+def test_game_manager_selects_backend(tmp_path):
+    """Test that motor_arbol in the configuration picks the tree implementation."""
+    print("🧪 Testing backend selection from configuration...")
+    with open("data/configuracion.json", encoding="utf-8") as archivo:
+        config = json.load(archivo)
+    config["configuracion"]["motor_arbol"] = "avl_arreglos"
+    ruta = tmp_path / "configuracion.json"
+    ruta.write_text(json.dumps(config), encoding="utf-8")
+
+    gestor = GestorJuego(str(ruta))
+    assert gestor.cargar_configuracion()
+    assert isinstance(gestor.arbol_obstaculos, ArbolAVLArreglos)
+    assert gestor.arbol_obstaculos.obtener_total_obstaculos() == len(config["obstaculos"])
+
+    gestor.inicializar_juego()
+    for _ in range(200):
+        gestor.actualizar(1 / 60)
+    gestor.reiniciar_juego()
+    assert isinstance(gestor.arbol_obstaculos, ArbolAVLArreglos)
+    print("✅ Backend selected from configuration")
+
+
+if __name__ == "__main__":
+    import pathlib
+    import tempfile
+
+    test_matches_node_tree_under_mutations()
+    test_split_join_and_snapshot()
+    with tempfile.TemporaryDirectory() as directorio:
+        test_game_manager_selects_backend(pathlib.Path(directorio))
+    print("\n🎉 All struct-of-arrays backend tests passed!")
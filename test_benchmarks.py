@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the synthetic course generator and the regression check.
+"""
+
+from benchmarks.pistas import DISTRIBUCIONES, generar_pista
+from benchmarks.suite import comparar, medir_partida
+
+
+def test_synthetic_courses_are_reproducible():
+    """Test that every distribution yields unique, valid and reproducible keys."""
+    print("🧪 Testing synthetic course generator...")
+    for distribucion in DISTRIBUCIONES:
+        pista = generar_pista(2000, distribucion, semilla=3)
+        claves = [(o.x, o.y) for o in pista]
+        assert len(pista) == 2000 and len(set(claves)) == 2000, distribucion
+        assert all(0 <= y <= 5 and x >= 0 for x, y in claves), distribucion
+        assert claves == [(o.x, o.y) for o in generar_pista(2000, distribucion, semilla=3)]
+
+    cargado = generar_pista(2000, "carril_cargado", semilla=3)
+    assert sum(1 for o in cargado if o.y == 2) > 1000
+    print("✅ Courses are reproducible")
+
+
+def test_headless_run_and_regression_check():
+    """Test that the headless run reaches the finish line and regressions are flagged."""
+    print("🧪 Testing headless run and baseline comparison...")
+    partida = medir_partida("avl", generar_pista(500, "agrupada"), frames=200)
+    assert 190 <= partida["partida_frames"] <= 210
+
+    base = {"uniforme/10/insertar_us": 10.0, "uniforme/10/partida_frames": 100}
+    assert comparar({"uniforme/10/insertar_us": 12.0, "uniforme/10/partida_frames": 300}, base, 0.25) == []
+    assert len(comparar({"uniforme/10/insertar_us": 13.0}, base, 0.25)) == 1
+    print("✅ Headless run and regression check work")
+
+
+if __name__ == "__main__":
+    test_synthetic_courses_are_reproducible()
+    test_headless_run_and_regression_check()
+    print("\n🎉 All benchmark tooling tests passed!")
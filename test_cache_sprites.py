@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the LRU cache of scaled sprites.
+"""
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from view.cache_sprites import CacheSprites
+
+
+def test_sprite_cache_scales_once_per_size_and_evicts_lru():
+    """Test hits, misses, pre-warming and LRU eviction of scaled sprites."""
+    print("🧪 Testing the scaled sprite cache...")
+    imagenes = {"roca": pygame.Surface((64, 64)), "cono": pygame.Surface((64, 64))}
+    cache = CacheSprites(imagenes, capacidad=2)
+
+    cache.precalentar([("roca", 30, 30)])
+    assert cache.estadisticas() == {"aciertos": 0, "fallos": 0, "desalojos": 0, "tamaño": 1}
+
+    roca = cache.obtener("roca", 30, 30)
+    assert roca.get_size() == (30, 30)
+    assert cache.obtener("roca", 30, 30) is roca
+    assert cache.obtener("hueco", 30, 30) is None
+    assert cache.aciertos == 2 and cache.fallos == 0
+
+    cache.obtener("cono", 30, 30)   # cono pasa a ser el más reciente
+    cache.obtener("roca", 30, 30)   # roca vuelve a ser el más reciente
+    cache.obtener("cono", 30, 100)  # desaloja el menos usado: cono 30x30
+    assert cache.desalojos == 1 and cache.fallos == 2
+    assert cache.obtener("roca", 30, 30) is roca
+    cache.obtener("cono", 30, 30)
+    assert cache.fallos == 3
+    print("✅ Scaled sprite cache works")
+
+
+if __name__ == "__main__":
+    test_sprite_cache_scales_once_per_size_and_evicts_lru()
+    print("\n🎉 All sprite cache tests passed!")
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the rendered text cache and static panel composition.
+"""
+
+import os
+
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+pygame = pytest.importorskip("pygame")
+pytest.importorskip("pgzero.ptext")
+
+from view.cache_textos import CacheTextos
+
+
+def test_text_cache_is_bounded_and_panels_compose():
+    """Test text surface reuse, LRU bound and pre-composited panels."""
+    print("🧪 Testing the text surface cache...")
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))  # ptext convierte las superficies al formato de la pantalla
+    pygame.font.init()
+    cache = CacheTextos(capacidad=2)
+
+    energia = cache.obtener("Energia: 50%", 14, "white")
+    assert cache.obtener("Energia: 50%", 14, "white") is energia
+    assert cache.obtener("Energia: 50%", 14, "red") is not energia
+    cache.obtener("Puntuacion: 10", 12, "white")
+    assert cache.estadisticas() == {"aciertos": 1, "fallos": 3, "tamaño": 2}
+    cache.obtener("Energia: 50%", 14, "white")  # Fue desalojado
+    assert cache.fallos == 4
+
+    panel, posicion = cache.componer([("Controles:", (600, 520), 12, "white"), ("P Pausar", (520, 560), 10, "white")])
+    assert posicion == (520, 520)
+    assert panel.get_width() >= 80 and panel.get_height() >= 40
+    assert panel.get_at((0, 0)).a == 0  # Fondo transparente fuera de los textos
+    print("✅ Text cache works")
+
+
+if __name__ == "__main__":
+    test_text_cache_is_bounded_and_panels_compose()
+    print("\n🎉 All text cache tests passed!")
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Test script to verify that the dirty-region compositor repaints only what changed
+and produces the same pixels as a full redraw.
+"""
+
+import os
+
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+pygame = pytest.importorskip("pygame")
+pytest.importorskip("pgzero.screen")
+
+from pgzero.screen import Screen
+
+from logic.gestor_juego import EstadoJuego, GestorJuego
+from view.compositor import Compositor
+from view.pantalla_juego import PantallaJuego
+
+
+def _pantalla():
+    """Create an offscreen pgzero screen with the display initialized for convert()."""
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    pygame.font.init()
+    return Screen(pygame.Surface((800, 600)).convert())
+
+
+def test_regions_are_disjoint_and_cover_changes():
+    """Test that dirty rectangles become disjoint regions covering every change."""
+    print("🧪 Testing dirty region grouping...")
+    fila = pygame.Rect(0, 100, 800, 1)
+    obstaculo = pygame.Rect(300, 90, 40, 40)
+    vecino = pygame.Rect(330, 95, 40, 40)
+    regiones = Compositor._agrupar([fila.copy(), obstaculo.copy(), vecino.copy()])
+
+    for i, region in enumerate(regiones):
+        assert region.collidelist(regiones[i + 1:]) == -1
+    for rect in (fila, obstaculo, vecino):
+        area = sum(rect.clip(region).width * rect.clip(region).height for region in regiones)
+        assert area == rect.width * rect.height
+    # La fila no se une con los obstáculos: se recorta alrededor de ellos
+    assert sum(r.width * r.height for r in regiones) < 800 * 40
+    print("✅ Dirty regions are disjoint and cover all changes")
+
+
+def test_incremental_frames_match_full_redraw():
+    """Test that composing only dirty regions gives the same image as redrawing everything."""
+    print("🧪 Testing incremental composition against full redraws...")
+    incremental, completa = _pantalla(), Screen(pygame.Surface((800, 600)).convert())
+    gestor = GestorJuego()
+    gestor.cargar_configuracion()
+    gestor.inicializar_juego()
+    pantalla = PantallaJuego()
+    pantalla.gestor_juego = gestor
+    compositor, compositor_completo = pantalla.compositor, Compositor(800, 600)
+
+    for frame in range(90):
+        gestor.actualizar(1 / 60)
+        if gestor.estado_actual != EstadoJuego.JUGANDO:
+            break
+        if frame == 30:
+            pantalla.visualizador_arbol.iniciar_recorrido_anchura(gestor.arbol_obstaculos)
+        if frame == 50:
+            pantalla.mostrar_arbol = False
+        if frame == 60:
+            pantalla.mostrar_arbol = True
+            gestor.carrito.saltar()
+        pantalla.visualizador_arbol.avanzar_animacion(1 / 60)
+
+        pantalla.compositor = compositor
+        pantalla.dibujar(incremental)
+        pantalla.compositor = compositor_completo
+        compositor_completo.invalidar()
+        pantalla.dibujar(completa)
+        assert pygame.image.tobytes(incremental.surface, "RGB") == pygame.image.tobytes(completa.surface, "RGB")
+
+    assert compositor.frames_completos == 1
+    assert compositor.pixeles_repintados < compositor.frames * 800 * 600 / 2
+
+    # Sin cambios no se repinta nada
+    pantalla.compositor = compositor
+    pantalla.dibujar(incremental)
+    assert pantalla.compositor.componer(incremental, pantalla.obtener_elementos(incremental)) == []
+    print("✅ Incremental composition matches full redraws")
+
+
+def test_layers_are_timed_under_their_phases():
+    """Test that each layer group is timed once per frame under the per-layer phase names."""
+    print("🧪 Testing per-layer draw phases...")
+    screen = _pantalla()
+    gestor = GestorJuego()
+    gestor.cargar_configuracion()
+    gestor.inicializar_juego()
+    gestor.perfilador.activar(True)
+    pantalla = PantallaJuego()
+    pantalla.gestor_juego = gestor
+
+    for _ in range(10):
+        gestor.actualizar(1 / 60)
+        pantalla.dibujar(screen, [("Estado: jugando", (10, 10), 20, "white")])
+    capas = ["fondo", "carretera", "obstaculos", "carrito", "hud", "arbol"]
+    fases = gestor.perfilador.fases
+    for capa in capas:
+        assert fases["dibujar." + capa].cantidad == 10
+    assert sum(fases["dibujar." + capa].suma for capa in capas) <= fases["dibujar.composicion"].suma
+
+    # Sin el árbol en pantalla su fase no se registra
+    pantalla.mostrar_arbol = False
+    pantalla.dibujar(screen)
+    assert fases["dibujar.arbol"].cantidad == 10 and fases["dibujar.hud"].cantidad == 11
+    print("✅ Layers are timed under their phases")
+
+
+if __name__ == "__main__":
+    test_regions_are_disjoint_and_cover_changes()
+    test_incremental_frames_match_full_redraw()
+    test_layers_are_timed_under_their_phases()
+    print("\n🎉 All compositor tests passed!")
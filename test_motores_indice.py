@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Test script to verify every ordered-index engine against a brute-force reference.
+"""
+
+import json
+import math
+import random
+
+from logic.arbol_rojo_negro import ArbolRojoNegro
+from logic.gestor_juego import GestorJuego
+from logic.indice_obstaculos import IndiceObstaculos, ResultadoOperacion
+from logic.motores_indice import MOTORES, obtener_motor
+from logic.obstaculo import Obstaculo, TipoObstaculo
+from logic.treap import Treap
+
+
+def _verificar_rojo_negro(nodo):
+    """Checks LLRB rules and returns the black height of the subtree."""
+    if nodo is None:
+        return 1
+    assert not (nodo.derecho and nodo.derecho.rojo), "Red right link"
+    assert not (nodo.rojo and nodo.izquierdo and nodo.izquierdo.rojo), "Two reds in a row"
+    negros_izq = _verificar_rojo_negro(nodo.izquierdo)
+    assert negros_izq == _verificar_rojo_negro(nodo.derecho), "Unequal black height"
+    return negros_izq + (0 if nodo.rojo else 1)
+
+
+def _verificar_treap(nodo):
+    """Checks the max-heap order of treap priorities."""
+    for hijo in (nodo.izquierdo, nodo.derecho) if nodo else ():
+        if hijo is not None:
+            assert hijo.prioridad <= nodo.prioridad, "Heap order broken"
+            _verificar_treap(hijo)
+
+
+def _verificar_estructura(indice):
+    if isinstance(indice, ArbolRojoNegro):
+        _verificar_rojo_negro(indice.raiz)
+        assert indice.raiz is None or not indice.raiz.rojo
+    elif isinstance(indice, Treap):
+        _verificar_treap(indice.raiz)
+
+
+def test_all_engines_match_reference():
+    """Test inserts, deletes, queries and prefix deletes on every registered engine."""
+    print("🧪 Testing every index engine against a reference dict...")
+    for nombre, motor in MOTORES.items():
+        generador = random.Random(21)
+        indice = motor.desde_lista([])
+        assert isinstance(indice, IndiceObstaculos)
+        referencia = {}
+
+        for _ in range(1500):
+            clave = generador.randrange(3000)
+            obstaculo = Obstaculo(clave // 6, clave % 6, TipoObstaculo.ROCA, ancho=generador.choice([10, 30, 90]))
+            if generador.random() < 0.6:
+                esperado = ResultadoOperacion.DUPLICADO if clave in referencia else ResultadoOperacion.INSERTADO
+                assert indice.insertar_con_resultado(obstaculo) is esperado, nombre
+                referencia.setdefault(clave, obstaculo)
+            else:
+                esperado = ResultadoOperacion.ELIMINADO if clave in referencia else ResultadoOperacion.AUSENTE
+                assert indice.eliminar_con_resultado(obstaculo) is esperado, nombre
+                referencia.pop(clave, None)
+        _verificar_estructura(indice)
+
+        ordenados = [referencia[c] for c in sorted(referencia)]
+        assert indice.obtener_total_obstaculos() == len(ordenados), nombre
+        assert indice.recorrido_en_profundidad() == ordenados, nombre
+        assert sorted(indice.recorrido_en_anchura(), key=lambda o: (o.x, o.y)) == ordenados, nombre
+
+        for _ in range(50):
+            x_min = generador.randint(-10, 520)
+            x_max = x_min + generador.choice([0, 20, 150])
+            y_min = generador.randint(0, 5)
+            esperados = [o for o in ordenados if x_min <= o.x <= x_max and y_min <= o.y <= 5]
+            assert indice.buscar_en_rango(x_min, x_max, y_min, 5) == esperados, nombre
+            assert indice.contar_en_rango(x_min, x_max, 0, 5) == sum(1 for o in ordenados if x_min <= o.x <= x_max)
+            solapados = [o for o in ordenados if o.x < x_max + 1 and o.x + o.ancho > x_min and o.y == y_min]
+            assert indice.buscar_solapados(x_min, x_max + 1, y_min) == solapados, nombre
+            assert list(indice.iterar_desde((x_min, y_min), x_max)) == [
+                o for o in ordenados if (x_min, y_min) < (o.x, o.y) and o.x <= x_max
+            ], nombre
+            assert indice.siguiente_en_carril(y_min, x_min) == next(
+                (o for o in ordenados if o.y == y_min and o.x >= x_min), None
+            ), nombre
+
+        pasados = indice.eliminar_hasta(250)
+        _verificar_estructura(indice)
+        assert type(pasados) is motor, nombre
+        assert pasados.recorrido_en_profundidad() == [o for o in ordenados if o.x <= 250], nombre
+        assert indice.recorrido_en_profundidad() == [o for o in ordenados if o.x > 250], nombre
+        assert pasados.obtener_total_obstaculos() + indice.obtener_total_obstaculos() == len(ordenados)
+
+        indice.limpiar()
+        assert indice.esta_vacio() and indice.obtener_total_obstaculos() == 0, nombre
+        assert list(indice.iterar_desde((-math.inf, -math.inf), math.inf)) == []
+    print(f"✅ {len(MOTORES)} engines match the reference")
+
+
+def test_version_counts_only_real_changes():
+    """Test that every engine bumps its version on mutations and only on mutations."""
+    print("🧪 Testing the modification counter of every engine...")
+    for nombre, motor in MOTORES.items():
+        indice = motor.desde_lista([Obstaculo(x, x % 6, TipoObstaculo.ROCA) for x in range(0, 100, 10)])
+        version = indice.version
+
+        assert indice.insertar(Obstaculo(5, 1, TipoObstaculo.ROCA)) and indice.version > version, nombre
+        version = indice.version
+        assert not indice.insertar(Obstaculo(5, 1, TipoObstaculo.ROCA)) and indice.version == version, nombre
+        assert not indice.eliminar(Obstaculo(7, 1, TipoObstaculo.ROCA)) and indice.version == version, nombre
+        indice.eliminar_hasta(-1)
+        indice.buscar_en_rango(0, 100, 0, 5)
+        assert indice.version == version, nombre
+
+        indice.eliminar_hasta(20)
+        assert indice.version > version, nombre
+        version = indice.version
+        assert indice.eliminar(Obstaculo(50, 2, TipoObstaculo.ROCA)) and indice.version > version, nombre
+        version = indice.version
+        indice.limpiar()
+        assert indice.version > version, nombre
+    print("✅ Every engine versions its changes")
+
+
+def test_game_runs_with_every_engine(tmp_path):
+    """Test that the game loop works whichever engine the configuration selects."""
+    print("🧪 Testing the game loop with every engine...")
+    with open("data/configuracion.json", encoding="utf-8") as archivo:
+        config = json.load(archivo)
+
+    for nombre, motor in MOTORES.items():
+        config["configuracion"]["motor_arbol"] = nombre
+        ruta = tmp_path / f"{nombre}.json"
+        ruta.write_text(json.dumps(config), encoding="utf-8")
+        gestor = GestorJuego(str(ruta))
+        assert gestor.cargar_configuracion()
+        assert type(gestor.arbol_obstaculos) is motor
+
+        gestor.inicializar_juego()
+        for _ in range(300):
+            gestor.actualizar(1 / 60)
+            x = gestor.carrito.x
+            esperados = gestor.arbol_obstaculos.buscar_en_rango(x, x + gestor.rango_vision, 0, 5)
+            assert list(gestor.obstaculos_visibles) == esperados, nombre
+
+    try:
+        obtener_motor("b_tree")
+        assert False, "Unknown engines must be rejected"
+    except ValueError:
+        pass
+    print("✅ Game loop works with every engine")
+
+
+if __name__ == "__main__":
+    import pathlib
+    import tempfile
+
+    test_all_engines_match_reference()
+    test_version_counts_only_real_changes()
+    with tempfile.TemporaryDirectory() as directorio:
+        test_game_runs_with_every_engine(pathlib.Path(directorio))
+    print("\n🎉 All index engine tests passed!")
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Test script to verify that pause and game-over overlays are composed once and reused.
+"""
+
+import os
+
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+pygame = pytest.importorskip("pygame")
+pytest.importorskip("pgzero.screen")
+
+from pgzero.constants import keys
+from pgzero.screen import Screen
+
+from logic.gestor_juego import EstadoJuego, GestorJuego
+from view.overlays import GestorOverlays
+from view.pantalla_juego import PantallaJuego
+
+
+def test_overlay_is_composed_once_per_content():
+    """Test that the overlay is recomposed only when its key changes or it is invalidated."""
+    print("🧪 Testing overlay reuse...")
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    screen = Screen(pygame.Surface((200, 100)))
+    overlays = GestorOverlays(200, 100)
+    llamadas = []
+
+    def componer(screen, color):
+        llamadas.append(color)
+        screen.fill(color)
+        screen.blit(overlays.velo(128), (0, 0))
+
+    assert overlays.dibujar(screen, ("pausa", 1), componer, (200, 0, 0))
+    compuesto = screen.surface.get_at((10, 10))
+    screen.fill((0, 0, 255))
+    for _ in range(5):
+        assert not overlays.dibujar(screen, ("pausa", 1), componer, (200, 0, 0))
+    assert llamadas == [(200, 0, 0)]
+    assert screen.surface.get_at((10, 10)) == compuesto
+    assert overlays.velo(128) is overlays.velo(128)
+
+    # Nuevos textos o una nueva entrada al estado vuelven a componer
+    assert overlays.dibujar(screen, ("pausa", 2), componer, (0, 200, 0))
+    overlays.invalidar()
+    assert overlays.dibujar(screen, ("pausa", 2), componer, (0, 200, 0))
+    assert overlays.composiciones == 3
+    print("✅ Overlays are reused until their content changes")
+
+
+def test_paused_overlay_follows_view_keys():
+    """Test that toggling the tree, zooming or showing the profiler while paused recomposes the overlay."""
+    print("🧪 Testing view keys while paused...")
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    pygame.font.init()
+    screen = Screen(pygame.Surface((800, 600)))
+    gestor = GestorJuego()
+    gestor.cargar_configuracion()
+    gestor.inicializar_juego()
+    for _ in range(30):
+        gestor.actualizar(1 / 60)
+    gestor.pausar_juego()
+    pantalla = PantallaJuego()
+    pantalla.gestor_juego = gestor
+    overlays = GestorOverlays(800, 600)
+
+    def componer(screen):
+        pantalla.dibujar(screen)
+        screen.blit(overlays.velo(128), (0, 0))
+        pantalla.compositor.invalidar()
+
+    def dibujar_pausa():
+        # Misma clave que usan main.py y jugar_directo.py
+        return overlays.dibujar(screen, (EstadoJuego.PAUSADO, pantalla.firma_vista()), componer)
+
+    assert dibujar_pausa() and not dibujar_pausa()
+    cambios = (
+        lambda: pantalla.manejar_tecla_vista_arbol(keys.EQUALS),
+        lambda: pantalla.manejar_tecla_vista_arbol(keys.L),
+        lambda: setattr(pantalla, "mostrar_arbol", False),
+        pantalla.alternar_perfil,
+    )
+    for cambio in cambios:
+        antes = pygame.image.tobytes(screen.surface, "RGB")
+        composiciones = overlays.composiciones
+        cambio()
+        assert dibujar_pausa()
+        assert pygame.image.tobytes(screen.surface, "RGB") != antes
+        # El overlay vuelve a copiarse apenas la vista queda quieta
+        while dibujar_pausa():
+            assert overlays.composiciones - composiciones <= 2
+        assert not dibujar_pausa()
+    print("✅ Paused overlay follows view keys")
+
+
+if __name__ == "__main__":
+    test_overlay_is_composed_once_per_content()
+    test_paused_overlay_follows_view_keys()
+    print("\n🎉 All overlay tests passed!")
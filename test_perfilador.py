@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the frame-phase profiler.
+"""
+
+import json
+
+from logic.gestor_juego import EstadoJuego, GestorJuego
+from logic.perfilador import HistogramaMovil, PerfiladorFrames
+
+
+def test_rolling_percentiles_and_disabled_profiler():
+    """Test nearest-rank percentiles over the rolling window and the disabled no-op path."""
+    print("🧪 Testing rolling histograms...")
+    histograma = HistogramaMovil(capacidad=100)
+    for milisegundos in range(1, 201):
+        histograma.agregar(milisegundos / 1e3)
+    resumen = histograma.resumen()
+    # Solo las últimas 100 muestras (101..200 ms) cuentan para los percentiles
+    assert round(resumen["p50_ms"]) == 151 and round(resumen["p95_ms"]) == 196 and round(resumen["p99_ms"]) == 200
+    assert resumen["muestras"] == 200 and round(resumen["media_ms"], 1) == 100.5 and round(resumen["max_ms"]) == 200
+
+    perfilador = PerfiladorFrames()
+    assert perfilador.marcar() == 0.0 and perfilador.registrar("fase", 0.0) == 0.0
+    assert perfilador.agregar("fase", 1.0) == 0.0
+    assert perfilador.fases == {}
+    perfilador.activar()
+    t = perfilador.registrar("a", perfilador.marcar())
+    perfilador.registrar("b", t)
+    assert list(perfilador.fases) == ["a", "b"]
+    print("✅ Rolling histograms work")
+
+
+def test_game_dumps_phase_profile_at_end(tmp_path):
+    """Test that a profiled game times every update phase and dumps them to JSON at game end."""
+    print("🧪 Testing the end-of-game profile dump...")
+    with open("data/configuracion.json", encoding="utf-8") as archivo:
+        config = json.load(archivo)
+    config["configuracion"]["perfilar"] = True
+    config["configuracion"]["archivo_perfil"] = str(tmp_path / "perfil.json")
+    ruta = tmp_path / "config.json"
+    ruta.write_text(json.dumps(config), encoding="utf-8")
+
+    gestor = GestorJuego(str(ruta))
+    assert gestor.cargar_configuracion()
+    gestor.inicializar_juego()
+    frames = 0
+    while gestor.estado_actual == EstadoJuego.JUGANDO:
+        gestor.actualizar(1 / 60)
+        frames += 1
+
+    with open(tmp_path / "perfil.json", encoding="utf-8") as archivo:
+        fases = json.load(archivo)["fases"]
+    esperadas = ["carrito", "ventana", "poda", "puntuacion", "colisiones", "total"]
+    assert list(fases) == [f"actualizar.{fase}" for fase in esperadas]
+    assert all(datos["muestras"] == frames for datos in fases.values())
+    assert fases["actualizar.total"]["p99_ms"] >= fases["actualizar.total"]["p50_ms"] > 0
+    print("✅ Profile dumped with every phase")
+
+
+if __name__ == "__main__":
+    import pathlib
+    import tempfile
+
+    test_rolling_percentiles_and_disabled_profiler()
+    with tempfile.TemporaryDirectory() as directorio:
+        test_game_dumps_phase_profile_at_end(pathlib.Path(directorio))
+    print("\n🎉 All profiler tests passed!")
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the leveled, per-category logging layer.
+"""
+
+import contextlib
+import io
+
+from logic import registro
+from logic.gestor_juego import GestorJuego
+
+
+class _Contador:
+    """Counts how many times it is formatted."""
+
+    def __init__(self):
+        self.veces = 0
+
+    def __str__(self):
+        self.veces += 1
+        return "contador"
+
+
+def test_levels_categories_and_lazy_formatting():
+    """Test level and category filters, and that disabled messages are never formatted."""
+    print("🧪 Testing logging levels and categories...")
+    colisiones = registro.obtener_registro("colisiones")
+    ventana = registro.obtener_registro("ventana")
+    assert registro.obtener_registro("colisiones") is colisiones
+    try:
+        registro.configurar_desde_texto("aviso,colisiones=depuracion")
+        assert colisiones.depurando and not ventana.depurando
+
+        oculto = _Contador()
+        salida = io.StringIO()
+        with contextlib.redirect_stdout(salida):
+            ventana.depurar("oculto %s", oculto)
+            ventana.informar("oculto %s", oculto)
+            ventana.avisar("visible %s", 1)
+            colisiones.depurar("visible %s", 2)
+            with registro.silenciado():
+                colisiones.avisar("oculto %s", oculto)
+                colisiones.error("error %s", 3)
+        assert oculto.veces == 0
+        assert salida.getvalue().splitlines() == ["visible 1", "visible 2", "error 3"]
+
+        registro.configurar("error")
+        assert not colisiones.depurando and colisiones.informar is registro._nada
+        try:
+            registro.configurar("ruidoso")
+            assert False, "Unknown levels must be rejected"
+        except ValueError:
+            pass
+    finally:
+        registro.configurar()
+    print("✅ Logging levels and categories work")
+
+
+def test_game_is_quiet_by_default_per_frame():
+    """Test that per-frame debug messages stay off at the default level."""
+    print("🧪 Testing per-frame messages at the default level...")
+    gestor = GestorJuego()
+    assert gestor.cargar_configuracion()
+    gestor.inicializar_juego()
+    gestor.carrito.energia_actual = gestor.carrito.energia_maxima = 10**9
+
+    salida = io.StringIO()
+    with contextlib.redirect_stdout(salida):
+        for _ in range(120):
+            gestor.actualizar(1 / 60)
+    lineas = salida.getvalue().splitlines()
+    assert all(linea.startswith(("¡COLISIÓN!", "Energía restante")) for linea in lineas), lineas[:3]
+    print("✅ Per-frame debug output is off by default")
+
+
+if __name__ == "__main__":
+    test_levels_categories_and_lazy_formatting()
+    test_game_is_quiet_by_default_per_frame()
+    print("\n🎉 All logging tests passed!")
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the headless simulation runner.
+"""
+
+import json
+import subprocess
+import sys
+
+from logic.simular import PoliticaAleatoria, PoliticaEntrada, PoliticaGuion, simular
+from logic.simular_lote import generar_trabajos, jugar_trabajo, simular_lote
+
+
+def test_headless_games_are_deterministic():
+    """Test that seeded random and scripted games replay identically."""
+    print("🧪 Testing headless simulation determinism...")
+    for crear_politica in (
+        lambda numero: PoliticaAleatoria(numero),
+        lambda numero: PoliticaGuion({10: "saltar", 40: "mover_arriba", 90: "mover_abajo"}),
+        lambda numero: PoliticaEntrada(),
+    ):
+        primera = simular("data/configuracion.json", 3, crear_politica)
+        segunda = simular("data/configuracion.json", 3, crear_politica)
+        for a, b in zip(primera, segunda):
+            assert a["ticks"] > 0
+            assert a["ticks"] == b["ticks"]
+            assert a["estadisticas"] == b["estadisticas"]
+            assert a["estadisticas"]["estado_juego"] == "juego_terminado"
+
+    try:
+        PoliticaGuion({5: "volar"})
+        assert False, "Unknown actions must be rejected"
+    except ValueError:
+        pass
+    print("✅ Headless games are deterministic")
+
+
+def test_cli_runs_without_pygame(tmp_path):
+    """Test that `python -m logic.simular` never imports pygame."""
+    print("🧪 Testing the headless CLI without pygame...")
+    guion = tmp_path / "guion.json"
+    guion.write_text(json.dumps([[10, "saltar"], [20, "mover_abajo"]]), encoding="utf-8")
+    codigo = (
+        "import sys, runpy\n"
+        "sys.modules['pygame'] = None\n"
+        f"sys.argv = ['simular', '--partidas', '2', '--politica', 'guion', '--guion', {str(guion)!r}]\n"
+        "runpy.run_module('logic.simular', run_name='__main__')\n"
+    )
+    salida = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True, check=True).stdout
+    assert "2 partidas" in salida and "ticks/s" in salida
+    print("✅ Headless CLI runs without pygame")
+
+
+def test_batch_matches_serial_games():
+    """Test that the process-pool batch yields the same rows, in order, as serial games."""
+    print("🧪 Testing the process-pool batch runner...")
+    trabajos = generar_trabajos(["data/configuracion.json"], ["aleatoria", "ninguna"], range(4))
+    assert len(trabajos) == 8
+    filas = list(simular_lote(trabajos, procesos=2))
+    serie = [jugar_trabajo(trabajo) for trabajo in trabajos]
+    sin_tiempo = lambda fila: {k: v for k, v in fila.items() if k != "segundos"}
+    assert [sin_tiempo(f) for f in filas] == [sin_tiempo(f) for f in serie]
+    assert all(fila["colisiones"] >= 0 and fila["ticks"] > 0 for fila in filas)
+
+    try:
+        generar_trabajos(["data/configuracion.json"], ["teletransporte"], range(1))
+        assert False, "Unknown policies must be rejected"
+    except ValueError:
+        pass
+    print("✅ Batch runner matches serial games")
+
+
+if __name__ == "__main__":
+    import pathlib
+    import tempfile
+
+    test_headless_games_are_deterministic()
+    with tempfile.TemporaryDirectory() as directorio:
+        test_cli_runs_without_pygame(pathlib.Path(directorio))
+    test_batch_matches_serial_games()
+    print("\n🎉 All headless simulation tests passed!")
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the sliding visibility window against full range queries.
+"""
+
+import random
+
+import pytest
+
+from logic.arbol_avl import ArbolAVL
+from logic.gestor_juego import EstadoJuego, GestorJuego
+from logic.obstaculo import Obstaculo, TipoObstaculo
+from logic.simular import PoliticaAleatoria
+from logic.ventana_visible import VentanaVisible
+
+
+def test_window_deltas_match_full_recompute():
+    """Test that enter/exit deltas match diffing two full range queries."""
+    print("🧪 Testing sliding window deltas...")
+    generador = random.Random(11)
+    claves = generador.sample(range(6 * 5000), 1500)
+    arbol = ArbolAVL.desde_lista(Obstaculo(c // 6, c % 6, TipoObstaculo.ROCA) for c in claves)
+    ventana = VentanaVisible()
+
+    x = 0
+    anteriores = set()
+    for _ in range(400):
+        x += generador.choice([0, 3, 8, 25, 120])
+        # A veces se elimina del árbol un obstáculo visible (como al chocar con un cono)
+        if ventana.obstaculos and generador.random() < 0.2:
+            eliminado = generador.choice(list(ventana.obstaculos))
+            assert arbol.eliminar(eliminado)
+            assert ventana.descartar(eliminado)
+            anteriores.discard(eliminado)
+
+        entraron, salieron = ventana.desplazar(arbol, x, x + 300)
+        actuales = set(arbol.buscar_en_rango(x, x + 300, 0, 5))
+
+        assert list(ventana.obstaculos) == sorted(actuales, key=lambda o: (o.x, o.y))
+        assert ventana.claves == {(o.x, o.y) for o in actuales}
+        assert set(entraron) == actuales - anteriores
+        assert set(salieron) == anteriores - actuales
+        anteriores = actuales
+    print("✅ Window deltas match full recomputation")
+
+
+def test_game_loop_uses_window():
+    """Test that the game loop keeps the visible window in sync while playing."""
+    print("🧪 Testing window inside the game loop...")
+    gestor = GestorJuego()
+    gestor.cargar_configuracion()
+    gestor.inicializar_juego()
+
+    for _ in range(200):
+        gestor.actualizar(1 / 60)
+        x = gestor.carrito.x
+        esperados = gestor.arbol_obstaculos.buscar_en_rango(x, x + gestor.rango_vision, 0, 5)
+        assert list(gestor.obstaculos_visibles) == esperados
+    print("✅ Game loop window stays in sync")
+
+
+class _GestorConRastro(GestorJuego):
+    """GestorJuego that records the collisions of each frame."""
+
+    def procesar_colision(self, obstaculo):
+        self.rastro_colisiones.append((obstaculo, obstaculo.obtener_daño()))
+        super().procesar_colision(obstaculo)
+
+
+def test_score_matches_full_recompute_scoring():
+    """Test that a seeded game scores like diffing full range queries every frame."""
+    print("🧪 Testing score against full-query scoring...")
+    gestor = _GestorConRastro()
+    gestor.cargar_configuracion()
+    gestor.inicializar_juego()
+    politica = PoliticaAleatoria(semilla=3, probabilidad=0.08)
+
+    # Puntuación calculada como antes de la ventana: visibles del frame anterior
+    # menos los del frame actual, con los conos y manchas chocados aún visibles
+    puntuacion = 0
+    anteriores = set()
+    conos_chocados = 0
+    tick = 0
+    while gestor.estado_actual == EstadoJuego.JUGANDO and tick < 20000:
+        accion = politica.decidir(gestor, tick)
+        if accion is not None:
+            getattr(gestor.carrito, accion)()
+        x_anterior = gestor.carrito.x
+        gestor.rastro_colisiones = []
+        gestor.actualizar(1 / 60)
+        tick += 1
+
+        x = gestor.carrito.x
+        actuales = set(gestor.arbol_obstaculos.buscar_en_rango(x, x + gestor.rango_vision, 0, 5))
+        for obstaculo, _ in gestor.rastro_colisiones:
+            if x <= obstaculo.x <= x + gestor.rango_vision and obstaculo not in actuales:
+                actuales.add(obstaculo)
+                conos_chocados += 1
+        if x > x_anterior:
+            puntuacion += (x - x_anterior) * 0.1
+        puntuacion += len(anteriores - actuales) * 5
+        for _, daño in gestor.rastro_colisiones:
+            puntuacion = max(0, puntuacion - daño)
+        anteriores = actuales
+
+        assert gestor.puntuacion == pytest.approx(puntuacion)
+
+    assert conos_chocados > 0
+    print("✅ Score matches full-query scoring")
+
+
+if __name__ == "__main__":
+    test_window_deltas_match_full_recompute()
+    test_game_loop_uses_window()
+    test_score_matches_full_recompute_scoring()
+    print("\n🎉 All sliding window tests passed!")
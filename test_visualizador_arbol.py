@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the versioned layout and layer cache of the tree visualizer.
+"""
+
+import os
+
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+pygame = pytest.importorskip("pygame")
+pytest.importorskip("pgzero.screen")
+
+from pgzero.constants import keys
+from pgzero.screen import Screen
+
+from logic.arbol_avl import ArbolAVL
+from logic.arbol_rojo_negro import ArbolRojoNegro
+from logic.gestor_juego import GestorJuego
+from logic.obstaculo import Obstaculo, TipoObstaculo
+from logic.treap import Treap
+from view.pantalla_juego import PantallaJuego
+from view.visualizador_arbol import VisualizadorArbol
+
+
+def test_tree_layer_is_redrawn_only_on_changes():
+    """Test that the layer is reused, patched for highlight changes and rebuilt on tree changes."""
+    print("🧪 Testing the tree visualizer cache...")
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    pygame.font.init()
+    screen = Screen(pygame.Surface((800, 600)))
+    arbol = ArbolAVL.desde_lista([Obstaculo(x, 150, TipoObstaculo.ROCA) for x in range(0, 300, 20)])
+    visualizador = VisualizadorArbol()
+
+    posiciones = visualizador.calcular_posiciones_nodos(arbol)
+    assert visualizador.calcular_posiciones_nodos(arbol) is posiciones
+    for _ in range(3):
+        visualizador.dibujar_arbol(screen, arbol, 380, 50)
+    assert visualizador.capas_dibujadas == 1
+
+    visualizador.iniciar_animacion_recorrido(arbol.recorrido_en_anchura())
+    visualizador.dibujar_arbol(screen, arbol, 380, 50)
+    assert visualizador.actualizar_animacion_recorrido()
+    assert visualizador.obtener_paso_actual() == arbol.recorrido_en_anchura()[1]
+    visualizador.dibujar_arbol(screen, arbol, 380, 50)
+    assert visualizador.capas_dibujadas == 1 and visualizador.nodos_redibujados == 2
+
+    # Los nodos redibujados sobre la capa quedan igual que en un dibujo completo
+    nuevo = VisualizadorArbol()
+    nuevo.iniciar_animacion_recorrido(arbol.recorrido_en_anchura())
+    nuevo.actualizar_animacion_recorrido()
+    capa, origen = visualizador._obtener_capa(arbol)
+    capa_nueva, origen_nuevo = nuevo._obtener_capa(arbol)
+    assert origen == origen_nuevo
+    assert pygame.image.tobytes(capa, "RGBA") == pygame.image.tobytes(capa_nueva, "RGBA")
+
+    arbol.insertar(Obstaculo(310, 150, TipoObstaculo.ROCA))
+    nuevas = visualizador.calcular_posiciones_nodos(arbol)
+    assert nuevas is not posiciones and len(nuevas) == len(posiciones) + 1
+    visualizador.dibujar_arbol(screen, arbol, 380, 50)
+    assert visualizador.capas_dibujadas == 2
+
+    raiz_x, raiz_y = nuevas[arbol.raiz]
+    assert visualizador.obtener_nodo_en_posicion(arbol, raiz_x, raiz_y) is arbol.raiz
+    assert screen.surface.get_at((380 + raiz_x, 50 + raiz_y - 18))[:3] == visualizador.color_recorrido
+    print("✅ Tree visualizer cache works")
+
+
+def test_large_trees_collapse_and_cull():
+    """Test that big trees draw a bounded number of nodes and that zoom reveals more detail."""
+    print("🧪 Testing level of detail and culling...")
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    pygame.font.init()
+    screen = Screen(pygame.Surface((800, 600)))
+    arbol = ArbolAVL.desde_lista([Obstaculo(x, 150, TipoObstaculo.ROCA) for x in range(0, 50000, 10)])
+    visualizador = VisualizadorArbol()
+
+    visualizador.dibujar_arbol(screen, arbol, 380, 50)
+    lejos = len(visualizador._disposicion)
+    assert lejos < 100 and visualizador._agregados
+    assert visualizador.obtener_nodo_en_posicion(arbol, *visualizador.calcular_posiciones_nodos(arbol)[arbol.raiz]) is arbol.raiz
+
+    # Al acercar se ven nodos más profundos, pero la cantidad dibujada sigue acotada
+    visualizador.cambiar_zoom(8)
+    visualizador.desplazar_vista(0, 3 * visualizador.espaciado_nivel)
+    visualizador.dibujar_arbol(screen, arbol, 380, 50)
+    assert len(visualizador._disposicion) < 100
+    posiciones = visualizador.calcular_posiciones_nodos(arbol)
+    for x, y in posiciones.values():
+        # Si dos nodos se solapan gana el primero en preorden, como en el recorrido completo
+        esperado = next(
+            nodo for nodo, (nx, ny) in posiciones.items()
+            if (x - nx) ** 2 + (y - ny) ** 2 <= visualizador.radio_nodo ** 2
+        )
+        assert visualizador.obtener_nodo_en_posicion(arbol, x, y) is esperado
+    assert visualizador.obtener_nodo_en_posicion(arbol, -500, -500) is None
+    profundidad = max(y for _, _, _, y, _ in visualizador._disposicion)
+    assert profundidad > 0 and visualizador.capas_dibujadas == 2
+
+    visualizador.restablecer_vista()
+    visualizador.dibujar_arbol(screen, arbol, 380, 50)
+    assert len(visualizador._disposicion) == lejos
+    print("✅ Level of detail and culling work")
+
+
+def test_view_keys_move_the_tree_only_while_visible():
+    """Test the shared tree-view key handler used by both entry points."""
+    print("🧪 Testing tree view keys...")
+    pantalla = PantallaJuego()
+    visualizador = pantalla.visualizador_arbol
+
+    assert pantalla.manejar_tecla_vista_arbol(keys.EQUALS) and visualizador.zoom == 2
+    assert pantalla.manejar_tecla_vista_arbol(keys.K)
+    assert visualizador.desplazamiento_y == visualizador.espaciado_nivel
+    assert not pantalla.manejar_tecla_vista_arbol(keys.SPACE)
+
+    pantalla.mostrar_arbol = False
+    assert not pantalla.manejar_tecla_vista_arbol(keys.K_0) and visualizador.zoom == 2
+    pantalla.mostrar_arbol = True
+    assert pantalla.manejar_tecla_vista_arbol(keys.K_0)
+    assert (visualizador.zoom, visualizador.desplazamiento_x, visualizador.desplazamiento_y) == (1.0, 0, 0)
+    print("✅ Tree view keys work")
+
+
+def test_default_course_is_drawn_in_full():
+    """Test that the default course fits the default view without collapsed subtrees."""
+    print("🧪 Testing the default course at the default zoom...")
+    gestor = GestorJuego()
+    gestor.cargar_configuracion()
+    gestor.inicializar_juego()
+    arbol = gestor.arbol_obstaculos
+    visualizador = VisualizadorArbol()
+
+    posiciones = visualizador.calcular_posiciones_nodos(arbol)
+    assert visualizador._agregados == []
+    assert len(posiciones) == arbol.obtener_total_obstaculos() == 30
+    print("✅ Default course is drawn without aggregate glyphs")
+
+
+def test_engines_without_stored_heights_skip_subtree_summaries():
+    """Test that red-black and treap glyphs keep only the key range, without walking subtrees."""
+    print("🧪 Testing glyphs for engines without stored heights...")
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    pygame.font.init()
+    screen = Screen(pygame.Surface((800, 600)))
+    for motor in (ArbolRojoNegro, Treap):
+        arbol = motor.desde_lista([Obstaculo(x, 150, TipoObstaculo.ROCA) for x in range(0, 50000, 10)])
+        visualizador = VisualizadorArbol()
+        visualizador.dibujar_arbol(screen, arbol, 380, 50)
+
+        assert visualizador._agregados
+        for indice in visualizador._agregados:
+            nodo, _, _, _, (cantidad, altura, minima, maxima) = visualizador._disposicion[indice]
+            assert cantidad is None and altura is None
+            assert minima <= (nodo.obstaculo.x, nodo.obstaculo.y) <= maxima
+
+        # Podar el árbol cambia su versión y rehace la disposición con el mismo resumen
+        arbol.eliminar_hasta(1000)
+        visualizador.dibujar_arbol(screen, arbol, 380, 50)
+        assert visualizador.capas_dibujadas == 2
+    print("✅ Glyphs skip subtree summaries when nodes do not store them")
+
+
+if __name__ == "__main__":
+    test_tree_layer_is_redrawn_only_on_changes()
+    test_large_trees_collapse_and_cull()
+    test_view_keys_move_the_tree_only_while_visible()
+    test_default_course_is_drawn_in_full()
+    test_engines_without_stored_heights_skip_subtree_summaries()
+    print("\n🎉 All tree visualizer tests passed!")
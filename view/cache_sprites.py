@@ -0,0 +1,92 @@
+"""
+Caché de sprites escalados.
+Responsabilidad: Escalar cada imagen una sola vez por tamaño distinto en lugar de una
+vez por obstáculo y por frame, con desalojo LRU y contadores de aciertos y fallos.
+"""
+
+import pygame
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+
+class CacheSprites:
+    """
+    Guarda las imágenes escaladas por (nombre, ancho, alto).
+    """
+
+    def __init__(self, imagenes: Dict[str, pygame.Surface], capacidad: int = 64):
+        """
+        Inicializa la caché.
+
+        Args:
+            imagenes (Dict[str, pygame.Surface]): Imágenes originales por nombre
+            capacidad (int): Máximo de imágenes escaladas guardadas
+        """
+        self.imagenes = imagenes
+        self.capacidad = capacidad
+        self._escaladas: "OrderedDict[Tuple[str, int, int], pygame.Surface]" = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+
+    def obtener(self, nombre: str, ancho: int, alto: int) -> Optional[pygame.Surface]:
+        """
+        Obtiene la imagen escalada, escalándola solo si no está en la caché.
+
+        Args:
+            nombre (str): Nombre de la imagen ("carrito", "roca", ...)
+            ancho (int): Ancho deseado en píxeles
+            alto (int): Alto deseado en píxeles
+
+        Returns:
+            Optional[pygame.Surface]: Imagen escalada, o None si no hay imagen con ese nombre
+        """
+        clave = (nombre, ancho, alto)
+        escalada = self._escaladas.get(clave)
+        if escalada is not None:
+            self.aciertos += 1
+            self._escaladas.move_to_end(clave)
+            return escalada
+
+        original = self.imagenes.get(nombre)
+        if original is None:
+            return None
+
+        self.fallos += 1
+        escalada = pygame.transform.scale(original, (ancho, alto))
+        self._escaladas[clave] = escalada
+        if len(self._escaladas) > self.capacidad:
+            self._escaladas.popitem(last=False)
+            self.desalojos += 1
+        return escalada
+
+    def precalentar(self, tamaños: Iterable[Tuple[str, int, int]]) -> None:
+        """
+        Escala de antemano los tamaños conocidos, sin contarlos como fallos.
+
+        Args:
+            tamaños (Iterable[Tuple[str, int, int]]): Tuplas (nombre, ancho, alto)
+        """
+        fallos = self.fallos
+        for nombre, ancho, alto in tamaños:
+            self.obtener(nombre, ancho, alto)
+        self.fallos = fallos
+
+    def limpiar(self) -> None:
+        """Descarta las imágenes escaladas y reinicia los contadores."""
+        self._escaladas.clear()
+        self.aciertos = self.fallos = self.desalojos = 0
+
+    def estadisticas(self) -> Dict[str, int]:
+        """
+        Obtiene los contadores de la caché.
+
+        Returns:
+            Dict[str, int]: Aciertos, fallos, desalojos y cantidad de imágenes guardadas
+        """
+        return {
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "desalojos": self.desalojos,
+            "tamaño": len(self._escaladas),
+        }
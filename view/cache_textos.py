@@ -0,0 +1,105 @@
+"""
+Caché de textos renderizados.
+Responsabilidad: Renderizar cada texto una sola vez por (texto, tamaño, color) con el
+mismo motor que screen.draw.text (ptext de pygame-zero) y reutilizar la superficie en los
+frames siguientes, con tamaño acotado por desalojo LRU.
+"""
+
+import pygame
+from collections import OrderedDict
+from typing import Dict, Iterable, Tuple
+from pgzero import ptext
+
+
+class CacheTextos:
+    """
+    Guarda las superficies de texto por (texto, tamaño de fuente, color).
+    """
+
+    def __init__(self, capacidad: int = 256):
+        """
+        Inicializa la caché.
+
+        Args:
+            capacidad (int): Máximo de textos renderizados guardados
+        """
+        self.capacidad = capacidad
+        self._superficies: "OrderedDict[Tuple[str, int, object], pygame.Surface]" = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def obtener(self, texto: str, tamaño: int, color="white") -> pygame.Surface:
+        """
+        Obtiene la superficie de un texto, renderizándolo solo si no está en la caché.
+
+        Args:
+            texto (str): Texto a renderizar
+            tamaño (int): Tamaño de fuente, como fontsize de screen.draw.text
+            color: Nombre o tupla RGB del color
+
+        Returns:
+            pygame.Surface: Texto renderizado
+        """
+        clave = (texto, tamaño, color)
+        superficie = self._superficies.get(clave)
+        if superficie is not None:
+            self.aciertos += 1
+            self._superficies.move_to_end(clave)
+            return superficie
+
+        self.fallos += 1
+        # ptext guarda su propia caché; aquí solo interesa la superficie
+        superficie = ptext.getsurf(texto, fontsize=tamaño, color=color, cache=False)
+        self._superficies[clave] = superficie
+        if len(self._superficies) > self.capacidad:
+            self._superficies.popitem(last=False)
+        return superficie
+
+    def dibujar(self, screen, texto: str, posicion: Tuple[int, int], tamaño: int, color="white") -> None:
+        """
+        Dibuja un texto con su esquina superior izquierda en la posición dada.
+
+        Args:
+            screen: Pantalla de pygame-zero
+            texto (str): Texto a dibujar
+            posicion (Tuple[int, int]): Esquina superior izquierda
+            tamaño (int): Tamaño de fuente
+            color: Nombre o tupla RGB del color
+        """
+        screen.surface.blit(self.obtener(texto, tamaño, color), posicion)
+
+    def componer(
+        self, textos: Iterable[Tuple[str, Tuple[int, int], int, object]]
+    ) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """
+        Compone varios textos fijos en una sola superficie transparente, para dibujar
+        un panel estático con un único blit.
+
+        Args:
+            textos: Tuplas (texto, posición, tamaño, color) en coordenadas de pantalla
+
+        Returns:
+            Tuple[pygame.Surface, Tuple[int, int]]: Superficie compuesta y posición donde dibujarla
+        """
+        piezas = [
+            (ptext.getsurf(texto, fontsize=tamaño, color=color, cache=False), posicion)
+            for texto, posicion, tamaño, color in textos
+        ]
+        area = pygame.Rect(piezas[0][1], piezas[0][0].get_size())
+        for superficie, posicion in piezas[1:]:
+            area.union_ip(pygame.Rect(posicion, superficie.get_size()))
+
+        panel = pygame.Surface(area.size, pygame.SRCALPHA)
+        for superficie, (x, y) in piezas:
+            # MAX copia los píxeles tal cual sobre el fondo transparente (sin mezclar dos veces)
+            panel.blit(superficie, (x - area.x, y - area.y), special_flags=pygame.BLEND_RGBA_MAX)
+        return panel, area.topleft
+
+    def estadisticas(self) -> Dict[str, int]:
+        """
+        Obtiene los contadores de la caché.
+
+        Returns:
+            Dict[str, int]: Aciertos, fallos y cantidad de textos guardados
+        """
+        return {"aciertos": self.aciertos, "fallos": self.fallos, "tamaño": len(self._superficies)}
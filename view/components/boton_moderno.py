@@ -5,6 +5,9 @@ Responsabilidad: Renderizar botones con diseño moderno y manejar estados.
 
 import pygame
 from typing import Tuple, Optional, Callable
+from logic.registro import obtener_registro
+
+_registro = obtener_registro("vista")
 
 
 class BotonModerno:
@@ -104,12 +107,12 @@ class BotonModerno:
             bool: True si se ejecutó la acción
         """
         if self.verificar_clic(pos):
-            print(f"Clic en botón: {self.texto}")
+            _registro.depurar("Clic en botón: %s", self.texto)
             if self.accion:
                 resultado = self.accion()
-                print(f"Resultado de la acción del botón: {resultado}")
+                _registro.depurar("Resultado de la acción del botón: %s", resultado)
             else:
-                print("Este botón no tiene acción definida")
+                _registro.depurar("Este botón no tiene acción definida")
             return True
         return False
 
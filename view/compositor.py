@@ -0,0 +1,200 @@
+"""
+Compositor de la pantalla por regiones sucias.
+Responsabilidad: Comparar lo que se dibuja en cada frame con lo del frame anterior y
+repintar solo las regiones que cambiaron, dejando intacto el resto de la pantalla.
+
+Cada frame se describe como una lista de elementos en orden de dibujo (de atrás hacia
+adelante). Un elemento es una tupla (rect, firma, dibujar, argumentos):
+    rect        pygame.Rect que cubre todo lo que dibuja el elemento
+    firma       valor hashable que cambia cuando cambia lo que dibuja
+    dibujar     función llamada como dibujar(screen, *argumentos)
+    argumentos  tupla de argumentos de dibujar
+
+Un elemento cuyo rect o firma no estaban en el frame anterior (o que dejó de estar)
+ensucia su rect. Las regiones sucias se agrupan y en cada una se redibujan, recortados
+a la región, todos los elementos que la tocan, así que las capas superpuestas quedan
+igual que en un dibujo completo.
+
+Los elementos consecutivos pueden formar grupos con nombre de fase (fondo, carretera,
+obstáculos...). Con un perfilador activo se mide cuánto tarda cada grupo, sumando lo
+que tardó en todas las regiones, y se registra una vez por frame bajo ese nombre.
+"""
+
+import pygame
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from logic.perfilador import PerfiladorFrames
+
+# (rect, firma, dibujar, argumentos)
+Elemento = Tuple[pygame.Rect, Any, Callable[..., None], Tuple]
+
+# (fase, fin): los elementos desde el fin del grupo anterior hasta `fin` (exclusivo)
+Grupo = Tuple[str, int]
+
+_SIN_PERFIL = PerfiladorFrames()  # Perfilador apagado cuando no se pasa ninguno
+
+
+class Compositor:
+    """
+    Repinta en cada frame solo las regiones de la pantalla que cambiaron.
+    """
+
+    def __init__(self, ancho: int, alto: int, fraccion_completa: float = 0.5):
+        """
+        Inicializa el compositor.
+
+        Args:
+            ancho (int): Ancho de la pantalla
+            alto (int): Alto de la pantalla
+            fraccion_completa (float): Fracción de la pantalla sucia a partir de la cual
+                conviene repintarla entera en una sola pasada
+        """
+        self.ancho = ancho
+        self.alto = alto
+        self.fraccion_completa = fraccion_completa
+        self._firmas: Set[Tuple] = set()
+        self._superficie = None
+        self.completo = True  # El próximo frame se dibuja entero
+
+        # Regiones repintadas en el último frame, para pygame.display.update
+        self.regiones: List[pygame.Rect] = []
+
+        self.frames = 0
+        self.frames_completos = 0
+        self.pixeles_repintados = 0
+
+    def invalidar(self) -> None:
+        """
+        Fuerza un dibujo completo en el próximo frame. Llamar cuando algo ajeno al
+        compositor dibujó sobre la pantalla (otra pantalla, un overlay).
+        """
+        self.completo = True
+
+    def componer(
+        self,
+        screen,
+        elementos: List[Elemento],
+        grupos: Sequence[Grupo] = (),
+        perfilador: Optional[PerfiladorFrames] = None,
+    ) -> List[pygame.Rect]:
+        """
+        Repinta las regiones que cambiaron desde el frame anterior.
+
+        Args:
+            screen: Pantalla de pygame-zero
+            elementos (List[Elemento]): Elementos del frame, de atrás hacia adelante
+            grupos (Sequence[Grupo]): Fases de los elementos, en orden; los elementos
+                después del último grupo se dibujan sin medir
+            perfilador (Optional[PerfiladorFrames]): Perfilador donde registrar el
+                tiempo de dibujo de cada grupo
+
+        Returns:
+            List[pygame.Rect]: Regiones repintadas (vacía si nada cambió)
+        """
+        superficie = screen.surface
+        firmas = {(tuple(rect), firma) for rect, firma, _, _ in elementos}
+        pantalla = pygame.Rect(0, 0, self.ancho, self.alto)
+
+        if self.completo or superficie is not self._superficie:
+            regiones = [pantalla]
+        else:
+            cambios = [pygame.Rect(rect) for rect, _ in firmas ^ self._firmas]
+            regiones = self._agrupar(r.clip(pantalla) for r in cambios)
+            if sum(r.width * r.height for r in regiones) > self.fraccion_completa * self.ancho * self.alto:
+                regiones = [pantalla]
+
+        perfilador = perfilador or _SIN_PERFIL
+        marcar = perfilador.marcar
+        tramos = list(grupos)
+        if not tramos or tramos[-1][1] < len(elementos):
+            tramos.append((None, len(elementos)))
+        tiempos = [0.0] * len(tramos)
+
+        recorte = superficie.get_clip()
+        for region in regiones:
+            superficie.set_clip(region)
+            inicio = 0
+            t = marcar()
+            for i, (_, fin) in enumerate(tramos):
+                for j in range(inicio, fin):
+                    rect, _, dibujar, argumentos = elementos[j]
+                    if region.colliderect(rect):
+                        dibujar(screen, *argumentos)
+                ahora = marcar()
+                tiempos[i] += ahora - t
+                t = ahora
+                inicio = fin
+        superficie.set_clip(recorte)
+        for (fase, _), segundos in zip(tramos, tiempos):
+            if fase is not None:
+                perfilador.agregar(fase, segundos)
+
+        self._firmas = firmas
+        self._superficie = superficie
+        self.frames += 1
+        if regiones and regiones[0] is pantalla:
+            self.frames_completos += 1
+        self.completo = False
+        self.pixeles_repintados += sum(r.width * r.height for r in regiones)
+        self.regiones = regiones
+        return regiones
+
+    @staticmethod
+    def _agrupar(rects: Iterable[pygame.Rect]) -> List[pygame.Rect]:
+        """
+        Convierte los rectángulos sucios en regiones disjuntas. Dos rectángulos que se
+        tocan se unen si la unión no agrega más área de la que ya suman; si no (una
+        fila de 1 px que cruza un obstáculo), se recorta el nuevo alrededor de la
+        región existente para no repintar el espacio entre ambos.
+
+        Args:
+            rects (Iterable[pygame.Rect]): Rectángulos sucios
+
+        Returns:
+            List[pygame.Rect]: Regiones disjuntas que cubren a todos
+        """
+        regiones: List[pygame.Rect] = []
+        pendientes = [rect for rect in rects if rect.width and rect.height]
+        while pendientes:
+            rect = pendientes.pop()
+            indice = rect.collidelist(regiones)
+            while indice != -1:
+                region = regiones[indice]
+                union = rect.union(region)
+                if union.width * union.height > rect.width * rect.height + region.width * region.height:
+                    break
+                regiones.pop(indice)
+                rect = union
+                indice = rect.collidelist(regiones)
+            if indice == -1:
+                regiones.append(rect)
+                continue
+
+            # Quedarse con las partes del rectángulo que caen fuera de la región
+            comun = rect.clip(regiones[indice])
+            pendientes.extend(
+                pieza
+                for pieza in (
+                    pygame.Rect(rect.left, rect.top, rect.width, comun.top - rect.top),
+                    pygame.Rect(rect.left, comun.bottom, rect.width, rect.bottom - comun.bottom),
+                    pygame.Rect(rect.left, comun.top, comun.left - rect.left, comun.height),
+                    pygame.Rect(comun.right, comun.top, rect.right - comun.right, comun.height),
+                )
+                if pieza.width > 0 and pieza.height > 0
+            )
+        return regiones
+
+    def estadisticas(self) -> Dict[str, int]:
+        """
+        Obtiene los contadores del compositor.
+
+        Returns:
+            Dict[str, int]: Frames compuestos, frames completos, píxeles repintados y
+                regiones del último frame
+        """
+        return {
+            "frames": self.frames,
+            "frames_completos": self.frames_completos,
+            "pixeles_repintados": self.pixeles_repintados,
+            "regiones": len(self.regiones),
+        }
@@ -4,6 +4,9 @@ Responsabilidad: Manejar clics y teclas de la pantalla.
 """
 
 from typing import Tuple, Optional
+from logic.registro import obtener_registro
+
+_registro = obtener_registro("vista")
 
 
 class ControladorConfiguracion:
@@ -48,7 +51,7 @@ class ControladorConfiguracion:
         # Verificar clic en controles
         if self.pantalla.area_controles.collidepoint(x, y):
             resultado = self._manejar_clic_controles(pos)
-            print(f"🔍 RESULTADO DE _manejar_clic_controles(): {resultado}")
+            _registro.depurar("🔍 RESULTADO DE _manejar_clic_controles(): %s", resultado)
             return resultado
 
         return None
@@ -56,11 +59,11 @@ class ControladorConfiguracion:
     def _manejar_clic_controles(self, pos: Tuple[int, int]) -> Optional[str]:
         """Maneja clics en el área de controles."""
         # Verificar primero el botón de iniciar juego ya que es prioritario
-        print(f"Verificando clic en botón iniciar juego en posición: {pos}")
+        _registro.depurar("Verificando clic en botón iniciar juego en posición: %s", pos)
         if self.pantalla.boton_iniciar.verificar_clic(pos):
-            print("¡Clic detectado en el botón iniciar juego!")
+            _registro.depurar("¡Clic detectado en el botón iniciar juego!")
             resultado = self.pantalla._iniciar_juego()
-            print(f"🔍 RESULTADO DE _iniciar_juego(): {resultado}")
+            _registro.depurar("🔍 RESULTADO DE _iniciar_juego(): %s", resultado)
             return resultado
 
         # Resto de componentes
@@ -0,0 +1,87 @@
+"""
+Overlays de pausa y fin de juego.
+Responsabilidad: Componer una sola vez la pantalla de pausa o de fin de juego (juego
+de fondo, velo semitransparente y textos) y reutilizarla en los frames siguientes,
+volviendo a componerla solo cuando cambia lo que muestra.
+"""
+
+import pygame
+from typing import Callable, Dict, Hashable, Optional
+
+
+class GestorOverlays:
+    """
+    Guarda la última pantalla de overlay compuesta junto con la clave de su contenido.
+    """
+
+    def __init__(self, ancho: int, alto: int):
+        """
+        Inicializa el gestor.
+
+        Args:
+            ancho (int): Ancho de la pantalla
+            alto (int): Alto de la pantalla
+        """
+        self.ancho = ancho
+        self.alto = alto
+        self._velos: Dict[int, pygame.Surface] = {}
+        self._clave: Optional[Hashable] = None
+        self._composicion: Optional[pygame.Surface] = None
+        self.composiciones = 0
+
+    def velo(self, alfa: int) -> pygame.Surface:
+        """
+        Obtiene el velo negro semitransparente que cubre la pantalla; se crea una sola
+        vez por transparencia.
+
+        Args:
+            alfa (int): Opacidad del velo (0-255)
+
+        Returns:
+            pygame.Surface: Velo del tamaño de la pantalla
+        """
+        velo = self._velos.get(alfa)
+        if velo is None:
+            velo = self._velos[alfa] = pygame.Surface((self.ancho, self.alto), pygame.SRCALPHA)
+            velo.fill((0, 0, 0, alfa))
+        return velo
+
+    def dibujar(self, screen, clave: Hashable, componer: Callable[..., None], *argumentos) -> bool:
+        """
+        Dibuja el overlay. Si la clave es la del frame anterior se copia la pantalla ya
+        compuesta con un único blit; si no, se compone de nuevo y se guarda.
+
+        Args:
+            screen: Pantalla de pygame-zero
+            clave (Hashable): Estado y textos que muestra el overlay
+            componer (Callable): Función componer(screen, *argumentos) que dibuja la
+                pantalla completa: juego de fondo, velo y textos
+            *argumentos: Argumentos de componer
+
+        Returns:
+            bool: True si hubo que componer el overlay
+        """
+        superficie = screen.surface
+        if (
+            clave == self._clave
+            and self._composicion is not None
+            and self._composicion.get_size() == superficie.get_size()
+        ):
+            superficie.blit(self._composicion, (0, 0))
+            return False
+
+        componer(screen, *argumentos)
+        if self._composicion is None or self._composicion.get_size() != superficie.get_size():
+            self._composicion = superficie.copy()
+        else:
+            self._composicion.blit(superficie, (0, 0))
+        self._clave = clave
+        self.composiciones += 1
+        return True
+
+    def invalidar(self) -> None:
+        """
+        Descarta la composición guardada. Llamar al salir del overlay, para que al
+        volver a entrar se componga sobre el juego actual.
+        """
+        self._clave = None
@@ -5,11 +5,14 @@ Responsabilidad: Coordinar la interfaz de configuración usando componentes UI.
 
 import pygame
 from typing import Optional, Tuple
+from logic.registro import obtener_registro
 from .visualizador_arbol import VisualizadorArbol
 from .components import BotonModerno, CampoTextoSimple, CampoSimple, BotonesContador, SelectorSimple
 from .dibujador_configuracion import DibujadorConfiguracion
 from .controlador_configuracion import ControladorConfiguracion
 
+_registro = obtener_registro("vista")
+
 
 class PantallaConfiguracion:
     """
@@ -107,11 +110,11 @@ class PantallaConfiguracion:
     def _agregar_obstaculo(self):
         """Agrega un obstáculo al árbol."""
         if not self.gestor_juego:
-            print("Error: No hay gestor de juego")
+            _registro.error("Error: No hay gestor de juego")
             return
 
         if not self.campo_x.valido or not self.campo_y.valido:
-            print("Error: Campos inválidos")
+            _registro.avisar("Error: Campos inválidos")
             return
 
         try:
@@ -124,33 +127,33 @@ class PantallaConfiguracion:
             tipo = TipoObstaculo(tipo_str)
 
             if self.gestor_juego.agregar_obstaculo(x, y, tipo):
-                print(f"Obstáculo agregado: ({x}, {y}) tipo {tipo_str}")
+                _registro.informar("Obstáculo agregado: (%s, %s) tipo %s", x, y, tipo_str)
                 # Resetear a valores por defecto
                 self.campo_x.establecer_valor(0)
                 self.campo_y.establecer_valor(0)
             else:
-                print(f"Error: Ya existe un obstáculo en ({x}, {y})")
+                _registro.avisar("Error: Ya existe un obstáculo en (%s, %s)", x, y)
 
         except Exception as e:
-            print(f"Error al agregar obstáculo: {e}")
+            _registro.error("Error al agregar obstáculo: %s", e)
 
     def _mostrar_recorrido_anchura(self):
         """Muestra el recorrido en anchura."""
         if self.gestor_juego and not self.gestor_juego.arbol_obstaculos.esta_vacio():
             recorrido = self.gestor_juego.obtener_recorrido_anchura()
             self.visualizador.iniciar_animacion_recorrido(recorrido)
-            print("Recorrido en anchura iniciado")
+            _registro.depurar("Recorrido en anchura iniciado")
 
     def _mostrar_recorrido_profundidad(self):
         """Muestra el recorrido en profundidad."""
         if self.gestor_juego and not self.gestor_juego.arbol_obstaculos.esta_vacio():
             recorrido = self.gestor_juego.obtener_recorrido_profundidad()
             self.visualizador.iniciar_animacion_recorrido(recorrido)
-            print("Recorrido en profundidad iniciado")
+            _registro.depurar("Recorrido en profundidad iniciado")
 
     def _iniciar_juego(self):
         """Inicia el juego."""
-        print("🚀 ¡INICIANDO JUEGO DESDE PANTALLA DE CONFIGURACIÓN!")
+        _registro.informar("🚀 ¡INICIANDO JUEGO DESDE PANTALLA DE CONFIGURACIÓN!")
         return "iniciar_juego"
 
 
@@ -249,7 +252,7 @@ class PantallaConfiguracion:
             str: Acción a realizar o None
         """
         resultado = self.controlador.manejar_clic_mouse(pos)
-        print(f"🔍 RESULTADO DE controlador.manejar_clic_mouse(): {resultado}")
+        _registro.depurar("🔍 RESULTADO DE controlador.manejar_clic_mouse(): %s", resultado)
         return resultado
 
 
@@ -6,6 +6,21 @@ Responsabilidad: Renderizar el juego y manejar la interacción durante la partid
 import pygame
 import os
 from typing import List, Dict
+from pgzero.constants import keys
+from logic.carrito import Carrito
+from logic.obstaculo import ObstaculoCompacto
+from logic.perfilador import PerfiladorFrames
+from logic.registro import obtener_registro
+from view.cache_sprites import CacheSprites
+from view.cache_textos import CacheTextos
+from view.compositor import Compositor
+
+_registro = obtener_registro("vista")
+_SIN_PERFIL = PerfiladorFrames()  # Perfilador apagado mientras no hay gestor asignado
+
+COLOR_CARRETERA = (100, 100, 100)
+PERIODO_LINEAS = 20  # Píxeles entre el inicio de dos líneas discontinuas
+LARGO_LINEA = 10
 
 
 class PantallaJuego:
@@ -39,6 +54,12 @@ class PantallaJuego:
             self.y_carretera + 350,  # Carril superior 3 (y=5)
         ]
 
+        # Fondo pre-renderizado (cielo + carretera) y tira de líneas discontinuas
+        self._clave_fondo = None
+        self._superficie_fondo = None
+        self._tira_lineas = None
+        self._y_lineas_discontinuas = []
+
         # Configuración visual
         self.offset_camara = 0
         self.posicion_carrito_pantalla = 100  # Posición fija del carrito en pantalla
@@ -47,14 +68,37 @@ class PantallaJuego:
         self.alto_hud = 80
         self.mostrar_arbol = True  # Activar visualización del árbol por defecto
         self.mostrar_hitbox = False
+        self.mostrar_perfil = False  # Overlay de tiempos por fase (tecla F)
+        self._resumen_perfil = {}
+        self._frames_resumen_perfil = 0
+        self._pie_perfil = ""
+        self._version_perfil = 0
+        self._fondo_perfil = None
         self.visualizador_arbol = None
         
         # Inicializar visualizador del árbol
         from view.visualizador_arbol import VisualizadorArbol
         self.visualizador_arbol = VisualizadorArbol(ancho=400, alto=400)
         
-        # Cargar imágenes
+        # Textos renderizados y paneles fijos (leyenda de controles, fondo del árbol)
+        self.cache_textos = CacheTextos()
+        self._leyenda_controles = None
+        self._fondo_arbol = None
+
+        # Cada frame se repintan solo las regiones que cambiaron
+        self.compositor = Compositor(ancho, alto)
+
+        # Cargar imágenes y escalar de antemano los tamaños por defecto
         self.imagenes = self._cargar_imagenes()
+        self.cache_sprites = CacheSprites(self.imagenes)
+        carrito = Carrito()
+        self.cache_sprites.precalentar(
+            [("carrito", carrito.ancho, carrito.alto)]
+            + [
+                (tipo.value, ancho, alto)
+                for tipo, (ancho, alto) in ObstaculoCompacto.DIMENSIONES_POR_TIPO.items()
+            ]
+        )
 
     def _cargar_imagenes(self) -> Dict[str, pygame.Surface]:
         """
@@ -67,7 +111,7 @@ class PantallaJuego:
         ruta_imagenes = "images"
         
         try:
-            print("🎨 Cargando imágenes del juego...")
+            _registro.informar("🎨 Cargando imágenes del juego...")
             
             # Cargar imagen del carrito (probar primero la mejorada, luego la original)
             carrito_cargado = False
@@ -78,12 +122,12 @@ class PantallaJuego:
                 if os.path.exists(ruta_completa):
                     imagenes["carrito"] = pygame.image.load(ruta_completa).convert_alpha()
                     size = imagenes["carrito"].get_size()
-                    print(f"🚗 Carrito cargado: {ruta} ({size[0]}x{size[1]})")
+                    _registro.informar("🚗 Carrito cargado: %s (%dx%d)", ruta, size[0], size[1])
                     carrito_cargado = True
                     break
                     
             if not carrito_cargado:
-                print("⚠️ No se encontró imagen del carrito")
+                _registro.avisar("⚠️ No se encontró imagen del carrito")
             
             # Cargar imágenes de obstáculos (nuevas imágenes mejoradas)
             obstaculos_ruta = {
@@ -101,94 +145,339 @@ class PantallaJuego:
                 if os.path.exists(ruta_completa):
                     imagenes[tipo] = pygame.image.load(ruta_completa).convert_alpha()
                     size = imagenes[tipo].get_size()
-                    print(f"✅ {tipo.capitalize()}: {archivo} ({size[0]}x{size[1]})")
+                    _registro.informar("✅ %s: %s (%dx%d)", tipo.capitalize(), archivo, size[0], size[1])
                     contador_cargadas += 1
                 else:
-                    print(f"⚠️ No encontrada: {tipo} -> {ruta_completa}")
+                    _registro.avisar("⚠️ No encontrada: %s -> %s", tipo, ruta_completa)
                     
-            print(f"🎮 Resumen: {contador_cargadas}/{len(obstaculos_ruta)} imágenes de obstáculos cargadas")
+            _registro.informar(
+                "🎮 Resumen: %d/%d imágenes de obstáculos cargadas", contador_cargadas, len(obstaculos_ruta)
+            )
                     
         except Exception as e:
-            print(f"❌ Error cargando imágenes: {e}")
+            _registro.error("❌ Error cargando imágenes: %s", e)
             
         return imagenes
 
-    def dibujar(self, screen):
+    def dibujar(self, screen, textos_superpuestos=()):
         """
-        Dibuja toda la pantalla de juego.
+        Dibuja la pantalla de juego. Solo se repintan las regiones que cambiaron desde
+        el frame anterior; el resto de la pantalla se conserva tal cual.
 
         Args:
             screen: Superficie de pygame donde dibujar
+            textos_superpuestos: Tuplas (texto, posición, tamaño, color) que se dibujan
+                encima de todo, como los textos de depuración del punto de entrada
         """
-        self.dibujar_fondo(screen)
-        self.dibujar_carretera(screen)
-        self.dibujar_obstaculos(screen)
-        self.dibujar_carrito(screen)
-        self.dibujar_hud(screen)
-        
-        # Dibujar árbol AVL si está habilitado
-        if self.mostrar_arbol and self.gestor_juego:
-            self.dibujar_visualizacion_arbol(screen)
+        perfilador = self.gestor_juego.perfilador if self.gestor_juego else _SIN_PERFIL
+        inicio_frame = t = perfilador.marcar()
+
+        grupos = []
+        elementos = self.obtener_elementos(screen, perfilador, grupos)
+        for texto, posicion, tamaño, color in textos_superpuestos:
+            elementos.append(self._elemento_texto(texto, posicion, tamaño, color))
+        t = perfilador.registrar("dibujar.elementos", t)
+
+        # Cada grupo de elementos se mide por separado: dibujar.fondo, dibujar.carretera...
+        self.compositor.componer(screen, elementos, grupos, perfilador)
+        perfilador.registrar("dibujar.composicion", t)
+        perfilador.registrar("dibujar.total", inicio_frame)
+
+    def obtener_elementos(self, screen, perfilador=_SIN_PERFIL, grupos=None):
+        """
+        Describe el frame como elementos del compositor, de atrás hacia adelante:
+        fondo, líneas de la carretera, obstáculos, carrito, HUD, leyenda, árbol y perfil.
+
+        Args:
+            screen: Superficie de pygame donde se va a dibujar
+            perfilador (PerfiladorFrames): Perfilador cuyo resumen muestra el overlay
+            grupos (Optional[List[Grupo]]): Si se pasa, se le agrega (fase, fin) al
+                terminar cada capa, para medir su dibujo por separado
+
+        Returns:
+            List[Elemento]: Tuplas (rect, firma, dibujar, argumentos)
+        """
+        if grupos is None:
+            grupos = []
+        self._preparar_fondo(screen)
+        elementos = [(pygame.Rect(0, 0, self.ancho, self.alto), self._clave_fondo, self.dibujar_fondo, ())]
+        grupos.append(("dibujar.fondo", len(elementos)))
+
+        # Cada línea discontinua es una fila de 1 px que cambia con el desplazamiento
+        desplazamiento = self._desplazamiento_lineas()
+        for y_linea in self._y_lineas_discontinuas:
+            elementos.append((
+                pygame.Rect(0, y_linea, self.ancho, 1),
+                desplazamiento,
+                self._dibujar_linea_discontinua,
+                (y_linea, desplazamiento),
+            ))
+        grupos.append(("dibujar.carretera", len(elementos)))
+
+        if self.gestor_juego and self.gestor_juego.carrito:
+            # Margen de 1 px por si las posiciones fraccionarias se redondean distinto
+            for obstaculo, x, y in self._obstaculos_en_pantalla():
+                elementos.append((
+                    pygame.Rect(x - 1, y - 1, obstaculo.ancho + 2, obstaculo.alto + 2),
+                    (obstaculo.tipo.value, self.mostrar_hitbox),
+                    self.dibujar_obstaculo,
+                    (obstaculo, x, y),
+                ))
+            grupos.append(("dibujar.obstaculos", len(elementos)))
+
+            carrito = self.gestor_juego.carrito
+            x, y, color = self._posicion_carrito()
+            rect = pygame.Rect(x, y, carrito.ancho, carrito.alto)
+            if self.mostrar_hitbox:
+                rect.union_ip(self.cache_textos.obtener("HITBOX", 10, "red").get_rect(topleft=(x, y - 15)))
+            elementos.append((rect, (color, self.mostrar_hitbox), self.dibujar_carrito, ()))
+            grupos.append(("dibujar.carrito", len(elementos)))
+
+            elementos.append(
+                (pygame.Rect(0, 0, self.ancho, self.alto_hud), self._firma_hud(), self.dibujar_hud, ())
+            )
+
+            panel, posicion = self._preparar_leyenda()
+            elementos.append((panel.get_rect(topleft=posicion), None, self.dibujar_controles_disponibles, ()))
+            grupos.append(("dibujar.hud", len(elementos)))
+
+        if self.mostrar_arbol and self.gestor_juego and self.visualizador_arbol:
+            elementos.extend(self._elementos_arbol())
+            grupos.append(("dibujar.arbol", len(elementos)))
+
+        if self.mostrar_perfil:
+            rect = self._preparar_perfil(perfilador)
+            elementos.append((rect, (self._version_perfil, self._pie_perfil), self.dibujar_perfil, ()))
+
+        return elementos
+
+    def _elemento_texto(self, texto, posicion, tamaño, color):
+        """
+        Crea el elemento del compositor de un texto de la caché.
+
+        Args:
+            texto (str): Texto a dibujar
+            posicion (Tuple[int, int]): Esquina superior izquierda
+            tamaño (int): Tamaño de fuente
+            color: Nombre o tupla RGB del color
+
+        Returns:
+            Elemento: Tupla (rect, firma, dibujar, argumentos)
+        """
+        rect = self.cache_textos.obtener(texto, tamaño, color).get_rect(topleft=posicion)
+        return (rect, (texto, tamaño, color), self.cache_textos.dibujar, (texto, posicion, tamaño, color))
+
+    def alternar_perfil(self):
+        """
+        Muestra u oculta el overlay del perfilador; al mostrarlo empieza a medir.
+        """
+        self.mostrar_perfil = not self.mostrar_perfil
+        if self.mostrar_perfil and self.gestor_juego:
+            self.gestor_juego.perfilador.activar(True)
+            self._frames_resumen_perfil = 0
+
+    def firma_vista(self):
+        """
+        Obtiene un valor que cambia cuando cambia lo que muestran las capas opcionales
+        (árbol con su zoom y desplazamiento, hitboxes y perfil). Sirve de clave para
+        los overlays que copian una pantalla de juego ya compuesta.
+
+        Returns:
+            Tuple: Firma hashable de la vista
+        """
+        firma_arbol = None
+        if self.mostrar_arbol and self.gestor_juego and self.visualizador_arbol:
+            visualizador = self.visualizador_arbol
+            # Con los mismos resaltados que usaría dibujar, para que la versión coincida
+            visualizador.seguir_ventana(self.gestor_juego.ventana_visible)
+            firma_arbol = (
+                visualizador.zoom,
+                visualizador.desplazamiento_x,
+                visualizador.desplazamiento_y,
+                visualizador.version_dibujo(self.gestor_juego.arbol_obstaculos),
+            )
+        return (self.mostrar_arbol, self.mostrar_hitbox, self.mostrar_perfil, firma_arbol, self._version_perfil)
+
+    def manejar_tecla_vista_arbol(self, key):
+        """
+        Acerca, aleja o mueve la vista del árbol si está visible.
+
+        Args:
+            key: Tecla presionada
+
+        Returns:
+            bool: True si la tecla cambió la vista del árbol
+        """
+        visualizador = self.visualizador_arbol
+        if not visualizador or not self.mostrar_arbol:
+            return False
+        if key in (keys.EQUALS, keys.KP_PLUS):
+            visualizador.cambiar_zoom(2)
+        elif key in (keys.MINUS, keys.KP_MINUS):
+            visualizador.cambiar_zoom(0.5)
+        elif key == keys.J:
+            visualizador.desplazar_vista(-100, 0)
+        elif key == keys.L:
+            visualizador.desplazar_vista(100, 0)
+        elif key == keys.I:
+            visualizador.desplazar_vista(0, -visualizador.espaciado_nivel)
+        elif key == keys.K:
+            visualizador.desplazar_vista(0, visualizador.espaciado_nivel)
+        elif key == keys.K_0:
+            visualizador.restablecer_vista()
+        else:
+            return False
+        return True
+
+    def _preparar_perfil(self, perfilador):
+        """
+        Actualiza los datos del overlay del perfilador. El resumen se recalcula cada
+        30 frames para que ordenar las muestras no pese en el propio frame.
+
+        Args:
+            perfilador (PerfiladorFrames): Perfilador con las mediciones
+
+        Returns:
+            pygame.Rect: Rectángulo que ocupa el overlay
+        """
+        if self._frames_resumen_perfil == 0:
+            self._resumen_perfil = perfilador.resumen()
+            self._version_perfil += 1
+        self._frames_resumen_perfil = (self._frames_resumen_perfil + 1) % 30
+
+        sprites = self.cache_sprites.estadisticas()
+        regiones = self.compositor.estadisticas()["regiones"]
+        self._pie_perfil = (
+            f"sprites: {sprites['aciertos']} aciertos, {sprites['fallos']} fallos, "
+            f"{sprites['desalojos']} desalojos - regiones: {regiones} - F ocultar"
+        )
+        return pygame.Rect(5, self.alto_hud + 6, 300, 14 * (len(self._resumen_perfil) + 2) + 8)
+
+    def dibujar_perfil(self, screen):
+        """
+        Dibuja los percentiles de cada fase del frame, preparados por _preparar_perfil.
+
+        Args:
+            screen: Superficie de pygame donde dibujar
+        """
+        x, y = 10, self.alto_hud + 10
+        alto_fila = 14
+        alto_fondo = alto_fila * (len(self._resumen_perfil) + 2) + 8
+        if self._fondo_perfil is None or self._fondo_perfil.get_height() != alto_fondo:
+            self._fondo_perfil = pygame.Surface((300, alto_fondo), pygame.SRCALPHA)
+            self._fondo_perfil.fill((0, 0, 0, 190))
+        screen.blit(self._fondo_perfil, (x - 5, y - 4))
+
+        columnas = (("fase (ms)", 0), ("p50", 160), ("p95", 205), ("p99", 250))
+        for titulo, dx in columnas:
+            self.cache_textos.dibujar(screen, titulo, (x + dx, y), 12, "yellow")
+
+        presupuesto_ms = 1000 / 60  # Un frame a 60 FPS
+        for fila, (fase, datos) in enumerate(self._resumen_perfil.items(), start=1):
+            y_fila = y + fila * alto_fila
+            color = "red" if datos["p99_ms"] > presupuesto_ms else "white"
+            self.cache_textos.dibujar(screen, fase, (x, y_fila), 12, color)
+            for clave, dx in (("p50_ms", 160), ("p95_ms", 205), ("p99_ms", 250)):
+                self.cache_textos.dibujar(screen, f"{datos[clave]:.2f}", (x + dx, y_fila), 12, color)
+
+        self.cache_textos.dibujar(
+            screen, self._pie_perfil, (x, y + (len(self._resumen_perfil) + 1) * alto_fila), 10, "gray"
+        )
 
     def dibujar_fondo(self, screen):
         """
-        Dibuja el fondo del juego (cielo, etc.).
+        Dibuja el fondo del juego (cielo y carretera sin las líneas discontinuas)
+        copiando la superficie pre-renderizada.
 
         Args:
             screen: Superficie de pygame donde dibujar
         """
-        # Fondo azul cielo
-        screen.draw.filled_rect(pygame.Rect(0, 0, self.ancho, self.y_carretera), (135, 206, 235))
+        self._preparar_fondo(screen)
+        screen.surface.blit(self._superficie_fondo, (0, 0))
 
     def dibujar_carretera(self, screen):
         """
-        Dibuja la carretera con dos carriles principales (3 subcarriles cada uno).
+        Dibuja las líneas discontinuas de los subcarriles. Se copian de una tira
+        pre-renderizada, desplazada según la posición del carrito para que avancen
+        con la carretera.
 
         Args:
             screen: Superficie de pygame donde dibujar
         """
-        # Carretera principal (gris)
-        screen.draw.filled_rect(
-            pygame.Rect(0, self.y_carretera, self.ancho, self.alto_carretera),
-            (100, 100, 100)
+        self._preparar_fondo(screen)
+        desplazamiento = self._desplazamiento_lineas()
+        for y_linea in self._y_lineas_discontinuas:
+            self._dibujar_linea_discontinua(screen, y_linea, desplazamiento)
+
+    def _desplazamiento_lineas(self):
+        """Obtiene dónde empieza, dentro de la tira, la ventana de líneas de este frame."""
+        carrito = self.gestor_juego.carrito if self.gestor_juego else None
+        return int(carrito.x) % PERIODO_LINEAS if carrito else 0
+
+    def _dibujar_linea_discontinua(self, screen, y_linea, desplazamiento):
+        """
+        Copia una fila de líneas discontinuas desde la tira pre-renderizada.
+
+        Args:
+            screen: Superficie de pygame donde dibujar
+            y_linea (int): Fila de la pantalla
+            desplazamiento (int): Inicio de la ventana dentro de la tira
+        """
+        screen.surface.blit(self._tira_lineas, (0, y_linea), pygame.Rect(desplazamiento, 0, self.ancho, 1))
+
+    def invalidar_fondo(self):
+        """
+        Descarta el fondo pre-renderizado; se vuelve a generar en el próximo frame.
+        Llamar después de cambiar la disposición de la carretera.
+        """
+        self._clave_fondo = None
+
+    def _preparar_fondo(self, screen):
+        """
+        Renderiza el fondo y la tira de líneas si cambió el tamaño de la pantalla o
+        la disposición de la carretera.
+
+        Args:
+            screen: Superficie de pygame donde dibujar
+        """
+        clave = (
+            screen.surface.get_size(),
+            self.ancho,
+            self.alto,
+            self.y_carretera,
+            self.alto_carretera,
+            tuple(self.carriles),
         )
-        
+        if clave == self._clave_fondo:
+            return
+
+        # Cielo y carretera (gris) con la división central y los bordes
+        fondo = pygame.Surface((self.ancho, self.alto)).convert()
+        fondo.fill((135, 206, 235), pygame.Rect(0, 0, self.ancho, self.y_carretera))
+        fondo.fill(COLOR_CARRETERA, pygame.Rect(0, self.y_carretera, self.ancho, self.alto_carretera))
+
         # Línea divisoria central entre los dos carriles principales (amarilla sólida)
         y_division_central = self.y_carretera + 200  # Entre el carril 2 y 3
-        for x in range(0, self.ancho, 1):
-            screen.draw.line(
-                (x, y_division_central),
-                (x + 1, y_division_central),
-                (255, 255, 0)  # Amarillo
-            )
-        
-        # Líneas divisorias de subcarriles (blancas discontinuas)
-        for i, y_carril in enumerate(self.carriles):
-            # No dibujar línea después del último carril
-            if i < len(self.carriles) - 1:
-                # No dibujar línea en la división central (entre carril 2 y 3)
-                if i != 2:
-                    # Línea blanca discontinua
-                    for x in range(0, self.ancho, 20):
-                        screen.draw.line(
-                            (x, y_carril + 25),  # Centrar entre carriles
-                            (x + 10, y_carril + 25),
-                            (255, 255, 255)
-                        )
-        
+        pygame.draw.line(fondo, (255, 255, 0), (0, y_division_central), (self.ancho, y_division_central))
+
         # Líneas de borde de la carretera (blancas sólidas)
-        # Borde superior
-        screen.draw.line(
-            (0, self.y_carretera),
-            (self.ancho, self.y_carretera),
-            (255, 255, 255)
-        )
-        # Borde inferior
-        screen.draw.line(
-            (0, self.y_carretera + self.alto_carretera),
-            (self.ancho, self.y_carretera + self.alto_carretera),
-            (255, 255, 255)
-        )
+        for y_borde in (self.y_carretera, self.y_carretera + self.alto_carretera):
+            pygame.draw.line(fondo, (255, 255, 255), (0, y_borde), (self.ancho, y_borde))
+
+        # Tira de líneas discontinuas un periodo más ancha que la pantalla; cada frame
+        # se copia una ventana de ella empezando en el desplazamiento de la cámara
+        tira = pygame.Surface((self.ancho + PERIODO_LINEAS, 1)).convert()
+        tira.fill(COLOR_CARRETERA)
+        for x in range(0, self.ancho + PERIODO_LINEAS, PERIODO_LINEAS):
+            pygame.draw.line(tira, (255, 255, 255), (x, 0), (x + LARGO_LINEA, 0))
+
+        # Líneas centradas entre subcarriles, salvo la división central y tras el último
+        self._y_lineas_discontinuas = [
+            y_carril + 25 for i, y_carril in enumerate(self.carriles[:-1]) if i != 2
+        ]
+        self._superficie_fondo = fondo
+        self._tira_lineas = tira
+        self._clave_fondo = clave
 
     def dibujar_carrito(self, screen):
         """
@@ -201,6 +490,33 @@ class PantallaJuego:
             return
         
         carrito = self.gestor_juego.carrito
+        x_pantalla, y_pantalla, color = self._posicion_carrito()
+        
+        # Dibujar carrito con imagen o rectángulo
+        rect_carrito = pygame.Rect(x_pantalla, y_pantalla, carrito.ancho, carrito.alto)
+        
+        imagen_carrito = self.cache_sprites.obtener("carrito", carrito.ancho, carrito.alto)
+        if imagen_carrito is not None:
+            # Usar imagen del carrito
+            screen.blit(imagen_carrito, (x_pantalla, y_pantalla))
+        else:
+            # Fallback a rectángulo
+            screen.draw.filled_rect(rect_carrito, color)
+            screen.draw.rect(rect_carrito, (255, 255, 255))
+        
+        # Dibujar hitbox en modo debug
+        if self.mostrar_hitbox:
+            screen.draw.rect(rect_carrito, (255, 0, 0), 1)
+            self.cache_textos.dibujar(screen, "HITBOX", (x_pantalla, y_pantalla - 15), 10, "red")
+
+    def _posicion_carrito(self):
+        """
+        Calcula dónde y de qué color se dibuja el carrito en este frame.
+
+        Returns:
+            Tuple[int, int, Tuple[int, int, int]]: Posición en pantalla y color de respaldo
+        """
+        carrito = self.gestor_juego.carrito
         
         # Calcular posición en pantalla
         x_pantalla = self.posicion_carrito_pantalla
@@ -220,29 +536,8 @@ class PantallaJuego:
             color = (255, 0, 0)    # Rojo
         else:
             color = (0, 100, 255)  # Azul
-        
-        # Dibujar carrito con imagen o rectángulo
-        rect_carrito = pygame.Rect(x_pantalla, y_pantalla, carrito.ancho, carrito.alto)
-        
-        if "carrito" in self.imagenes:
-            # Usar imagen del carrito
-            imagen_carrito = self.imagenes["carrito"]
-            imagen_escalada = pygame.transform.scale(imagen_carrito, (carrito.ancho, carrito.alto))
-            screen.blit(imagen_escalada, (x_pantalla, y_pantalla))
-        else:
-            # Fallback a rectángulo
-            screen.draw.filled_rect(rect_carrito, color)
-            screen.draw.rect(rect_carrito, (255, 255, 255))
-        
-        # Dibujar hitbox en modo debug
-        if self.mostrar_hitbox:
-            screen.draw.rect(rect_carrito, (255, 0, 0), 1)
-            screen.draw.text(
-                "HITBOX",
-                (x_pantalla, y_pantalla - 15),
-                fontsize=10,
-                color="red"
-            )
+
+        return x_pantalla, y_pantalla, color
 
     def dibujar_obstaculos(self, screen):
         """
@@ -254,9 +549,18 @@ class PantallaJuego:
         if not self.gestor_juego or not self.gestor_juego.carrito:
             return
         
+        for obstaculo, x_pantalla, y_pantalla in self._obstaculos_en_pantalla():
+            self.dibujar_obstaculo(screen, obstaculo, x_pantalla, y_pantalla)
+
+    def _obstaculos_en_pantalla(self):
+        """
+        Recorre los obstáculos visibles que caen dentro de la pantalla.
+
+        Yields:
+            Tuple: (obstáculo, x, y) con la posición en pantalla de cada uno
+        """
         carrito = self.gestor_juego.carrito
         
-        # Dibujar obstáculos visibles
         for obstaculo in self.gestor_juego.obstaculos_visibles:
             # Calcular posición en pantalla
             x_pantalla = obstaculo.x - carrito.x + self.posicion_carrito_pantalla
@@ -270,7 +574,7 @@ class PantallaJuego:
             
             # Solo dibujar si está en pantalla
             if -50 <= x_pantalla <= self.ancho + 50:
-                self.dibujar_obstaculo(screen, obstaculo, x_pantalla, y_pantalla)
+                yield obstaculo, x_pantalla, y_pantalla
 
     def dibujar_obstaculo(self, screen, obstaculo, x, y):
         """
@@ -296,22 +600,15 @@ class PantallaJuego:
         rect_obstaculo = pygame.Rect(x, y, obstaculo.ancho, obstaculo.alto)
         
         # Intentar usar imagen del obstáculo
-        nombre_imagen = obstaculo.tipo.value
-        if nombre_imagen in self.imagenes:
-            imagen_obstaculo = self.imagenes[nombre_imagen]
-            imagen_escalada = pygame.transform.scale(imagen_obstaculo, (obstaculo.ancho, obstaculo.alto))
-            screen.blit(imagen_escalada, (x, y))
+        imagen_obstaculo = self.cache_sprites.obtener(obstaculo.tipo.value, obstaculo.ancho, obstaculo.alto)
+        if imagen_obstaculo is not None:
+            screen.blit(imagen_obstaculo, (x, y))
         else:
             # Fallback a rectángulo con color
             screen.draw.filled_rect(rect_obstaculo, color)
             screen.draw.rect(rect_obstaculo, (255, 255, 255))
             # Dibujar tipo de obstáculo como texto
-            screen.draw.text(
-                obstaculo.tipo.value[:3].upper(),
-                (x + 2, y + 2),
-                fontsize=8,
-                color="white"
-            )
+            self.cache_textos.dibujar(screen, obstaculo.tipo.value[:3].upper(), (x + 2, y + 2), 8, "white")
         
         # Dibujar hitbox en modo debug
         if self.mostrar_hitbox:
@@ -319,7 +616,8 @@ class PantallaJuego:
 
     def dibujar_hud(self, screen):
         """
-        Dibuja la interfaz de usuario (energía, distancia, controles).
+        Dibuja la interfaz de usuario (energía, distancia, puntuación). La leyenda de
+        controles es un elemento aparte, para no repintarla cada vez que cambia el HUD.
 
         Args:
             screen: Superficie de pygame donde dibujar
@@ -338,9 +636,28 @@ class PantallaJuego:
         
         # Información del juego
         self.dibujar_informacion_juego(screen)
-        
-        # Controles disponibles
-        self.dibujar_controles_disponibles(screen)
+
+    def _firma_hud(self):
+        """
+        Resume lo que muestra el HUD: mientras no cambie, el HUD no se repinta.
+
+        Returns:
+            Tuple: Energía, distancia, puntuación, carril y obstáculos visibles
+        """
+        carrito = self.gestor_juego.carrito
+        porcentaje = carrito.obtener_porcentaje_energia()
+        stats = self.gestor_juego.obtener_estadisticas()
+        return (
+            int(porcentaje * 100),
+            int(200 * porcentaje),
+            porcentaje > 0.5,
+            porcentaje > 0.2,
+            stats["distancia_recorrida"],
+            stats["distancia_total"],
+            stats["puntuacion"],
+            carrito.y,
+            stats["obstaculos_visibles"],
+        )
 
     def dibujar_barra_energia(self, screen):
         """
@@ -368,12 +685,7 @@ class PantallaJuego:
         )
         
         # Texto de energía
-        screen.draw.text(
-            f"Energia: {int(porcentaje * 100)}%",
-            (220, 12),
-            fontsize=14,
-            color="white"
-        )
+        self.cache_textos.dibujar(screen, f"Energia: {int(porcentaje * 100)}%", (220, 12), 14, "white")
 
     def dibujar_informacion_juego(self, screen):
         """
@@ -385,106 +697,77 @@ class PantallaJuego:
         stats = self.gestor_juego.obtener_estadisticas()
         
         # Distancia recorrida
-        screen.draw.text(
+        self.cache_textos.dibujar(
+            screen,
             f"Distancia: {stats['distancia_recorrida']}/{stats['distancia_total']}m",
             (10, 40),
-            fontsize=12,
-            color="white"
+            12,
+            "white",
         )
         
         # Puntuación
-        screen.draw.text(
-            f"Puntuacion: {stats['puntuacion']}",
-            (10, 55),
-            fontsize=12,
-            color="white"
-        )
+        self.cache_textos.dibujar(screen, f"Puntuacion: {stats['puntuacion']}", (10, 55), 12, "white")
         
         # Carril actual del carrito
         carrito = self.gestor_juego.carrito
         carril_nombre = "Inferior" if carrito.y <= 2 else "Superior"
         subcarril = (carrito.y % 3) + 1
-        screen.draw.text(
+        self.cache_textos.dibujar(
+            screen,
             f"Carril: {carril_nombre} {subcarril} (pos {carrito.y})",
             (200, 40),
-            fontsize=12,
-            color="cyan"
+            12,
+            "cyan",
         )
         
         # Obstáculos visibles
-        screen.draw.text(
+        self.cache_textos.dibujar(
+            screen,
             f"Obstaculos visibles: {stats['obstaculos_visibles']}",
             (300, 12),
-            fontsize=12,
-            color="white"
+            12,
+            "white",
         )
 
     def dibujar_controles_disponibles(self, screen):
         """
-        Dibuja los controles disponibles en pantalla.
+        Dibuja los controles disponibles en pantalla. La leyenda no cambia, así que se
+        compone una sola vez en una superficie y cada frame es un único blit.
 
         Args:
             screen: Superficie de pygame donde dibujar
         """
-        # Controles en la esquina inferior derecha
-        x = self.ancho - 200
-        y = self.alto - 80
-        
-        screen.draw.text(
-            "Controles:",
-            (x, y),
-            fontsize=12,
-            color="white"
-        )
-        
-        screen.draw.text(
-            "↑↓ Mover carril (6 carriles)",
-            (x, y + 15),
-            fontsize=10,
-            color="white"
-        )
-        
-        screen.draw.text(
-            "ESPACIO Saltar",
-            (x, y + 30),
-            fontsize=10,
-            color="white"
-        )
-        
-        screen.draw.text(
-            "P Pausar",
-            (x, y + 45),
-            fontsize=10,
-            color="white"
-        )
-        
-        screen.draw.text(
-            "T Mostrar Árbol",
-            (x, y + 60),
-            fontsize=10,
-            color="white"
-        )
-        
-        screen.draw.text(
-            "H Mostrar Hitboxes",
-            (x, y + 75),
-            fontsize=10,
-            color="white"
-        )
-        
-        screen.draw.text(
-            "B Recorrido en anchura",
-            (x - 80, y + 90),
-            fontsize=10,
-            color="white"
-        )
-        
-        screen.draw.text(
-            "D Recorrido en profundidad",
-            (x - 80, y + 105),
-            fontsize=10,
-            color="white"
-        )
+        panel, posicion = self._preparar_leyenda()
+        screen.surface.blit(panel, posicion)
+
+    def _preparar_leyenda(self):
+        """
+        Compone la leyenda de controles si todavía no existe o cambió la pantalla.
+
+        Returns:
+            Tuple[pygame.Surface, Tuple[int, int]]: Leyenda compuesta y su posición
+        """
+        if self._leyenda_controles is None or self._leyenda_controles[2] != (self.ancho, self.alto):
+            # Controles en la esquina inferior derecha
+            x = self.ancho - 200
+            y = self.alto - 80
+            panel, posicion = self.cache_textos.componer([
+                ("Controles:", (x, y), 12, "white"),
+                ("↑↓ Mover carril (6 carriles)", (x, y + 15), 10, "white"),
+                ("ESPACIO Saltar", (x, y + 30), 10, "white"),
+                ("P Pausar", (x, y + 45), 10, "white"),
+                ("T Mostrar Árbol", (x, y + 60), 10, "white"),
+                ("H Mostrar Hitboxes", (x, y + 75), 10, "white"),
+                ("B Recorrido en anchura", (x - 80, y + 90), 10, "white"),
+                ("D Recorrido en profundidad", (x - 80, y + 105), 10, "white"),
+                ("+/- Zoom árbol", (x - 80, y + 45), 10, "white"),
+                ("IJKL 0 Vista", (x - 80, y + 60), 10, "white"),
+                ("F Perfilador", (x - 80, y + 75), 10, "white"),
+            ])
+            self._leyenda_controles = (panel, posicion, (self.ancho, self.alto))
+
+        panel, posicion, _ = self._leyenda_controles
+        return panel, posicion
 
     def dibujar_visualizacion_arbol(self, screen):
         """
@@ -495,56 +778,69 @@ class PantallaJuego:
         """
         if not self.gestor_juego or not self.visualizador_arbol:
             return
-            
-        # Dibujar fondo semitransparente
-        fondo_rect = pygame.Rect(self.ancho - 420, 50, 400, 400)
-        s = pygame.Surface((400, 400), pygame.SRCALPHA)
-        s.fill((0, 0, 0, 180))  # Fondo negro semitransparente
-        screen.blit(s, (self.ancho - 420, 50))
-        
-        # Dibujar título
-        screen.draw.text(
-            "Visualización del Árbol AVL",
-            (self.ancho - 410, 60),
-            fontsize=14,
-            color="white"
-        )
-        
-        # Actualizar el árbol con los obstáculos visibles actuales
-        self.visualizador_arbol.recorrido_actual = self.gestor_juego.obstaculos_visibles
-        
-        # Dibujar el árbol
-        self.visualizador_arbol.dibujar_arbol(
-            screen, 
-            self.gestor_juego.arbol_obstaculos,
-            x_offset=self.ancho - 420, 
-            y_offset=50
-        )
-        
+
+        for _, _, dibujar, argumentos in self._elementos_arbol():
+            dibujar(screen, *argumentos)
+
+    def _elementos_arbol(self):
+        """
+        Describe el panel del árbol como elementos del compositor: fondo con título,
+        capa del árbol y textos de información.
+
+        Returns:
+            List[Elemento]: Tuplas (rect, firma, dibujar, argumentos)
+        """
+        x_panel, y_panel = self.ancho - 420, 50
+        panel = pygame.Rect(x_panel, y_panel, 400, 400)
+        arbol = self.gestor_juego.arbol_obstaculos
+
+        # Resaltar los obstáculos visibles actuales
+        self.visualizador_arbol.seguir_ventana(self.gestor_juego.ventana_visible)
+
+        # La capa del árbol solo se vuelve a copiar cuando el visualizador la cambia
+        elementos = [
+            (panel, "panel", self._dibujar_fondo_arbol, ()),
+            (
+                panel,
+                self.visualizador_arbol.version_dibujo(arbol),
+                self.visualizador_arbol.dibujar_arbol,
+                (arbol, x_panel, y_panel),
+            ),
+        ]
+
         # Información adicional
-        total_nodos = self.gestor_juego.arbol_obstaculos.obtener_total_obstaculos()
+        total_nodos = arbol.obtener_total_obstaculos()
         obstaculos_visibles = len(self.gestor_juego.obstaculos_visibles)
-        screen.draw.text(
-            f"Total de obstáculos: {total_nodos}",
-            (self.ancho - 410, 430),
-            fontsize=12,
-            color="white"
+        elementos.append(
+            self._elemento_texto(f"Total de obstáculos: {total_nodos}", (self.ancho - 410, 430), 12, "white")
         )
-        screen.draw.text(
+        elementos.append(self._elemento_texto(
             f"Obstáculos visibles: {obstaculos_visibles}",
             (self.ancho - 410, 450),
-            fontsize=12,
-            color="yellow" if obstaculos_visibles > 0 else "white"
-        )
-        
+            12,
+            "yellow" if obstaculos_visibles > 0 else "white",
+        ))
+
         # Posición del carrito
         if self.gestor_juego.carrito:
-            screen.draw.text(
-                f"Posición del carrito: {self.gestor_juego.carrito.x}",
-                (self.ancho - 410, 470),
-                fontsize=12,
-                color="cyan"
-            )
+            elementos.append(self._elemento_texto(
+                f"Posición del carrito: {self.gestor_juego.carrito.x}", (self.ancho - 410, 470), 12, "cyan"
+            ))
+        return elementos
+
+    def _dibujar_fondo_arbol(self, screen):
+        """
+        Dibuja el fondo semitransparente y el título del panel del árbol.
+
+        Args:
+            screen: Superficie de pygame donde dibujar
+        """
+        # La superficie se crea una sola vez
+        if self._fondo_arbol is None:
+            self._fondo_arbol = pygame.Surface((400, 400), pygame.SRCALPHA)
+            self._fondo_arbol.fill((0, 0, 0, 180))  # Fondo negro semitransparente
+        screen.blit(self._fondo_arbol, (self.ancho - 420, 50))
+        self.cache_textos.dibujar(screen, "Visualización del Árbol AVL", (self.ancho - 410, 60), 14, "white")
 
     def manejar_evento(self, evento):
         """
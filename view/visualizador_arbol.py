@@ -1,11 +1,26 @@
 """
 Utilidad para visualizar gráficamente el árbol AVL.
 Responsabilidad: Renderizar la estructura del árbol de forma comprensible.
+
+El árbol se dibuja una sola vez en una capa transparente que se reutiliza mientras
+no cambie la versión del índice (su contador de modificaciones). Cuando solo cambian
+los nodos resaltados se redibujan únicamente esos nodos sobre la capa.
+
+Para árboles grandes la disposición solo recorre lo que se ve: los subárboles cuya
+franja queda fuera del panel se descartan enteros y los que ya no caben a lo ancho se
+colapsan en un glifo con su cantidad de nodos y su altura (nivel de detalle). Acercar,
+alejar y mover la vista recalculan solo esa parte visible. Altura, tamaño y factor de
+balance solo se muestran si los nodos los guardan (AVL): en los motores que los
+calculan recorriendo el subárbol (rojo-negro, treap) se omiten.
 """
 
 import pygame
 import math
-from typing import Optional, List, Tuple
+from typing import Optional, List, Set, Tuple
+from pgzero.screen import Screen
+from logic.registro import obtener_registro
+
+_registro = obtener_registro("vista")
 
 
 class VisualizadorArbol:
@@ -32,12 +47,50 @@ class VisualizadorArbol:
         self.color_conexion = (50, 50, 50)
         self.color_texto = (255, 255, 255)
         self.color_recorrido = (255, 255, 0)
+        self.color_agregado = (90, 90, 140)
+
+        # Vista: zoom horizontal, desplazamiento en píxeles y nivel de detalle
+        self.zoom = 1.0
+        self.zoom_maximo = 64.0
+        self.desplazamiento_x = 0
+        self.desplazamiento_y = 0
+        # Ancho mínimo por nodo antes de colapsar un subárbol: con el panel por defecto
+        # (300 px útiles) se ven 5 niveles completos, los del recorrido de 30 obstáculos
+        self.separacion_minima = 18
 
         # Estado del visualizador
         self.nodo_seleccionado = None
         self.recorrido_actual = []
         self.paso_recorrido_actual = 0
         self.animando_recorrido = False
+        self.intervalo_paso = 0.2  # Segundos entre pasos de la animación
+        self._tiempo_paso = 0.0
+
+        # Nodos resaltados, por clave (x, y): los pasos ya mostrados del recorrido o,
+        # fuera de una animación, las claves de la ventana de visión que se sigue
+        self._claves_recorrido: Set[Tuple[float, float]] = set()
+        self._version_recorrido = 0
+        self._ventana = None
+
+        # Cachés por versión del árbol y vista: disposición visible y capa ya dibujada
+        self._arbol_disposicion = None
+        self._clave_disposicion = None
+        self._posiciones = {}
+        self._disposicion = []  # (nodo, clave, x, y, agregado) en preorden
+        self._conexiones = []  # (posición del padre, posición del hijo)
+        self._indice_disposicion = {}  # Clave (x, y) -> índice en _disposicion
+        self._agregados = []  # Índices de los subárboles colapsados en _disposicion
+        self._celdas = {}  # Celda (x // lado, y // lado) -> índices en _disposicion, para los clics
+        self._disposicion_capa = None
+        self._capa: Optional[pygame.Surface] = None
+        self._origen_capa = (0, 0)
+        self._fuente_dibujada = None
+        self._resaltados_dibujados: Set[Tuple[float, float]] = set()
+        self._seleccion_dibujada = None
+        self._mascara_nodo: Optional[pygame.Surface] = None
+        self.capas_dibujadas = 0
+        self.nodos_redibujados = 0
+        self.version_capa = 0  # Sube cada vez que la capa se dibuja o se retoca
 
     def dibujar_arbol(self, screen, arbol_avl, x_offset=0, y_offset=0):
         """
@@ -59,14 +112,145 @@ class VisualizadorArbol:
             )
             return
 
-        # Calcular posiciones de todos los nodos
-        posiciones = self.calcular_posiciones_nodos(arbol_avl)
-        
-        # Dibujar conexiones primero (para que queden detrás de los nodos)
-        self._dibujar_conexiones(screen, arbol_avl.raiz, posiciones, x_offset, y_offset)
-        
-        # Dibujar nodos
-        self._dibujar_nodos(screen, arbol_avl.raiz, posiciones, x_offset, y_offset)
+        capa, (x_capa, y_capa) = self._obtener_capa(arbol_avl)
+        screen.blit(capa, (x_offset + x_capa, y_offset + y_capa))
+
+    def _obtener_capa(self, arbol_avl):
+        """
+        Obtiene la capa con el árbol dibujado. Se dibuja entera solo si cambió la
+        disposición (versión del árbol o vista); si solo cambiaron los resaltados se
+        redibujan esos nodos.
+
+        Args:
+            arbol_avl: Árbol AVL a visualizar (no vacío)
+
+        Returns:
+            Tuple[pygame.Surface, Tuple[int, int]]: Capa recortada y su posición relativa
+        """
+        resaltados, fuente = self._resaltado_vigente()
+        disposicion = self._obtener_disposicion(arbol_avl)
+        if self._capa is None or self._disposicion_capa is not disposicion:
+            self._dibujar_capa(disposicion, resaltados)
+        elif fuente != self._fuente_dibujada or self.nodo_seleccionado != self._seleccion_dibujada:
+            self._redibujar_cambios(disposicion, resaltados)
+        else:
+            return self._capa, self._origen_capa
+
+        self.version_capa += 1
+        self._fuente_dibujada = fuente
+        self._resaltados_dibujados = set(resaltados)
+        self._seleccion_dibujada = self.nodo_seleccionado
+        return self._capa, self._origen_capa
+
+    def version_dibujo(self, arbol_avl):
+        """
+        Pone al día la capa del árbol y obtiene un valor que cambia cada vez que cambia
+        lo que dibujaría dibujar_arbol, para saber si hay que volver a copiarla.
+
+        Args:
+            arbol_avl: Árbol AVL a visualizar
+
+        Returns:
+            Optional[int]: Versión de la capa, o None si el árbol está vacío
+        """
+        if arbol_avl.raiz is None:
+            return None
+        self._obtener_capa(arbol_avl)
+        return self.version_capa
+
+    def _resaltado_vigente(self):
+        """
+        Obtiene el conjunto de claves resaltadas y un identificador de su contenido
+        que cambia cada vez que el conjunto cambia.
+
+        Returns:
+            Tuple[Set[Tuple[float, float]], object]: Claves resaltadas e identificador
+        """
+        if self.recorrido_actual and (self.animando_recorrido or self._ventana is None):
+            return self._claves_recorrido, ("recorrido", self._version_recorrido)
+        if self._ventana is not None:
+            return self._ventana.claves, (self._ventana, self._ventana.version)
+        return self._claves_recorrido, ("recorrido", self._version_recorrido)
+
+    def _dibujar_capa(self, disposicion, resaltados):
+        """
+        Dibuja la parte visible del árbol en una capa nueva del tamaño del panel,
+        recortada a la zona con contenido.
+
+        Args:
+            disposicion (List[Tuple]): Nodos de _obtener_disposicion
+            resaltados (Set[Tuple[float, float]]): Claves de los nodos resaltados
+        """
+        superficie = pygame.Surface((self.ancho, self.alto), pygame.SRCALPHA)
+        self._dibujar_disposicion(Screen(superficie), disposicion, resaltados, 0, 0, conexiones=self._conexiones)
+
+        # Recortar a la zona con contenido para que el blit de cada frame sea mínimo
+        area = superficie.get_bounding_rect()
+        self._capa = superficie.subsurface(area).copy()
+        self._origen_capa = area.topleft
+        self._disposicion_capa = disposicion
+        self.capas_dibujadas += 1
+
+    def _redibujar_cambios(self, disposicion, resaltados):
+        """
+        Redibuja sobre la capa solo los nodos cuyo resaltado o selección cambió.
+        El círculo relleno de un nodo tapa todo lo dibujado antes que él, así que basta
+        con dibujar ese nodo y los posteriores que lo tocan en un parche, y copiar a la
+        capa solo los píxeles del círculo.
+
+        Args:
+            disposicion (List[Tuple]): Nodos de _obtener_disposicion ya dibujados en la capa
+            resaltados (Set[Tuple[float, float]]): Claves de los nodos resaltados
+        """
+        cambiadas = self._resaltados_dibujados ^ resaltados
+        if self.nodo_seleccionado != self._seleccion_dibujada:
+            for nodo in (self._seleccion_dibujada, self.nodo_seleccionado):
+                if nodo is not None:
+                    cambiadas.add((nodo.obstaculo.x, nodo.obstaculo.y))
+
+        indices = set()
+        for clave in cambiadas:
+            indice = self._indice_disposicion.get(clave)
+            if indice is None:
+                indice = self._agregado_de_clave(clave)
+            if indice is not None:  # None: no está en el árbol o no se ve
+                indices.add(indice)
+
+        radio = self.radio_nodo
+        lado = 2 * radio + 1
+        if self._mascara_nodo is None:
+            self._mascara_nodo = pygame.Surface((lado, lado), pygame.SRCALPHA)
+            self._mascara_nodo.fill((255, 255, 255, 0))
+            pygame.draw.circle(self._mascara_nodo, (255, 255, 255, 255), (radio, radio), radio)
+        parche = pygame.Surface((lado, lado), pygame.SRCALPHA)
+        lienzo = Screen(parche)
+        x_capa, y_capa = self._origen_capa
+
+        for indice in indices:
+            _, _, x, y, _ = disposicion[indice]
+            zona = pygame.Rect(x - radio, y - radio, lado, lado)
+            parche.fill((0, 0, 0, 0))
+            self._dibujar_disposicion(lienzo, disposicion[indice:], resaltados, -zona.x, -zona.y, zona)
+            # Fuera del círculo el parche queda transparente y no altera la capa
+            parche.blit(self._mascara_nodo, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
+            self._capa.blit(parche, (zona.x - x_capa, zona.y - y_capa))
+            self.nodos_redibujados += 1
+
+    def _agregado_de_clave(self, clave):
+        """
+        Busca el subárbol colapsado visible que contiene una clave.
+
+        Args:
+            clave (Tuple[float, float]): Clave (x, y) buscada
+
+        Returns:
+            Optional[int]: Índice del glifo en la disposición, None si ninguno la contiene
+        """
+        for indice in self._agregados:
+            _, _, minima, maxima = self._disposicion[indice][4]
+            if minima <= clave <= maxima:
+                return indice
+        return None
 
     def _dibujar_nodo_recursivo(self, screen, nodo, x, y, nivel, x_offset, y_offset):
         """
@@ -107,6 +291,35 @@ class VisualizadorArbol:
         # Dibujar texto del nodo
         self.dibujar_texto_nodo(screen, nodo, x, y)
 
+    def dibujar_agregado(self, screen, cantidad, altura, x, y, seleccionado=False, en_recorrido=False):
+        """
+        Dibuja un subárbol colapsado por nivel de detalle: un nodo con doble borde que
+        muestra cuántos nodos contiene y su altura.
+
+        Args:
+            screen: Superficie donde dibujar
+            cantidad (Optional[int]): Nodos del subárbol (None si el nodo no lo guarda)
+            altura (Optional[int]): Altura del subárbol (None si el nodo no la guarda)
+            x, y (int): Posición de la raíz del subárbol
+            seleccionado (bool): Si la raíz del subárbol está seleccionada
+            en_recorrido (bool): Si algún nodo del subárbol está resaltado
+        """
+        if seleccionado:
+            color = self.color_nodo_seleccionado
+        elif en_recorrido:
+            color = self.color_recorrido
+        else:
+            color = self.color_agregado
+
+        screen.draw.filled_circle((x, y), self.radio_nodo, color)
+        screen.draw.circle((x, y), self.radio_nodo, (255, 255, 255))
+        screen.draw.circle((x, y), self.radio_nodo - 3, (255, 255, 255))
+        if cantidad is None:
+            screen.draw.text("+", (x - 4, y - 8), fontsize=16, color=self.color_texto)
+            return
+        screen.draw.text(f"+{cantidad}", (x - 15, y - 10), fontsize=12, color=self.color_texto)
+        screen.draw.text(f"h:{altura}", (x - 12, y + 3), fontsize=10, color=self.color_texto)
+
     def dibujar_conexion(self, screen, x1, y1, x2, y2):
         """
         Dibuja una línea de conexión entre dos nodos.
@@ -139,7 +352,9 @@ class VisualizadorArbol:
             color=self.color_texto
         )
         
-        # Dibujar factor de balance
+        # Dibujar factor de balance, solo si el nodo guarda la altura de sus hijos
+        if not hasattr(nodo, "tamaño"):
+            return
         factor_balance = nodo.obtener_factor_balance()
         color_balance = (255, 255, 255)  # Blanco por defecto
         
@@ -160,112 +375,202 @@ class VisualizadorArbol:
 
     def calcular_posiciones_nodos(self, arbol_avl):
         """
-        Calcula las posiciones de todos los nodos para el dibujo.
+        Calcula las posiciones de los nodos que se ven en el panel con la vista actual.
+        Los subárboles colapsados aparecen por su raíz.
 
         Args:
             arbol_avl: Árbol AVL a analizar
 
         Returns:
-            dict: Diccionario con nodo como clave y (x, y) como valor
+            dict: Diccionario con nodo como clave y (x, y) como valor. Se guarda hasta
+                que cambien la versión del árbol o la vista, así que no debe modificarse
         """
-        posiciones = {}
-        if arbol_avl.raiz is None:
-            return posiciones
-        
-        # Calcular altura del árbol
-        altura = self._calcular_altura(arbol_avl.raiz)
-        
-        # Calcular posiciones recursivamente
-        self._calcular_posicion_recursiva(arbol_avl.raiz, 0, 0, posiciones, altura)
-        
-        return posiciones
-    
-    def _calcular_altura(self, nodo):
-        """Calcula la altura de un nodo."""
-        if nodo is None:
-            return 0
-        return 1 + max(self._calcular_altura(nodo.izquierdo), self._calcular_altura(nodo.derecho))
-    
-    def _calcular_posicion_recursiva(self, nodo, nivel, indice, posiciones, altura_total):
-        """Calcula recursivamente la posición de cada nodo."""
-        if nodo is None:
-            return
-        
-        # Usar un algoritmo más simple para posicionamiento
-        # Calcular posición X basada en el índice en el nivel
+        self._obtener_disposicion(arbol_avl)
+        return self._posiciones
+
+    def _obtener_disposicion(self, arbol_avl):
+        """
+        Obtiene los nodos visibles en preorden con su clave, su posición y, si están
+        colapsados, su resumen. Se calcula una sola vez por versión del árbol y vista.
+
+        Args:
+            arbol_avl: Árbol AVL a analizar
+
+        Returns:
+            List[Tuple]: Tuplas (nodo, clave, x, y, agregado); agregado es None o
+                (cantidad, altura, clave mínima, clave máxima) del subárbol colapsado
+        """
+        clave = (arbol_avl.version, self.zoom, self.desplazamiento_x, self.desplazamiento_y)
+        if self._arbol_disposicion is arbol_avl and self._clave_disposicion == clave:
+            return self._disposicion
+
+        self._posiciones = {}
+        self._disposicion = []
+        self._conexiones = []
+        self._agregados = []
+        if arbol_avl.raiz is not None:
+            ancho_nivel = int((self.ancho - 100) * self.zoom)  # Margen de 50 px a cada lado
+            self._calcular_posicion_recursiva(arbol_avl.raiz, 0, 0, None, ancho_nivel)
+
+        self._indice_disposicion = {
+            entrada[1]: i for i, entrada in enumerate(self._disposicion) if entrada[4] is None
+        }
+        # Rejilla de celdas del tamaño de un nodo: un clic solo mira su celda y las vecinas
+        lado = 2 * self.radio_nodo
+        self._celdas = {}
+        for i, (_, _, x, y, _) in enumerate(self._disposicion):
+            self._celdas.setdefault((x // lado, y // lado), []).append(i)
+        self._arbol_disposicion = arbol_avl
+        self._clave_disposicion = clave
+        return self._disposicion
+
+    def _calcular_posicion_recursiva(self, nodo, nivel, indice, padre, ancho_nivel):
+        """Calcula recursivamente la posición de cada nodo visible."""
+        # Calcular posición X basada en el índice en el nivel: cada nodo ocupa una franja
+        # de ancho_nivel / 2**nivel y sus descendientes se reparten dentro de ella
         nodos_en_nivel = 2 ** nivel
-        if nodos_en_nivel > 0:
-            ancho_nivel = self.ancho - 100  # Margen
-            x = 50 + (indice * ancho_nivel) // nodos_en_nivel + (ancho_nivel // nodos_en_nivel) // 2
-        else:
-            x = self.ancho // 2
-        
+        izquierda = 50 + (indice * ancho_nivel) // nodos_en_nivel - self.desplazamiento_x
+        derecha = 50 + ((indice + 1) * ancho_nivel) // nodos_en_nivel - self.desplazamiento_x
+        x = izquierda + (ancho_nivel // nodos_en_nivel) // 2
+
         # Calcular posición Y basada en el nivel
-        y = 50 + nivel * self.espaciado_nivel
-        
-        posiciones[nodo] = (x, y)
-        
-        # Calcular posiciones de los hijos
-        if nodo.izquierdo is not None:
-            self._calcular_posicion_recursiva(nodo.izquierdo, nivel + 1, indice * 2, posiciones, altura_total)
-        if nodo.derecho is not None:
-            self._calcular_posicion_recursiva(nodo.derecho, nivel + 1, indice * 2 + 1, posiciones, altura_total)
+        y = 50 + nivel * self.espaciado_nivel - self.desplazamiento_y
+
+        if padre is not None:
+            self._conexiones.append((padre, (x, y)))
 
-    def _dibujar_conexiones(self, screen, nodo, posiciones, x_offset, y_offset):
-        """Dibuja las conexiones entre nodos."""
-        if nodo is None:
+        # Descartar el subárbol si su franja o su nivel quedan fuera del panel
+        radio = self.radio_nodo
+        if derecha + 3 * radio < 0 or izquierda - radio > self.ancho or y - radio > self.alto:
             return
-        
-        nodo_x, nodo_y = posiciones[nodo]
-        
-        # Dibujar conexión al hijo izquierdo
+
+        obstaculo = nodo.obstaculo
+        clave = (obstaculo.x, obstaculo.y)
+        visible = y + radio >= 0 and x + 3 * radio >= 0 and x - radio <= self.ancho
+        tiene_hijos = nodo.izquierdo is not None or nodo.derecho is not None
+
+        if tiene_hijos and ancho_nivel // (2 * nodos_en_nivel) < self.separacion_minima:
+            # Los hijos no caben: el subárbol se resume en un solo glifo
+            if visible:
+                self._posiciones[nodo] = (x, y)
+                self._agregados.append(len(self._disposicion))
+                self._disposicion.append((nodo, clave, x, y, self._resumir_subarbol(nodo)))
+            return
+
+        if visible:
+            self._posiciones[nodo] = (x, y)
+            self._disposicion.append((nodo, clave, x, y, None))
+
+        # Calcular posiciones de los hijos
         if nodo.izquierdo is not None:
-            hijo_x, hijo_y = posiciones[nodo.izquierdo]
-            screen.draw.line(
-                (x_offset + nodo_x, y_offset + nodo_y),
-                (x_offset + hijo_x, y_offset + hijo_y),
-                self.color_conexion
-            )
-            self._dibujar_conexiones(screen, nodo.izquierdo, posiciones, x_offset, y_offset)
-        
-        # Dibujar conexión al hijo derecho
+            self._calcular_posicion_recursiva(nodo.izquierdo, nivel + 1, indice * 2, (x, y), ancho_nivel)
         if nodo.derecho is not None:
-            hijo_x, hijo_y = posiciones[nodo.derecho]
+            self._calcular_posicion_recursiva(nodo.derecho, nivel + 1, indice * 2 + 1, (x, y), ancho_nivel)
+
+    def _resumir_subarbol(self, nodo):
+        """
+        Resume un subárbol colapsado. Los nodos AVL guardan su tamaño y altura; en los
+        demás motores costaría recorrer el subárbol en cada disposición, así que el
+        resumen queda solo con su rango de claves.
+
+        Args:
+            nodo: Raíz del subárbol
+
+        Returns:
+            Tuple: (cantidad de nodos, altura, clave mínima, clave máxima); cantidad y
+                altura son None si el nodo no las guarda
+        """
+        cantidad = getattr(nodo, "tamaño", None)
+        altura = nodo.altura if cantidad is not None else None
+
+        minimo = nodo
+        while minimo.izquierdo is not None:
+            minimo = minimo.izquierdo
+        maximo = nodo
+        while maximo.derecho is not None:
+            maximo = maximo.derecho
+        return (
+            cantidad,
+            altura,
+            (minimo.obstaculo.x, minimo.obstaculo.y),
+            (maximo.obstaculo.x, maximo.obstaculo.y),
+        )
+
+    def _dibujar_disposicion(
+        self, screen, disposicion, resaltados, x_offset, y_offset, zona=None, conexiones=()
+    ):
+        """
+        Dibuja las conexiones y luego los nodos, en preorden.
+
+        Args:
+            screen: Superficie donde dibujar
+            disposicion (List[Tuple]): Nodos de _obtener_disposicion
+            resaltados (Set[Tuple[float, float]]): Claves de los nodos resaltados
+            x_offset, y_offset (int): Desplazamientos
+            zona (Optional[pygame.Rect]): Si se indica, solo los nodos que tocan esta zona
+            conexiones (List[Tuple]): Conexiones (padre, hijo) a dibujar debajo de los nodos
+        """
+        radio = self.radio_nodo
+
+        # Dibujar conexiones primero (para que queden detrás de los nodos)
+        for (padre_x, padre_y), (x, y) in conexiones:
             screen.draw.line(
-                (x_offset + nodo_x, y_offset + nodo_y),
-                (x_offset + hijo_x, y_offset + hijo_y),
+                (x_offset + padre_x, y_offset + padre_y),
+                (x_offset + x, y_offset + y),
                 self.color_conexion
             )
-            self._dibujar_conexiones(screen, nodo.derecho, posiciones, x_offset, y_offset)
-    
-    def _dibujar_nodos(self, screen, nodo, posiciones, x_offset, y_offset):
-        """Dibuja todos los nodos del árbol."""
-        if nodo is None:
-            return
-        
-        nodo_x, nodo_y = posiciones[nodo]
-        
-        # Determinar si el nodo está en el recorrido actual
-        # Comparar por coordenadas del obstáculo
-        en_recorrido = False
-        if self.recorrido_actual:
-            for obstaculo in self.recorrido_actual:
-                if (nodo.obstaculo.x == obstaculo.x and nodo.obstaculo.y == obstaculo.y):
-                    en_recorrido = True
-                    break
-        
-        seleccionado = nodo == self.nodo_seleccionado
-        
-        # Dibujar el nodo
-        self.dibujar_nodo(screen, nodo, x_offset + nodo_x, y_offset + nodo_y, seleccionado, en_recorrido)
-        
-        # Dibujar nodos hijos recursivamente
-        self._dibujar_nodos(screen, nodo.izquierdo, posiciones, x_offset, y_offset)
-        self._dibujar_nodos(screen, nodo.derecho, posiciones, x_offset, y_offset)
+
+        # Dibujar nodos (el rectángulo cubre el círculo y el texto, que sobresale a la derecha)
+        for nodo, clave, x, y, agregado in disposicion:
+            if zona is not None and not zona.colliderect(x - radio, y - radio, 4 * radio, 2 * radio + 1):
+                continue
+            seleccionado = nodo == self.nodo_seleccionado
+            if agregado is None:
+                self.dibujar_nodo(screen, nodo, x_offset + x, y_offset + y, seleccionado, clave in resaltados)
+            else:
+                cantidad, altura, minima, maxima = agregado
+                en_recorrido = any(minima <= resaltada <= maxima for resaltada in resaltados)
+                self.dibujar_agregado(
+                    screen, cantidad, altura, x_offset + x, y_offset + y, seleccionado, en_recorrido
+                )
+
+    def cambiar_zoom(self, factor, x=None):
+        """
+        Acerca (factor > 1) o aleja (factor < 1) la vista a lo ancho: los niveles
+        profundos ganan espacio y dejan de colapsarse. La columna x del panel queda fija.
+
+        Args:
+            factor (float): Factor de zoom a aplicar
+            x (Optional[int]): Columna del panel que no se mueve (por defecto, el centro)
+        """
+        x = self.ancho // 2 if x is None else x
+        zoom = min(max(self.zoom * factor, 1.0), self.zoom_maximo)
+        # Punto del árbol bajo la columna x, medido desde el margen izquierdo
+        punto = (x - 50 + self.desplazamiento_x) / self.zoom
+        self.desplazamiento_x = round(punto * zoom) - (x - 50)
+        self.zoom = zoom
+
+    def desplazar_vista(self, dx, dy):
+        """
+        Mueve la vista del árbol.
+
+        Args:
+            dx (int): Píxeles hacia la derecha
+            dy (int): Píxeles hacia abajo (hacia los niveles profundos)
+        """
+        self.desplazamiento_x += dx
+        self.desplazamiento_y = max(0, self.desplazamiento_y + dy)
+
+    def restablecer_vista(self):
+        """Vuelve al zoom inicial con el árbol completo a la vista."""
+        self.zoom = 1.0
+        self.desplazamiento_x = 0
+        self.desplazamiento_y = 0
 
     def obtener_nodo_en_posicion(self, arbol_avl, x, y):
         """
-        Obtiene el nodo que está en la posición especificada.
+        Obtiene el nodo que está en la posición especificada. Usa la rejilla de la
+        disposición en caché, así que solo compara con los nodos de las celdas vecinas.
 
         Args:
             arbol_avl: Árbol donde buscar
@@ -274,18 +579,24 @@ class VisualizadorArbol:
         Returns:
             Optional: Nodo en esa posición o None
         """
-        if arbol_avl.raiz is None:
-            return None
-        
-        posiciones = self.calcular_posiciones_nodos(arbol_avl)
-        
-        # Buscar el nodo más cercano al punto
-        for nodo, (nodo_x, nodo_y) in posiciones.items():
-            distancia = ((x - nodo_x) ** 2 + (y - nodo_y) ** 2) ** 0.5
-            if distancia <= self.radio_nodo:
-                return nodo
-        
-        return None
+        disposicion = self._obtener_disposicion(arbol_avl)
+        radio = self.radio_nodo
+        lado = 2 * radio
+        columna, fila = x // lado, y // lado
+
+        # Si dos nodos se solapan gana el primero en preorden
+        encontrado = None
+        for celda_x in (columna - 1, columna, columna + 1):
+            for celda_y in (fila - 1, fila, fila + 1):
+                for i in self._celdas.get((celda_x, celda_y), ()):
+                    if encontrado is not None and i > encontrado:
+                        break
+                    _, _, nodo_x, nodo_y, _ = disposicion[i]
+                    if (x - nodo_x) ** 2 + (y - nodo_y) ** 2 <= radio * radio:
+                        encontrado = i
+                        break
+
+        return disposicion[encontrado][0] if encontrado is not None else None
 
     def iniciar_animacion_recorrido(self, recorrido):
         """
@@ -294,10 +605,13 @@ class VisualizadorArbol:
         Args:
             recorrido (List): Lista de obstáculos en orden de recorrido
         """
-        print(f"Iniciando animación con {len(recorrido)} obstáculos")
+        _registro.depurar("Iniciando animación con %d obstáculos", len(recorrido))
         self.recorrido_actual = recorrido
         self.paso_recorrido_actual = 0
-        self.animando_recorrido = True
+        self.animando_recorrido = bool(recorrido)
+        self._tiempo_paso = 0.0
+        self._claves_recorrido = {(recorrido[0].x, recorrido[0].y)} if recorrido else set()
+        self._version_recorrido += 1
 
     def iniciar_recorrido_anchura(self, arbol_avl):
         """
@@ -307,7 +621,7 @@ class VisualizadorArbol:
             arbol_avl: Árbol AVL a recorrer
         """
         recorrido = arbol_avl.recorrido_en_anchura()
-        print(f"Iniciando recorrido en anchura con {len(recorrido)} nodos")
+        _registro.depurar("Iniciando recorrido en anchura con %d nodos", len(recorrido))
         self.iniciar_animacion_recorrido(recorrido)
         
     def iniciar_recorrido_profundidad(self, arbol_avl):
@@ -318,7 +632,7 @@ class VisualizadorArbol:
             arbol_avl: Árbol AVL a recorrer
         """
         recorrido = arbol_avl.recorrido_en_profundidad()
-        print(f"Iniciando recorrido en profundidad con {len(recorrido)} nodos")
+        _registro.depurar("Iniciando recorrido en profundidad con %d nodos", len(recorrido))
         self.iniciar_animacion_recorrido(recorrido)
 
     def actualizar_animacion_recorrido(self):
@@ -338,9 +652,48 @@ class VisualizadorArbol:
         if self.paso_recorrido_actual >= len(self.recorrido_actual):
             self.animando_recorrido = False
             return False
-            
+
+        # Solo se agrega el nodo del paso nuevo
+        obstaculo = self.recorrido_actual[self.paso_recorrido_actual]
+        self._claves_recorrido.add((obstaculo.x, obstaculo.y))
+        self._version_recorrido += 1
         return True
 
+    def avanzar_animacion(self, delta_tiempo):
+        """
+        Avanza la animación del recorrido un paso cada intervalo_paso segundos.
+
+        Args:
+            delta_tiempo (float): Tiempo transcurrido desde la última llamada
+        """
+        if not self.animando_recorrido:
+            return
+        self._tiempo_paso += delta_tiempo
+        while self._tiempo_paso >= self.intervalo_paso and self.actualizar_animacion_recorrido():
+            self._tiempo_paso -= self.intervalo_paso
+
+    def obtener_paso_actual(self):
+        """
+        Obtiene el obstáculo del paso que la animación está mostrando.
+
+        Returns:
+            Optional: Obstáculo del paso actual, None si no hay animación en curso
+        """
+        if not self.animando_recorrido:
+            return None
+        return self.recorrido_actual[self.paso_recorrido_actual]
+
+    def seguir_ventana(self, ventana):
+        """
+        Resalta las claves visibles de una ventana de visión cuando no hay una
+        animación de recorrido en curso. La ventana mantiene su conjunto de claves
+        de forma incremental, así que no hay que copiarlo en cada frame.
+
+        Args:
+            ventana: VentanaVisible a seguir (None para dejar de seguirla)
+        """
+        self._ventana = ventana
+
     def dibujar_informacion_nodo(self, screen, nodo, x, y):
         """
         Dibuja información adicional sobre un nodo (altura, balance).
@@ -378,6 +731,8 @@ class VisualizadorArbol:
         self.nodo_seleccionado = None
         self.recorrido_actual = []
         self.animando_recorrido = False
+        self._claves_recorrido = set()
+        self._version_recorrido += 1
 
     def obtener_dimensiones_arbol(self, arbol_avl):
         """